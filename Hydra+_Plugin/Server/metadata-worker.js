@@ -37,6 +37,7 @@ app.use(express.json());
 
 // Spotify credentials storage
 let spotifyCredentials = null;
+let pendingJobs = 0; // Background tagging jobs still running (reported to Python for flow control)
 let renamePattern = {
   singleTrack: '{artist} - {track}',  // Default for single downloads
   albumTrack: '{trackNum} {artist} - {track}'  // Default for album downloads
@@ -733,215 +734,300 @@ app.post('/set-rename-pattern', (req, res) => {
 });
 
 /**
- * Process single track metadata
- * This is the main endpoint that does all the heavy processing
+ * Rename a track and move it into its target folder
+ * Returns the result for the Python plugin plus the background job
+ * (Spotify lookup, cover art, tags) that should run once the response is sent
  */
-app.post('/process-metadata', async (req, res) => {
+async function prepareTrack(params) {
   const startTime = Date.now();
 
-  try {
-    const {
-      filePath,
-      artist,
-      track,
-      album,
-      trackId,
-      trackNumber,
-      headNumber = 1,
-      headScore = 0,
-      prefetchedYear,
-      prefetchedImageUrl,
-      targetFolder,
-      shouldFetchSpotify = true,
-      shouldDownloadCoverArt = true,
-      shouldWriteTags = true,
-      shouldRename = true
-    } = req.body;
-
-    if (!filePath || !fsSync.existsSync(filePath)) {
-      return res.status(400).json({ error: 'Invalid file path' });
+  const {
+    filePath,
+    artist,
+    track,
+    album,
+    trackId,
+    trackNumber,
+    headNumber = 1,
+    headScore = 0,
+    prefetchedYear,
+    prefetchedImageUrl,
+    targetFolder,
+    shouldFetchSpotify = true,
+    shouldDownloadCoverArt = true,
+    shouldWriteTags = true,
+    shouldRename = true
+  } = params;
+
+  if (!filePath || !fsSync.existsSync(filePath)) {
+    return { error: 'Invalid file path' };
+  }
+
+  // Result object to return to Python plugin
+  const result = {
+    success: true,
+    original_path: filePath,
+    new_path: filePath,
+    renamed: false,
+    moved_to_folder: false,
+    tags_updated: false,
+    cover_embedded: false,
+    year: null,
+    track_number: trackNumber || null,
+    genre: null,
+    label: null
+  };
+
+  // Format artist - track for display
+  const trackDisplay = `${artist} - ${track}`;
+
+  log(`░░ HEAD${headNumber} INITIALIZED ~~~~~~~~~~~/\\~~~~~~~^~~~~~~~^~~~~~~<:===<`);
+  log(`░░░░░ HEAD${headNumber} HUNTING ____ Search Started: ${trackDisplay}`);
+
+  // Check if file format is supported
+  const ext = path.extname(filePath).toLowerCase();
+  const isMP3 = ext === '.mp3';
+  const isFLAC = ext === '.flac';
+
+  if (!isMP3 && !isFLAC) {
+    return { error: `Unsupported format: ${ext} (only MP3/FLAC supported)` };
+  }
+
+  // ========================================================================
+  // STEP 1: RENAME FILE FIRST (before any network operations that could timeout)
+  // ========================================================================
+  let currentFilePath = filePath;
+  if (shouldRename && artist && track) {
+    const newPath = await renameFile(currentFilePath, artist, track, trackNumber, album, prefetchedYear);
+    if (newPath !== currentFilePath) {
+      currentFilePath = newPath;
+      result.new_path = newPath;
+      result.renamed = true;
     }
+  }
 
-    // Result object to return to Python plugin
-    const result = {
-      success: true,
-      original_path: filePath,
-      new_path: filePath,
-      renamed: false,
-      moved_to_folder: false,
-      tags_updated: false,
-      cover_embedded: false,
-      year: null,
-      track_number: trackNumber || null,
-      genre: null,
-      label: null
-    };
+  // ========================================================================
+  // STEP 2: MOVE TO TARGET FOLDER if specified (for album downloads)
+  // CRITICAL: Move immediately after rename to prevent orphaned files on crash
+  // ========================================================================
+  if (targetFolder) {
+    try {
+      if (!fsSync.existsSync(targetFolder)) {
+        throw new Error(`Target folder does not exist: ${targetFolder}`);
+      }
 
-    // Format artist - track for display
-    const trackDisplay = `${artist} - ${track}`;
+      const fileName = path.basename(currentFilePath);
+      const targetPath = path.join(targetFolder, fileName);
+
+      // Only move if not already in target folder
+      if (targetPath !== currentFilePath) {
+        // Handle duplicates
+        let finalPath = targetPath;
+        let counter = 1;
+        while (fsSync.existsSync(finalPath) && finalPath !== currentFilePath) {
+          const ext = path.extname(fileName);
+          const base = path.basename(fileName, ext);
+          finalPath = path.join(targetFolder, `${base} (${counter})${ext}`);
+          counter++;
+        }
+
+        await fs.rename(currentFilePath, finalPath);
+        log(`✓ Moved to album folder: ${path.basename(targetFolder)}`);
+        currentFilePath = finalPath;
+        result.new_path = finalPath;
+        result.moved_to_folder = true;
+      } else {
+        log(`Already in target folder`);
+        result.moved_to_folder = true;
+      }
+    } catch (moveError) {
+      log(`⚠ Failed to move to folder: ${moveError.message}`);
+      // Don't fail the whole operation if move fails - file is still renamed
+      result.moved_to_folder = false;
+    }
+  }
 
-    log(`░░ HEAD${headNumber} INITIALIZED ~~~~~~~~~~~/\\~~~~~~~^~~~~~~~^~~~~~~<:===<`);
-    log(`░░░░░ HEAD${headNumber} HUNTING ____ Search Started: ${trackDisplay}`);
+  // ========================================================================
+  // Metadata processing that runs in background (after the response is sent)
+  // CRITICAL: All code in this job must be wrapped in try-catch to prevent server crashes
+  // ========================================================================
+  const job = async () => {
+    log(`░░░░░▒▒▒▒▒ HEAD${headNumber} FIRST BITE ____ Download Started: ${trackDisplay} (${headScore})`);
+
+    // Step 3: Fetch extended metadata from Spotify
+    // IMPROVED: Use prefetched metadata if available (skip Spotify page fetch)
+    let spotifyMetadata = null;
+
+    if (prefetchedYear || prefetchedImageUrl) {
+      // Use prefetched metadata from Python cache
+      spotifyMetadata = {
+        year: prefetchedYear || null,
+        imageUrl: prefetchedImageUrl || null,
+        genre: null,
+        label: null
+      };
+    } else if (shouldFetchSpotify && artist && track) {
+      // Fallback: Fetch from Spotify (for single tracks or cache miss)
+      try {
+        log(`░░░░░▒▒▒▒▒ HEAD${headNumber} SECOND BITE ____ Download: ${trackDisplay} (${headScore})`);
+        spotifyMetadata = await getSpotifyMetadata(artist, track);
+      } catch (spotifyError) {
+        log(`✗ Spotify metadata error: ${spotifyError.message}`);
+        spotifyMetadata = {};
+      }
+    }
 
-    // Check if file format is supported
-    const ext = path.extname(filePath).toLowerCase();
-    const isMP3 = ext === '.mp3';
-    const isFLAC = ext === '.flac';
+    // Step 4: Download cover art
+    let coverArtPath = null;
+    if (shouldDownloadCoverArt && spotifyMetadata && spotifyMetadata.imageUrl) {
+      const coverArtFilename = `cover_${Date.now()}.jpg`;
+      coverArtPath = path.join(path.dirname(currentFilePath), coverArtFilename);
 
-    if (!isMP3 && !isFLAC) {
-      return res.status(400).json({ error: `Unsupported format: ${ext} (only MP3/FLAC supported)` });
+      try {
+        await downloadCoverArt(spotifyMetadata.imageUrl, coverArtPath);
+        log(`░░░░░▒▒▒▒▒▓▓▓▓▓ HEAD${headNumber} COMPLETE ____ ${trackDisplay}`);
+      } catch (error) {
+        log(`✗ Cover art download failed: ${error.message}`);
+        coverArtPath = null;
+      }
     }
 
-    // ========================================================================
-    // STEP 1: RENAME FILE FIRST (before any network operations that could timeout)
-    // ========================================================================
-    let currentFilePath = filePath;
-    if (shouldRename && artist && track) {
-      const newPath = await renameFile(currentFilePath, artist, track, trackNumber, album, prefetchedYear);
-      if (newPath !== currentFilePath) {
-        currentFilePath = newPath;
-        result.new_path = newPath;
-        result.renamed = true;
+    // Step 5: Write ID3 tags
+    if (shouldWriteTags) {
+      const tagMetadata = {
+        artist,
+        track,
+        album,
+        year: spotifyMetadata?.year,
+        genre: spotifyMetadata?.genre,
+        label: spotifyMetadata?.label,
+        trackNumber: trackNumber,
+        coverArtPath
+      };
+
+      let tagsWritten = false;
+      if (isMP3) {
+        tagsWritten = await writeId3Tags(currentFilePath, tagMetadata);
+      } else if (isFLAC) {
+        tagsWritten = await writeFlacTags(currentFilePath, tagMetadata);
+      }
+
+      if (tagsWritten) {
+        log(`▓ Tags embedded`);
       }
     }
 
-    // ========================================================================
-    // STEP 2: MOVE TO TARGET FOLDER if specified (for album downloads)
-    // CRITICAL: Move immediately after rename to prevent orphaned files on crash
-    // ========================================================================
-    if (targetFolder) {
+    // Clean up temporary cover art
+    if (coverArtPath && fsSync.existsSync(coverArtPath)) {
       try {
-        if (!fsSync.existsSync(targetFolder)) {
-          throw new Error(`Target folder does not exist: ${targetFolder}`);
-        }
+        await fs.unlink(coverArtPath);
+      } catch {}
+    }
 
-        const fileName = path.basename(currentFilePath);
-        const targetPath = path.join(targetFolder, fileName);
-
-        // Only move if not already in target folder
-        if (targetPath !== currentFilePath) {
-          // Handle duplicates
-          let finalPath = targetPath;
-          let counter = 1;
-          while (fsSync.existsSync(finalPath) && finalPath !== currentFilePath) {
-            const ext = path.extname(fileName);
-            const base = path.basename(fileName, ext);
-            finalPath = path.join(targetFolder, `${base} (${counter})${ext}`);
-            counter++;
-          }
+    const duration = Date.now() - startTime;
+    log(`▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD${headNumber} FINISHED  ____ ${trackDisplay}        ^~~~~~~<:===<`);
+  };
 
-          await fs.rename(currentFilePath, finalPath);
-          log(`✓ Moved to album folder: ${path.basename(targetFolder)}`);
-          currentFilePath = finalPath;
-          result.new_path = finalPath;
-          result.moved_to_folder = true;
-        } else {
-          log(`Already in target folder`);
-          result.moved_to_folder = true;
-        }
-      } catch (moveError) {
-        log(`⚠ Failed to move to folder: ${moveError.message}`);
-        // Don't fail the whole operation if move fails - file is still renamed
-        result.moved_to_folder = false;
+  return { result, job };
+}
+
+/**
+ * Run background jobs one after another (after the response has been sent)
+ * pendingJobs covers every job until it finishes, so responses can report the backlog
+ */
+function runBackgroundJobs(jobs) {
+  pendingJobs += jobs.length;
+
+  setTimeout(async () => {
+    for (const job of jobs) {
+      try {
+        await job();
+      } catch (backgroundError) {
+        log(`✗ Background processing error: ${backgroundError.message}`);
+        // Don't crash the server - just log the error
+      } finally {
+        pendingJobs--;
       }
     }
+  }, 500); // 500ms delay to prevent concurrent job pile-up
+}
+
+/**
+ * Process single track metadata
+ * This is the main endpoint that does all the heavy processing
+ */
+app.post('/process-metadata', async (req, res) => {
+  try {
+    const { result, job, error } = await prepareTrack(req.body);
+
+    if (error) {
+      return res.status(400).json({ error });
+    }
 
     // ========================================================================
     // CRITICAL FIX: Always send success response immediately after renaming/moving
     // This prevents Python plugin timeout issues, especially for album batches
+    // pending_jobs lets the plugin back off only when background work is piling up
     // ========================================================================
+    result.pending_jobs = pendingJobs + 1;
     res.json(result);
 
-    // ========================================================================
     // Continue with metadata processing in background (don't block response)
-    // This runs asynchronously and won't delay the next track in album batches
-    // CRITICAL: All code in this block must be wrapped in try-catch to prevent server crashes
-    // ========================================================================
-    setTimeout(async () => {
-      try {
-        log(`░░░░░▒▒▒▒▒ HEAD${headNumber} FIRST BITE ____ Download Started: ${trackDisplay} (${headScore})`);
-
-        // Step 3: Fetch extended metadata from Spotify
-        // IMPROVED: Use prefetched metadata if available (skip Spotify page fetch)
-        let spotifyMetadata = null;
-
-        if (prefetchedYear || prefetchedImageUrl) {
-          // Use prefetched metadata from Python cache
-          spotifyMetadata = {
-            year: prefetchedYear || null,
-            imageUrl: prefetchedImageUrl || null,
-            genre: null,
-            label: null
-          };
-        } else if (shouldFetchSpotify && artist && track) {
-          // Fallback: Fetch from Spotify (for single tracks or cache miss)
-          try {
-            log(`░░░░░▒▒▒▒▒ HEAD${headNumber} SECOND BITE ____ Download: ${trackDisplay} (${headScore})`);
-            spotifyMetadata = await getSpotifyMetadata(artist, track);
-          } catch (spotifyError) {
-            log(`✗ Spotify metadata error: ${spotifyError.message}`);
-            spotifyMetadata = {};
-          }
-        }
+    runBackgroundJobs([job]);
 
-        // Step 4: Download cover art
-        let coverArtPath = null;
-        if (shouldDownloadCoverArt && spotifyMetadata && spotifyMetadata.imageUrl) {
-          const coverArtFilename = `cover_${Date.now()}.jpg`;
-          coverArtPath = path.join(path.dirname(currentFilePath), coverArtFilename);
-
-          try {
-            await downloadCoverArt(spotifyMetadata.imageUrl, coverArtPath);
-            log(`░░░░░▒▒▒▒▒▓▓▓▓▓ HEAD${headNumber} COMPLETE ____ ${trackDisplay}`);
-          } catch (error) {
-            log(`✗ Cover art download failed: ${error.message}`);
-            coverArtPath = null;
-          }
-        }
+  } catch (error) {
+    log(`✗ Metadata processing failed: ${error.message}`);
+    if (!res.headersSent) {
+      res.status(500).json({
+        success: false,
+        error: error.message
+      });
+    }
+  }
+});
 
-        // Step 5: Write ID3 tags
-        if (shouldWriteTags) {
-          const tagMetadata = {
-            artist,
-            track,
-            album,
-            year: spotifyMetadata?.year,
-            genre: spotifyMetadata?.genre,
-            label: spotifyMetadata?.label,
-            trackNumber: trackNumber,
-            coverArtPath
-          };
-
-          let tagsWritten = false;
-          if (isMP3) {
-            tagsWritten = await writeId3Tags(currentFilePath, tagMetadata);
-          } else if (isFLAC) {
-            tagsWritten = await writeFlacTags(currentFilePath, tagMetadata);
-          }
+/**
+ * Process several independent /process-metadata payloads in one request
+ * Body: { items: [payload, ...] } - each item is handled exactly like /process-metadata
+ * Renames/moves every track, replies with per-track results, then tags the
+ * tracks one at a time in background so their jobs can't pile up
+ */
+app.post('/process-metadata-batch', async (req, res) => {
+  try {
+    const tracks = req.body.items;
+    if (!Array.isArray(tracks) || tracks.length === 0) {
+      return res.status(400).json({ error: 'Missing or invalid items array' });
+    }
 
-          if (tagsWritten) {
-            log(`▓ Tags embedded`);
-          }
-        }
+    log(`Processing metadata batch of ${tracks.length} tracks`);
 
-        // Clean up temporary cover art
-        if (coverArtPath && fsSync.existsSync(coverArtPath)) {
-          try {
-            await fs.unlink(coverArtPath);
-          } catch {}
+    const results = [];
+    const jobs = [];
+    for (const track of tracks) {
+      try {
+        const { result, job, error } = await prepareTrack(track);
+        if (error) {
+          results.push({ success: false, original_path: track.filePath, new_path: track.filePath, error });
+        } else {
+          results.push(result);
+          jobs.push(job);
         }
+      } catch (trackError) {
+        log(`✗ Album track failed: ${trackError.message}`);
+        results.push({ success: false, original_path: track.filePath, new_path: track.filePath, error: trackError.message });
+      }
+    }
 
-        const duration = Date.now() - startTime;
-        log(`▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD${headNumber} FINISHED  ____ ${trackDisplay}        ^~~~~~~<:===<`);
+    res.json({
+      success: true,
+      results,
+      pending_jobs: pendingJobs + jobs.length
+    });
 
-      } catch (backgroundError) {
-        log(`✗ Background processing error: ${backgroundError.message}`);
-        // Don't crash the server - just log the error
-      }
-    }, 500); // 500ms delay to prevent concurrent job pile-up
+    runBackgroundJobs(jobs);
 
   } catch (error) {
-    log(`✗ Metadata processing failed: ${error.message}`);
+    log(`✗ Batch metadata processing failed: ${error.message}`);
     if (!res.headersSent) {
       res.status(500).json({
         success: false,
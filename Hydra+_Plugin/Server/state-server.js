@@ -60,6 +60,10 @@ let debugMode = {
   debugWindows: false
 };
 
+// Long-poll /searches/wait requests parked until a search is queued
+const MAX_WAIT_TIMEOUT = 30; // seconds
+const pendingWaiters = new Set();
+
 // ============================================================================
 // HELPER FUNCTIONS
 // ============================================================================
@@ -110,6 +114,15 @@ function addEvent(type, message, trackId = null) {
   }
 }
 
+/**
+ * Wake parked /searches/wait requests (called after a search is queued)
+ */
+function notifyPendingWaiters() {
+  for (const waiter of pendingWaiters) {
+    waiter();
+  }
+}
+
 /**
  * Artwork cache for temporary storage
  * Maps trackId → imageUrl for use during metadata processing
@@ -559,6 +572,55 @@ const server = http.createServer(async (req, res) => {
     return;
   }
 
+  // ============================================================================
+  // GET /searches/wait?since=<timestamp>&timeout=25 - Long-poll for searches
+  // Answers at once if an unprocessed search newer than `since` exists, otherwise
+  // holds the request until one is queued or the timeout expires.
+  // ============================================================================
+  if (req.method === 'GET' && req.url.startsWith('/searches/wait')) {
+    const params = new URL(req.url, `http://${req.headers.host || 'localhost'}`).searchParams;
+    const since = params.get('since') || '';
+    const timeout = Math.min(Math.max(parseInt(params.get('timeout'), 10) || 25, 1), MAX_WAIT_TIMEOUT);
+
+    const findPending = async () => {
+      const queue = await readQueue();
+      return queue.filter(item => !item.processed && item.timestamp > since);
+    };
+
+    const pending = await findPending();
+    if (pending.length > 0) {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({ searches: pending }));
+      return;
+    }
+
+    let done = false;
+    const finish = (searches) => {
+      if (done) return;
+      done = true;
+      clearTimeout(timer);
+      pendingWaiters.delete(waiter);
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({ searches: searches }));
+    };
+    const waiter = async () => {
+      const queued = await findPending();
+      if (queued.length > 0) {
+        finish(queued);
+      }
+    };
+    const timer = setTimeout(() => finish([]), timeout * 1000);
+
+    pendingWaiters.add(waiter);
+    // Client gave up (timeout/shutdown) - drop the waiter
+    res.on('close', () => {
+      done = true;
+      clearTimeout(timer);
+      pendingWaiters.delete(waiter);
+    });
+    return;
+  }
+
   // ============================================================================
   // POST /mark-processed - Mark searches as processed
   // ============================================================================
@@ -577,7 +639,16 @@ const server = http.createServer(async (req, res) => {
         const queue = await readQueue();
         let markedCount = 0;
 
-        if (data.timestamp) {
+        if (Array.isArray(data.timestamps)) {
+          // Batch format: {timestamps: [...]} - one call per plugin poll
+          const timestamps = new Set(data.timestamps);
+          for (const item of queue) {
+            if (timestamps.has(item.timestamp)) {
+              item.processed = true;
+              markedCount++;
+            }
+          }
+        } else if (data.timestamp) {
           // Old format: {timestamp: "..."}
           for (const item of queue) {
             if (item.timestamp === data.timestamp) {
@@ -595,7 +666,7 @@ const server = http.createServer(async (req, res) => {
           }
         } else {
           res.writeHead(400, { 'Content-Type': 'application/json' });
-          res.end(JSON.stringify({ success: false, error: 'Missing timestamp or search_ids' }));
+          res.end(JSON.stringify({ success: false, error: 'Missing timestamps, timestamp or search_ids' }));
           return;
         }
 
@@ -656,6 +727,7 @@ const server = http.createServer(async (req, res) => {
           album: data.album || '',
           duration: data.duration || 0,
           format: data.format || data.format_preference || 'mp3',
+          format_preference: (data.format || data.format_preference || 'mp3').toLowerCase(),
           track_id: data.track_id || null,
           image_url: data.image_url || '',
           auto_download: data.auto_download !== undefined ? data.auto_download : true,
@@ -668,6 +740,7 @@ const server = http.createServer(async (req, res) => {
         await writeQueue(queue);
 
         console.log(`[Hydra+ STATE] ✓ Queued: ${artist || query} - ${track || 'search'}`);
+        notifyPendingWaiters();
 
         res.writeHead(200, { 'Content-Type': 'application/json' });
         res.end(JSON.stringify({ success: true, search_id: searchEntry.search_id }));
@@ -728,6 +801,7 @@ const server = http.createServer(async (req, res) => {
         await writeQueue(queue);
 
         console.log(`[Hydra+ STATE] ✓ Queued album: ${artist} - ${album} (${data.tracks.length} tracks)`);
+        notifyPendingWaiters();
 
         res.writeHead(200, { 'Content-Type': 'application/json' });
         res.end(JSON.stringify({ success: true, search_id: searchEntry.search_id }));
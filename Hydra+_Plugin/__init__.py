@@ -12,13 +12,215 @@ __version__ = "0.1.9"
 
 from pynicotine.pluginsystem import BasePlugin
 from pynicotine.events import events
+import http.client
 import json
+import re
 import time
+import traceback
 import subprocess
 import os
-from threading import Thread
+import socket
+import heapq
+import queue
+from itertools import count
+from collections import OrderedDict, deque
+from operator import attrgetter, itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from threading import Thread, Lock, RLock, Event, local
 from urllib.request import urlopen, Request
 from urllib.error import URLError
+from urllib.parse import urlsplit, urlencode
+
+# Fast JSON for bridge and metadata worker traffic when orjson is installed (returns/accepts bytes)
+try:
+    import orjson
+    _jdumps = orjson.dumps
+    _jloads = orjson.loads
+    _JSON_BACKEND = 'orjson'
+except ImportError:
+    _JSON_BACKEND = 'json'
+    # One reusable compact encoder - json.dumps() builds a new one whenever options are passed
+    _json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def _jdumps(obj):
+        return _json_encode(obj).encode('utf-8')
+    _jloads = json.loads
+
+
+# Error fragments that mean the metadata worker went away mid-request
+_CRASH_TOKENS = (
+    'connection refused', 'connection reset', 'forcibly closed',
+    'cannot connect', 'connection aborted', 'winerror 10054', '10054',
+    'actively refused', 'remote end closed'
+)
+_CRASH_RE = re.compile('|'.join(map(re.escape, _CRASH_TOKENS)))
+
+# Audio formats the metadata worker can tag (compared against the lowercased extension only)
+_SUPPORTED_EXTS = frozenset({'.mp3', '.flac'})
+
+# Per-track album retries only pause when the metadata worker reports more background jobs than this
+_META_BACKLOG_THRESHOLD = 2
+
+# Album tracks are sent to /process-metadata-batch once this many are queued, or once the oldest has waited this long
+_ALBUM_META_BATCH_SIZE = 4
+_ALBUM_META_FLUSH_INTERVAL = 10
+
+# Seconds between re-checks of a download that passed its stuck/failed check
+_MONITOR_RECHECK_INTERVAL = 5
+
+# Upper bound on a metadata worker response body - results are small JSON objects
+_MAX_META_RESPONSE = 65536
+
+# Track search fields, in _trigger_search argument order (the bridge fills in every key)
+_get_track_search_fields = itemgetter(
+    'query', 'artist', 'track', 'album', 'track_id', 'duration',
+    'auto_download', 'metadata_override', 'format_preference', 'image_url'
+)
+# Defaults for entries queued by older bridge versions that omit some keys
+_TRACK_SEARCH_DEFAULTS = {
+    'query': None, 'artist': '', 'track': '', 'album': '', 'track_id': '', 'duration': 0,
+    'auto_download': False, 'metadata_override': True, 'format_preference': 'mp3', 'image_url': ''
+}
+
+# Processed search timestamps remembered for duplicate checks (oldest dropped first), and for how long
+_MAX_PROCESSED_TIMESTAMPS = 4096
+_PROCESSED_TTL = 15 * 60
+
+# Poll loop interval bounds (seconds) - doubles while idle, resets on activity
+_POLL_INTERVAL_MIN = 2
+_POLL_INTERVAL_MAX = 30
+
+# Same search (type/query/artist/track) re-delivered under a new timestamp within this many seconds is dropped
+_SEARCH_DEDUPE_WINDOW = 60
+
+# Repeated poll loop errors from the same site are logged at most once per this many seconds
+_ERROR_LOG_INTERVAL = 60
+
+# Seconds the bridge may hold a /searches/wait long-poll while the plugin is idle
+_LONG_POLL_TIMEOUT = 25
+
+# Seconds the poll loop waits for one batch of dispatched searches before leaving the rest unacknowledged
+_SEARCH_DISPATCH_TIMEOUT = 30
+
+# Loser cleanup per download mode (see Plugin._cleanup_losers)
+# mode_key=None means legacy fallback: abort the other download_candidates directly
+_MODE_CONFIG = {
+    'race': {
+        'tag': 'RACE',
+        'label': 'racing',
+        'mode_key': 'race_mode',
+        'list_key': 'race_heads',
+        'index_key': 'race_heads_by_key',
+        'winner_key': 'race_winner',
+    },
+    'cascade': {
+        'tag': 'CASCADE',
+        'label': 'cascade',
+        'mode_key': 'cascade_mode',
+        'list_key': 'cascade_heads',
+        'index_key': 'cascade_heads_by_key',
+        'winner_key': 'cascade_winner',
+    },
+    'fallback': {
+        'tag': 'CLEANUP',
+        'label': 'fallback',
+        'mode_key': None,
+    },
+}
+
+
+class HeadRecord:
+    """One race/cascade download head (a candidate transfer competing for the same track)."""
+
+    __slots__ = ('index', 'transfer_key', 'virtual_path', 'username', 'started_at', 'score')
+
+    def __init__(self, index, transfer_key, virtual_path, username, started_at, score):
+        self.index = index
+        self.transfer_key = transfer_key
+        self.virtual_path = virtual_path
+        self.username = username
+        self.started_at = started_at
+        self.score = score
+
+
+# Nicotine+ TransferStatus value of a download that is receiving data
+_STATUS_TRANSFERRING = 'Transferring'
+# Statuses the progress monitor no longer reports on
+_INACTIVE_STATUSES = frozenset(('Finished', 'Paused', 'Filtered'))
+
+# One C-level call per transfer instead of chained hasattr/attribute lookups in the monitor loops
+_get_progress_fields = attrgetter('size', 'current_byte_offset', 'status')
+_get_virtual_path = attrgetter('virtual_path')
+
+
+class _LazyTransferIndex:
+    """{virtual_path: transfer} view of Nicotine+'s transfers, built on the first lookup of a tick."""
+
+    __slots__ = ('_transfers_map', '_index')
+
+    def __init__(self, transfers_map):
+        self._transfers_map = transfers_map
+        self._index = None
+
+    def _build(self):
+        index = {}
+        for transfer in self._transfers_map.values():
+            virtual_path = getattr(transfer, 'virtual_path', None)
+            if virtual_path is not None:
+                index.setdefault(virtual_path, transfer)  # First transfer wins, like a linear scan
+        self._index = index
+        return index
+
+    def get(self, virtual_path, default=None):
+        return (self._index if self._index is not None else self._build()).get(virtual_path, default)
+
+    def __contains__(self, virtual_path):
+        return virtual_path in (self._index if self._index is not None else self._build())
+
+    def __getitem__(self, virtual_path):
+        return (self._index if self._index is not None else self._build())[virtual_path]
+
+    def find(self, user, virtual_path):
+        """Transfer for user + virtual path, falling back to the first transfer with that path."""
+        transfer = self._transfers_map.get(user + virtual_path) if user else None
+        return transfer if transfer is not None else self.get(virtual_path)
+
+    def holds(self, user, virtual_path, transfer):
+        """Whether Nicotine+ still lists this exact transfer object (not removed or aborted)."""
+        return bool(user) and self._transfers_map.get(user + virtual_path) is transfer
+
+
+class _TokenBucket:
+    """Rate limiter: acquire() takes a token, sleeping only once the burst capacity is used up."""
+
+    __slots__ = ('rate', 'capacity', '_tokens', '_updated', '_lock')
+
+    def __init__(self, rate, capacity):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def _search_dedupe_key(search):
+    """Identity of a search for duplicate detection, independent of its timestamp."""
+    return (
+        search.get('type', 'track'),
+        (search.get('query') or '').lower(),
+        (search.get('artist') or '').lower(),
+        (search.get('track') or '').lower()
+    )
 
 
 class Plugin(BasePlugin):
@@ -72,22 +274,74 @@ class Plugin(BasePlugin):
         # Runtime state
         self.running = False
         self.thread = None
-        self.processed_timestamps = {}  # Track processed searches with timestamps {search_ts: processed_at}
+        self.processed_timestamps = set()  # Search timestamps already handled (duplicate check only)
+        self._processed_order = deque()  # (processed_at, search_ts) in processing order, for expiry and the size cap
+        self._processed_dirty = False  # processed timestamps changed since the last save (see _save_processed_timestamps)
+        self._processed_lock = Lock()  # Guards _processed_order/_processed_dirty (poll thread vs. the save on unload)
+        self._search_rate = _TokenBucket(rate=2.0, capacity=4)  # Soulseek searches: bursts of 4, then 2/s
+        self._recent_searches = OrderedDict()  # {(type, query, artist, track): dispatched_at} within _SEARCH_DEDUPE_WINDOW
+        self._long_poll_ok = True  # Cleared if the bridge has no /searches/wait endpoint
+        self._newest_search_ts = ''  # Newest handled search timestamp, sent as ?since= on long-polls
         self.server_process = None  # Track state server process if we started it
         self.metadata_process = None  # Track metadata worker process if we started it
         self.active_searches = {}  # Track searches with metadata and ranked download candidates
         self.active_downloads = {}  # Track {virtual_path: search_token} for fallback
+        self._downloads_lock = RLock()  # Guards active_downloads removal across notification/monitor/abort threads
+        # Loser aborts are blocking Nicotine+ calls - drained by one background worker
+        self._abort_queue = queue.Queue()  # (virtual_path, username) tuples, None stops the worker
+        self.abort_thread = None
+        self.aborted_count = 0  # Total losing transfers aborted by the worker
+        # Download monitor timers: heap of (monotonic deadline, seq, token, kind, download_started_at stamp)
+        self._timers = []
+        self._timer_seq = count()
+        self._timers_lock = Lock()
+        # Set when a search is registered so the poll loop wakes up instead of sleeping out its interval
+        self._work_event = Event()
+        self._transfer_state = {}  # {(user, virtual_path): transfer} for downloads receiving data (fed by "update-download")
+        self.racing_heads = {}  # {transfer_key: (search_info, head, log_tag)} for race/cascade heads awaiting cancellation
+        self._cancelled_heads = {}  # {transfer_key: (log_tag, cancelled_at)} losers whose abort may land after they finish
+        # Metadata worker health: cleared on crash, set again by the health monitor once /ping answers
+        self._server_alive = Event()
+        self._server_alive.set()
+        self._server_down = Event()  # Wakes the health monitor
+        self.health_thread = None
+        # Persistent keep-alive connections to the bridge and metadata worker, one per server per calling thread
+        # (see _http_request)
+        self._http_local = local()
+        self._http_conns = set()  # All open connections, so unload can close them
+        self._http_conn_lock = Lock()
+        self._meta_pending_jobs = 0  # Background jobs the metadata worker reported on its last response
+        # Completed album tracks awaiting a batched metadata request: {token: [(track_index, track_info, payload, search_info)]}
+        self._album_meta_queue = {}
+        self._album_meta_queued_at = {}  # {token: monotonic time the oldest queued track was added}
+        self._album_meta_lock = Lock()
+        # Downloaded-file metadata processing (bounded - the metadata worker handles tracks sequentially)
+        self._metadata_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hydra-meta')
+        # Searches from one poll are dispatched concurrently (bridge events/logging overlap);
+        # do_search, the token lookup and the active_searches/timer registration stay serialized
+        self._search_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='hydra-search')
+        self._search_lock = Lock()
         self.nicotine_online = False  # Track if Nicotine+ is connected to the network
+        self._last_connection_check = time.time()  # Last nicotine_online refresh in the poll loop (every 30s)
+        self._last_error_time = 0.0  # Last "Cannot reach bridge server" log (at most once a minute)
+        self._progress_error_count = 0  # Failed /progress posts (every 10th is logged)
+        self._error_log_state = {}  # {error site: (last logged at, repeats suppressed since)} for _log_error
         self.waiting_for_connection = False  # Track if we're waiting for connection
         self.server_was_running = False  # Track if server was previously running
+        self._restart_in_progress = False  # A background bridge restart is running (see _restart_server_async)
+        self._restart_lock = Lock()
         self.last_cleanup_time = time.time()  # Track last cleanup of old data
-        # IMPROVED: Metadata cache with TTL and size limits
-        self.metadata_cache = {}  # {(token, track_index): {'data': metadata_dict, 'timestamp': time}}
+        # IMPROVED: Metadata cache with TTL and size limits (LRU order: oldest access first)
+        self.metadata_cache = OrderedDict()  # {(token, kind): {'data': metadata_dict, 'timestamp': time.monotonic()}}
+        self._cache_by_token = {}  # {token: [cache keys]} so per-album cleanup doesn't scan the whole cache
+        self._metadata_cache_lock = RLock()  # Guards metadata_cache/_cache_by_token (prefetch pool, poll thread, sweep)
+        self._album_static_payload = {}  # {token: metadata payload fields shared by every track of an album}
         self.metadata_cache_max_age = 10 * 60  # 10 minute TTL
         self.metadata_cache_max_size = 1000  # Max 1000 entries
+        self._last_cache_sweep = time.monotonic()
         # IMPROVED: Adaptive polling state
-        self.last_activity_time = time.time()
-        self.current_poll_interval = 2  # Start with normal interval
+        self.last_activity_time = time.time()  # Last poll iteration with activity (stored once per iteration)
+        self.current_poll_interval = _POLL_INTERVAL_MIN  # Start with normal interval
         self.poll_mode = 'active'  # 'active', 'idle', or 'sleep'
         # Progress monitoring
         self.progress_thread = None  # Thread for monitoring download progress
@@ -100,12 +354,53 @@ class Plugin(BasePlugin):
         self.server_path = os.path.join(self.plugin_dir, 'Server', 'bridge-server.js')  # Legacy (will be replaced)
         self.state_server_path = os.path.join(self.plugin_dir, 'Server', 'state-server.js')
         self.metadata_worker_path = os.path.join(self.plugin_dir, 'Server', 'metadata-worker.js')
+        self.processed_state_path = os.path.join(self.plugin_dir, 'processed-searches.json')  # Survives restarts
 
     def debug_log(self, message):
         """Log message only when debug mode is enabled."""
         if self.debug_mode:
             self.log(message)
 
+    def _debug_traceback(self, prefix):
+        """
+        Log the current exception's traceback only when debug mode is enabled.
+        The traceback is never formatted when debug output is off.
+
+        Args:
+            prefix: Log prefix, e.g. "[DL] Traceback:"
+        """
+        if self.debug_mode:
+            self.log(f"{prefix} {traceback.format_exc()}")
+
+    def debug_logf(self, fmt, *args):
+        """
+        Log a %-style message only when debug mode is enabled.
+        Formatting is skipped entirely when debug output is off (use on hot paths).
+        """
+        if self.debug_mode:
+            self.log(fmt % args if args else fmt)
+
+    def _log_error(self, key, fmt, *args):
+        """
+        Log a %-style error at most once per _ERROR_LOG_INTERVAL for each key.
+        Repeats in between are only counted (and formatted never); the count is reported with the next one logged.
+
+        Args:
+            key: Error site, e.g. 'poll'
+            fmt: %-style message format
+            *args: Format arguments
+        """
+        now = time.monotonic()
+        last, suppressed = self._error_log_state.get(key, (None, 0))
+        if last is not None and now - last < _ERROR_LOG_INTERVAL:
+            self._error_log_state[key] = (last, suppressed + 1)
+            return
+        self._error_log_state[key] = (now, 0)
+        message = fmt % args if args else fmt
+        if suppressed:
+            message = f"{message} ({suppressed} similar suppressed)"
+        self.log(message)
+
     def _is_nicotine_online(self):
         """Check if Nicotine+ is connected to the Soulseek server."""
         try:
@@ -136,12 +431,31 @@ class Plugin(BasePlugin):
             # Assume online to avoid blocking - better to try and fail than never try
             return True
 
+    def _restart_server_async(self):
+        """Restart the bridge servers off the poll thread (started by _poll_queue, one at a time)."""
+        try:
+            # First, clean up any zombie processes
+            self._cleanup_server_process()
+
+            # Wait a moment for port to be released
+            time.sleep(1)
+
+            # Now start fresh server
+            if self._start_server():
+                self.log("Bridge server restarted successfully")
+            else:
+                self.log("Failed to restart bridge server - please restart Nicotine+ manually")
+        except Exception as e:
+            self.log(f" Error restarting bridge server: {e}")
+        finally:
+            with self._restart_lock:
+                self._restart_in_progress = False
+
     def _is_server_running(self):
         """Check if the bridge server is running."""
         try:
-            req = Request(f'{self.settings["bridge_url"]}/status')
-            with urlopen(req, timeout=2) as response:
-                return response.status == 200
+            status, _ = self._bridge_request('GET', '/ping', timeout=2)
+            return status == 200
         except:
             return False
 
@@ -337,7 +651,6 @@ class Plugin(BasePlugin):
             # Also kill any node.js processes running the servers (Windows-specific cleanup)
             if os.name == 'nt':  # Windows
                 try:
-                    import subprocess
                     # Find and kill any node processes running state-server.js or metadata-worker.js
                     subprocess.run(['taskkill', '/F', '/FI', 'IMAGENAME eq node.exe', '/FI', f'WINDOWTITLE eq *state-server.js*'],
                                    capture_output=True, timeout=5)
@@ -384,10 +697,11 @@ class Plugin(BasePlugin):
         bridge_url = self.settings['bridge_url']
         poll_interval = self.settings['poll_interval']
 
-        self.pending_endpoint = f'{bridge_url}/pending'
-        self.mark_processed_endpoint = f'{bridge_url}/mark-processed'
         self.poll_interval = poll_interval
 
+        # Searches handled shortly before a restart must not be searched again if the bridge re-delivers them
+        self._load_processed_timestamps()
+
         # Eye-catching startup banner
         self.log("═══════════════════════════════════════════════════════════")
         self.log("  >> /////////////////////  Hydra+ /////////////////////  <<")
@@ -399,10 +713,18 @@ class Plugin(BasePlugin):
         self.log(f"  v{__version__}")
         self.log("═══════════════════════════════════════════════════════════")
         self.log("░░ HYDRA INITIALIZED")
+        if _JSON_BACKEND != 'orjson':
+            self.debug_log("orjson not installed - using stdlib json for bridge/worker traffic")
 
         # Subscribe to search result events for auto-download
         events.connect("file-search-response", self._on_file_search_response)
 
+        # Track transferring downloads as Nicotine+ reports them (monitors fall back to scanning without it)
+        try:
+            events.connect("update-download", self._on_transfer_update)
+        except Exception as e:
+            self.debug_log(f"[DL] Transfer update events unavailable: {e}")
+
         # Start polling thread (it will wait for connection before processing)
         self.running = True
         self.waiting_for_connection = True
@@ -414,6 +736,14 @@ class Plugin(BasePlugin):
         self.progress_thread = Thread(target=self._monitor_download_progress, daemon=True)
         self.progress_thread.start()
 
+        # Start abort worker (aborts losing heads off the notification thread)
+        self.abort_thread = Thread(target=self._abort_worker, daemon=True)
+        self.abort_thread.start()
+
+        # Start metadata worker health monitor (idle until a crash is reported)
+        self.health_thread = Thread(target=self._health_monitor, daemon=True)
+        self.health_thread.start()
+
         # Check if server is running and start if needed (in background to avoid blocking startup)
         server_thread = Thread(target=self._check_and_start_server, daemon=True)
         server_thread.start()
@@ -422,8 +752,10 @@ class Plugin(BasePlugin):
         """Called when the plugin is disabled or unloaded."""
         self.log("Plugin unloading...")
 
-        # Stop polling thread
+        # Stop polling thread (shutting the sockets down wakes a long-poll blocked in recv)
         self.running = False
+        self._work_event.set()
+        self._shutdown_http_conns()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
 
@@ -432,6 +764,24 @@ class Plugin(BasePlugin):
         if self.progress_thread and self.progress_thread.is_alive():
             self.progress_thread.join(timeout=5)
 
+        try:
+            events.disconnect("update-download", self._on_transfer_update)
+        except Exception:
+            pass
+
+        # Stop abort worker (don't wait for queued loser aborts)
+        self._abort_queue.put(None)
+
+        # Stop accepting metadata jobs (don't wait for in-flight ones)
+        self._metadata_pool.shutdown(wait=False)
+        self._search_pool.shutdown(wait=False)
+
+        # Drop the kept-alive bridge/metadata worker connections
+        with self._http_conn_lock:
+            for conn in self._http_conns:
+                conn.close()
+            self._http_conns.clear()
+
         # Stop server if we started it
         if self.server_process:
             try:
@@ -442,39 +792,203 @@ class Plugin(BasePlugin):
             except Exception as e:
                 self.log(f" Error stopping server: {e}")
 
+        self._save_processed_timestamps()
+
         self.log("Plugin unloaded")
 
+    def _meta_request(self, method, path, payload=None, timeout=15):
+        """
+        Send a request to the metadata worker over a persistent keep-alive connection.
+
+        Args:
+            method: HTTP method ('GET' or 'POST')
+            path: Endpoint path (e.g. '/process-metadata')
+            payload: Dict to send as JSON body (optional)
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Tuple of (status: int, body: bytes)
+        """
+        return self._http_request(self.settings['metadata_url'], method, path, payload, timeout, _MAX_META_RESPONSE)
+
+    def _bridge_request(self, method, path, payload=None, timeout=30):
+        """
+        Send a request to the bridge (state) server over a persistent keep-alive connection.
+
+        Args:
+            method: HTTP method ('GET' or 'POST')
+            path: Endpoint path, including any query string (e.g. '/pending')
+            payload: Dict to send as JSON body (optional)
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Tuple of (status: int, body: bytes)
+        """
+        return self._http_request(self.settings['bridge_url'], method, path, payload, timeout)
+
+    def _http_request(self, base_url, method, path, payload=None, timeout=15, max_size=None):
+        """
+        Send a request over this thread's keep-alive connection to base_url.
+        Each thread keeps its own connections, so pool workers never wait on each other's sockets.
+
+        Args:
+            base_url: Server URL (e.g. settings['metadata_url'])
+            method: HTTP method ('GET' or 'POST')
+            path: Endpoint path
+            payload: Dict to send as JSON body (optional)
+            timeout: Socket timeout in seconds
+            max_size: Largest accepted response body in bytes (None = unbounded)
+
+        Returns:
+            Tuple of (status: int, body: bytes)
+        """
+        body = _jdumps(payload) if payload is not None else None
+        headers = {'Connection': 'keep-alive'}
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+
+        conns = getattr(self._http_local, 'conns', None)
+        if conns is None:
+            conns = self._http_local.conns = {}
+
+        for attempt in range(2):
+            conn = conns.get(base_url)
+            reused = conn is not None
+            if not reused:
+                parts = urlsplit(base_url)
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+                conns[base_url] = conn
+                with self._http_conn_lock:
+                    self._http_conns.add(conn)
+
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                if max_size is None:
+                    return response.status, response.read()
+                data = response.read(max_size + 1)
+                if len(data) > max_size:
+                    # Unread bytes would poison the kept-alive socket - the handler below drops it
+                    raise ValueError(f"Response from {base_url}{path} exceeds {max_size} bytes")
+                return response.status, data
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                self._drop_http_conn(base_url, conn)
+                # The server may have closed an idle kept-alive socket - retry once on a fresh one
+                if not reused or attempt:
+                    raise
+            except Exception:
+                self._drop_http_conn(base_url, conn)
+                raise
+
+    def _shutdown_http_conns(self):
+        """Shut down every kept-alive socket so threads blocked on a response return immediately."""
+        with self._http_conn_lock:
+            for conn in self._http_conns:
+                sock = conn.sock
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass  # Already closed by the server
+
+    def _drop_http_conn(self, base_url, conn):
+        """Close this thread's connection to base_url so the next request reconnects."""
+        conn.close()
+        self._http_local.conns.pop(base_url, None)
+        with self._http_conn_lock:
+            self._http_conns.discard(conn)
+
+    def _mark_metadata_server_down(self):
+        """Report a metadata worker crash so waiting threads block until the health monitor sees it again."""
+        self._server_alive.clear()
+        self._server_down.set()
+
+    def _health_monitor(self):
+        """
+        Background thread that pings the metadata worker while it is reported down.
+        A single pinger wakes every thread waiting on _server_alive the moment the server returns.
+        """
+        while self.running:
+            if not self._server_down.wait(timeout=1):
+                continue
+
+            try:
+                status, _ = self._meta_request('GET', '/ping', timeout=2)
+                if status == 200:
+                    self._server_down.clear()
+                    self._server_alive.set()
+                    continue
+            except Exception:
+                pass  # Server not ready yet, keep pinging
+
+            time.sleep(0.25)
+
     def _get_pending_searches(self):
-        """Fetch pending searches from the bridge server."""
+        """
+        Fetch pending searches from the bridge server.
+
+        Returns:
+            List of searches, or None if the request failed (the poll loop then probes the server)
+        """
         try:
-            req = Request(self.pending_endpoint)
             # Increased timeout to 30s since metadata processing can be slow
-            with urlopen(req, timeout=30) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                return data.get('searches', [])
-        except URLError as e:
-            # Only log error occasionally to avoid spam
-            if not hasattr(self, '_last_error_time') or time.time() - self._last_error_time > 60:
+            status, body = self._bridge_request('GET', '/pending', timeout=30)
+            if status != 200:
+                self.log(f" Error fetching searches: HTTP {status}")
+                return None
+            return _jloads(body).get('searches', [])
+        except OSError as e:
+            # Only log error occasionally to avoid spam (timeouts are normal during metadata processing)
+            if 'timed out' not in str(e) and time.time() - self._last_error_time > 60:
                 self.log(f" Cannot reach bridge server: {e}")
                 self._last_error_time = time.time()
-            return []
+            return None
         except Exception as e:
             # Suppress timeout errors from logging since they're normal during metadata processing
             error_msg = str(e)
             if 'timed out' not in error_msg:
                 self.log(f" Error fetching searches: {e}")
-            return []
+            return None
+
+    def _wait_for_searches(self, timeout):
+        """
+        Long-poll the bridge server for searches newer than the last one handled.
+
+        Args:
+            timeout: Seconds the bridge may hold the request before answering with no searches
 
-    def _mark_processed(self, timestamp):
-        """Mark a search as processed on the bridge server."""
+        Returns:
+            List of searches, or None if the long-poll failed (caller falls back to /pending)
+        """
+        query = urlencode({'since': self._newest_search_ts, 'timeout': timeout})
         try:
-            data = json.dumps({'timestamp': timestamp}).encode('utf-8')
-            req = Request(self.mark_processed_endpoint, data=data, headers={'Content-Type': 'application/json'})
+            status, body = self._bridge_request('GET', f'/searches/wait?{query}', timeout=timeout + 5)
+            if status == 200:
+                return _jloads(body).get('searches', [])
+            if status == 404:
+                # Older bridge server - keep polling /pending
+                self._long_poll_ok = False
+                self.log(" Bridge server has no long-poll endpoint - using interval polling")
+            return None
+        except Exception:
+            # Unreachable/timed out - /pending reports the error
+            return None
+
+    def _mark_processed_batch(self, timestamps):
+        """
+        Mark searches as processed on the bridge server in one request.
 
+        Args:
+            timestamps: Timestamps of the searches handled this poll
+        """
+        try:
             # Increased timeout to match _get_pending_searches
-            with urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return result.get('success', False)
+            _, body = self._bridge_request('POST', '/mark-processed', {'timestamps': timestamps}, timeout=30)
+            return _jloads(body).get('success', False)
         except Exception as e:
             # Suppress timeout errors from logging
             error_msg = str(e)
@@ -482,8 +996,149 @@ class Plugin(BasePlugin):
                 self.log(f" Error marking processed: {e}")
             return False
 
+    def _sweep_metadata_cache(self, now):
+        """
+        Remove expired metadata cache entries (called at most once a minute from the poll loop).
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        self._last_cache_sweep = now
+        cache_cutoff = now - self.metadata_cache_max_age
+        with self._metadata_cache_lock:
+            expired_cache = [key for key, value in self.metadata_cache.items()
+                             if value.get('timestamp', now) < cache_cutoff]
+
+            for key in expired_cache:
+                self._drop_cached_metadata(key)
+
+        if expired_cache:
+            self.log(f" Cleaned {len(expired_cache)} expired metadata cache entries")
+
+    def _handle_one_search(self, search):
+        """
+        Trigger the Nicotine+ search for one bridge entry (runs on the search pool).
+
+        Args:
+            search: Search entry from the bridge
+
+        Returns:
+            True if the search was started
+        """
+        # Check if this is an album search or track search
+        if search.get('type', 'track') == 'album':
+            # Handle album search
+            return self._trigger_album_search(search)
+
+        # Handle regular track search
+        try:
+            (query, artist, track, album, track_id, duration,
+             auto_download, metadata_override, format_preference, image_url) = _get_track_search_fields(search)
+        except KeyError:
+            (query, artist, track, album, track_id, duration,
+             auto_download, metadata_override, format_preference, image_url) = _get_track_search_fields({**_TRACK_SEARCH_DEFAULTS, **search})
+
+        if not query:
+            return False
+
+        return self._trigger_search(query, artist, track, album, track_id, duration, auto_download, metadata_override, 'track', format_preference, image_url)
+
+    def _settle_search_future(self, future, timestamp, dedupe_key, now, to_ack):
+        """
+        Record the outcome of a dispatched search (poll thread only).
+
+        Args:
+            future: Finished search pool future from _handle_one_search
+            timestamp: Bridge timestamp of the search
+            dedupe_key: Key claimed in _recent_searches when it was dispatched
+            now: Wall clock time of this poll iteration
+            to_ack: Timestamps to acknowledge to the bridge (appended to on success)
+        """
+        try:
+            success = future.result()
+        except Exception as e:
+            self._log_error('trigger', " Error triggering search: %s", e)
+            success = False
+
+        if success:
+            # Mark as processed on server (batched)
+            to_ack.append(timestamp)
+
+            # Track locally to prevent duplicates (with cleanup timestamp)
+            self._remember_processed(timestamp, now)
+        else:
+            # Release the key so a re-delivery is searched again
+            self._recent_searches.pop(dedupe_key, None)
+
+    def _is_duplicate_search(self, key, now):
+        """
+        Check whether the same logical search was dispatched recently.
+
+        Args:
+            key: (type, query, artist, track) tuple from _search_dedupe_key
+            now: Current wall clock time
+
+        Returns:
+            True if an identical search was dispatched within _SEARCH_DEDUPE_WINDOW
+        """
+        # Entries are in dispatch order - drop the expired ones from the front
+        recent = self._recent_searches
+        cutoff = now - _SEARCH_DEDUPE_WINDOW
+        while recent and next(iter(recent.values())) < cutoff:
+            recent.popitem(last=False)
+        return key in recent
+
+    def _remember_processed(self, timestamp, now):
+        """Record a handled search timestamp for duplicate checks and the long-poll cursor."""
+        with self._processed_lock:
+            self._processed_dirty = True
+            self.processed_timestamps.add(timestamp)
+            self._processed_order.append((now, timestamp))
+            if len(self._processed_order) > _MAX_PROCESSED_TIMESTAMPS:
+                self.processed_timestamps.discard(self._processed_order.popleft()[1])
+        if timestamp > self._newest_search_ts:
+            self._newest_search_ts = timestamp
+
+    def _load_processed_timestamps(self):
+        """Restore processed search timestamps saved by the previous session (expired ones are dropped)."""
+        try:
+            if not os.path.exists(self.processed_state_path):
+                return
+            with open(self.processed_state_path, 'rb') as f:
+                entries = _jloads(f.read())
+
+            cutoff = time.time() - _PROCESSED_TTL
+            for processed_at, timestamp in entries[-_MAX_PROCESSED_TIMESTAMPS:]:
+                if processed_at >= cutoff and timestamp not in self.processed_timestamps:
+                    self.processed_timestamps.add(timestamp)
+                    self._processed_order.append((processed_at, timestamp))
+                    if timestamp > self._newest_search_ts:
+                        self._newest_search_ts = timestamp
+
+            self.debug_log(f" Restored {len(self._processed_order)} processed search timestamps")
+        except Exception as e:
+            self.debug_log(f" Could not restore processed timestamps: {e}")
+
+    def _save_processed_timestamps(self):
+        """Write processed search timestamps to disk if they changed (atomic replace)."""
+        # Snapshot under the lock - unload saves while the poll thread may still be appending
+        with self._processed_lock:
+            if not self._processed_dirty:
+                return
+            entries = list(self._processed_order)
+            self._processed_dirty = False
+        try:
+            tmp_path = self.processed_state_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_jdumps(entries))
+            os.replace(tmp_path, self.processed_state_path)
+        except Exception as e:
+            with self._processed_lock:
+                self._processed_dirty = True  # Retry on the next save
+            self.debug_log(f" Could not save processed timestamps: {e}")
+
     def _cleanup_old_data(self):
-        """IMPROVED: Cleanup old data with more frequent runs and metadata cache cleanup."""
+        """IMPROVED: Cleanup old data with more frequent runs (the metadata cache is swept by the poll loop)."""
         try:
             current_time = time.time()
 
@@ -494,15 +1149,22 @@ class Plugin(BasePlugin):
             self.last_cleanup_time = current_time
 
             # IMPROVED: Clean up processed timestamps older than 15 minutes (not 1 hour)
-            fifteen_min_ago = current_time - 900
-            old_timestamps = [ts for ts, processed_at in self.processed_timestamps.items()
-                            if processed_at < fifteen_min_ago]
-
-            for ts in old_timestamps:
-                del self.processed_timestamps[ts]
-
-            if old_timestamps:
-                self.log(f" Cleaned {len(old_timestamps)} old processed timestamps")
+            # Entries are in processing order, so expired ones are all at the front
+            fifteen_min_ago = current_time - _PROCESSED_TTL
+            order = self._processed_order
+            cleaned = 0
+            with self._processed_lock:
+                while order and order[0][0] < fifteen_min_ago:
+                    self.processed_timestamps.discard(order.popleft()[1])
+                    cleaned += 1
+                if cleaned:
+                    self._processed_dirty = True
+
+            if cleaned:
+                self.log(f" Cleaned {cleaned} old processed timestamps")
+
+            # Persist processed timestamps (at most once a minute, only when they changed)
+            self._save_processed_timestamps()
 
             # Clean up stale active searches (older than 10 minutes)
             ten_minutes_ago = current_time - 600
@@ -511,31 +1173,29 @@ class Plugin(BasePlugin):
 
             for token in stale_searches:
                 del self.active_searches[token]
+                # Drop the search's prefetched metadata too (O(entries for this token) via the index)
+                with self._metadata_cache_lock:
+                    for key in self._cache_by_token.pop(token, ()):
+                        self.metadata_cache.pop(key, None)
 
             if stale_searches:
                 self.log(f" Cleaned {len(stale_searches)} stale active searches")
 
-            # IMPROVED: Clean up expired metadata cache entries
-            cache_cutoff = current_time - self.metadata_cache_max_age
-            expired_cache = [key for key, value in self.metadata_cache.items()
-                           if value.get('timestamp', current_time) < cache_cutoff]
+            # Drop per-album payload skeletons of albums that are no longer active
+            finished_albums = [token for token in self._album_static_payload if token not in self.active_searches]
+            for token in finished_albums:
+                del self._album_static_payload[token]
 
-            for key in expired_cache:
-                del self.metadata_cache[key]
-
-            if expired_cache:
-                self.log(f" Cleaned {len(expired_cache)} expired metadata cache entries")
-
-            # IMPROVED: Enforce cache size limit (LRU eviction)
-            if len(self.metadata_cache) > self.metadata_cache_max_size:
-                # Sort by timestamp and keep newest entries
-                sorted_cache = sorted(self.metadata_cache.items(),
-                                    key=lambda x: x[1].get('timestamp', 0),
-                                    reverse=True)
-                # Keep only max_size entries
-                self.metadata_cache = dict(sorted_cache[:self.metadata_cache_max_size])
-                removed = len(sorted_cache) - self.metadata_cache_max_size
-                self.log(f" Evicted {removed} old metadata cache entries (LRU)")
+            # Drop race/cascade heads that are no longer tracked (finished, aborted or vanished)
+            stale_heads = [key for key in list(self.racing_heads) if key not in self.active_downloads]
+            for key in stale_heads:
+                self.racing_heads.pop(key, None)
+
+            # Forget cancelled losers once their abort has long since landed
+            expired_heads = [key for key, (_, cancelled_at) in list(self._cancelled_heads.items())
+                             if cancelled_at < ten_minutes_ago]
+            for key in expired_heads:
+                self._cancelled_heads.pop(key, None)
 
         except Exception as e:
             self.log(f" Error in cleanup: {e}")
@@ -578,50 +1238,56 @@ class Plugin(BasePlugin):
         try:
             # Use the core.search.do_search method
             # Mode "global" = network-wide search
-            search_token = self.core.search.do_search(query, "global")
-
-            # If do_search returns None, try to get the token from the searches dict
-            if not search_token and hasattr(self.core.search, 'searches'):
-                # Get all search tokens
-                available_tokens = list(self.core.search.searches.keys())
-                if available_tokens:
-                    # Use the most recent search token (last in the list)
-                    search_token = available_tokens[-1]
+            # (serialized with the registration below so concurrent searches can't pick up each
+            # other's token or interleave their active_searches/timer updates)
+            with self._search_lock:
+                search_token = self.core.search.do_search(query, "global")
+
+                # If do_search returns None, try to get the token from the searches dict
+                if not search_token and hasattr(self.core.search, 'searches'):
+                    # Get all search tokens
+                    available_tokens = list(self.core.search.searches.keys())
+                    if available_tokens:
+                        # Use the most recent search token (last in the list)
+                        search_token = available_tokens[-1]
+
+                # Track this search if auto-download is enabled
+                if auto_download and search_token:
+                    self.active_searches[search_token] = {
+                        'type': search_type,  # 'track' or 'album'
+                        'query': query,
+                        'duration': duration,
+                        'auto_download': auto_download,
+                        'metadata_override': metadata_override,
+                        'format_preference': format_preference,  # 'mp3' or 'flac'
+                        # Spotify metadata for post-processing
+                        'artist': artist,
+                        'track': track,
+                        'album': album,
+                        'track_id': track_id,
+                        'image_url': image_url,
+                        'timestamp': time.time(),
+                        'download_candidates': [],  # List of {file, user, score, size, attrs}
+                        'current_attempt': -1,  # -1 = not started, 0+ = attempt index
+                        'download_started_at': None,
+                        'last_download_path': None,
+                        'last_download_user': None,  # Username of last download attempt (for abort)
+                        'result_count': 0
+                    }
+                    self._schedule_timer(300, search_token, 'search-timeout')
 
             # Only log if auto-download failed to get token
             if auto_download and not search_token:
                 self.log(f" Search '{query}' - auto-download unavailable (no token)")
 
-            # Track this search if auto-download is enabled
             if auto_download and search_token:
-                self.active_searches[search_token] = {
-                    'type': search_type,  # 'track' or 'album'
-                    'query': query,
-                    'duration': duration,
-                    'auto_download': auto_download,
-                    'metadata_override': metadata_override,
-                    'format_preference': format_preference,  # 'mp3' or 'flac'
-                    # Spotify metadata for post-processing
-                    'artist': artist,
-                    'track': track,
-                    'album': album,
-                    'track_id': track_id,
-                    'image_url': image_url,
-                    'timestamp': time.time(),
-                    'download_candidates': [],  # List of {file, user, score, size, attrs}
-                    'current_attempt': -1,  # -1 = not started, 0+ = attempt index
-                    'download_started_at': None,
-                    'last_download_path': None,
-                    'last_download_user': None,  # Username of last download attempt (for abort)
-                    'result_count': 0
-                }
+                self._work_event.set()
                 self.debug_log(f"[DL] Tracking search (token={search_token})")
 
             return True
         except Exception as e:
             self.log(f"ERROR triggering search!")
             self.log(f" Exception: {type(e).__name__}: {str(e)}")
-            import traceback
             self.log(f" Traceback: {traceback.format_exc()}")
             return False
 
@@ -633,12 +1299,6 @@ class Plugin(BasePlugin):
             message: Event message
             track_id: Optional track ID for color-coding
         """
-        import json
-        from urllib.request import Request, urlopen
-
-        bridge_url = self.settings.get('bridge_url', 'http://127.0.0.1:3847')
-        url = f"{bridge_url}/event"
-
         data = {
             'type': event_type,
             'message': message,
@@ -647,13 +1307,8 @@ class Plugin(BasePlugin):
 
         # FIRE-AND-FORGET: Single attempt with short timeout, don't block on failure
         try:
-            req = Request(url,
-                         data=json.dumps(data).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'},
-                         method='POST')
-
             # Very short timeout since bridge responds instantly
-            urlopen(req, timeout=0.3)
+            self._bridge_request('POST', '/event', data, timeout=0.3)
             return True
 
         except Exception:
@@ -677,12 +1332,6 @@ class Plugin(BasePlugin):
             image_url: Album artwork URL (for thumbnail display)
         """
         try:
-            import json
-            from urllib.request import Request, urlopen
-
-            bridge_url = self.settings.get('bridge_url', 'http://127.0.0.1:3847')
-            url = f"{bridge_url}/progress"
-
             data = {
                 'trackId': track_id,
                 'filename': filename,
@@ -696,17 +1345,10 @@ class Plugin(BasePlugin):
                 'imageUrl': image_url
             }
 
-            req = Request(url,
-                         data=json.dumps(data).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'},
-                         method='POST')
-
             # FIRE-AND-FORGET: Very short timeout since bridge responds instantly
-            urlopen(req, timeout=0.3)
+            self._bridge_request('POST', '/progress', data, timeout=0.3)
         except Exception as e:
             # Log errors for debugging (only log every 10th error to avoid spam)
-            if not hasattr(self, '_progress_error_count'):
-                self._progress_error_count = 0
             self._progress_error_count += 1
             if self._progress_error_count % 10 == 1:
                 self.log(f"[PROGRESS] Bridge connection error: {str(e)[:50]}")
@@ -714,28 +1356,14 @@ class Plugin(BasePlugin):
     def _remove_progress_tracking(self, track_id):
         """Remove download from bridge server's progress tracking when download is deleted."""
         try:
-            import json
-            from urllib.request import Request, urlopen
-
-            bridge_url = self.settings.get('bridge_url', 'http://127.0.0.1:3847')
-            url = f"{bridge_url}/remove-progress"
-
-            data = {'trackId': track_id}
-
-            req = Request(url,
-                         data=json.dumps(data).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'},
-                         method='POST')
-
-            # Non-blocking - don't wait for response
-            urlopen(req, timeout=0.5)
+            # Short timeout - don't hold up the caller if the bridge is busy
+            self._bridge_request('POST', '/remove-progress', {'trackId': track_id}, timeout=0.5)
         except Exception:
             # Silently fail - don't spam logs if bridge is offline
             pass
 
     def _monitor_download_progress(self):
         """Background thread to monitor active download progress and send updates to bridge."""
-        import os
 
         self.debug_log("[PROGRESS] Progress monitoring thread started")
 
@@ -757,7 +1385,7 @@ class Plugin(BasePlugin):
                 for virtual_path, transfer in transfers.items():
                     # Only include if it's in our active tracking and not finished
                     if virtual_path in self.active_downloads:
-                        if not (hasattr(transfer, 'status') and transfer.status in ('Finished', 'Paused', 'Filtered')):
+                        if getattr(transfer, 'status', None) not in _INACTIVE_STATUSES:
                             current_paths.add(virtual_path)
 
                 # Detect removed downloads (were monitored but no longer in current tracked paths)
@@ -768,7 +1396,7 @@ class Plugin(BasePlugin):
                         # DON'T notify bridge to remove - let completion handler send 100% update
                         # The bridge will auto-cleanup after 60 seconds
                         # self._remove_progress_tracking(track_id)
-                        self.debug_log(f"[PROGRESS] Download finished from monitoring: trackId={track_id}")
+                        self.debug_logf("[PROGRESS] Download finished from monitoring: trackId=%s", track_id)
 
                 # DEBUG: Log monitoring cycle (disabled to reduce spam)
                 # if len(transfers) > 0:
@@ -777,22 +1405,37 @@ class Plugin(BasePlugin):
 
                 for virtual_path, transfer in transfers.items():
                     try:
-                        # Skip if transfer doesn't have required attributes
-                        if not hasattr(transfer, 'size') or not hasattr(transfer, 'current_byte_offset'):
-                            continue
-
-                        # Skip completed downloads (only monitor active downloads)
-                        # Check if transfer has a status attribute and if it's finished
-                        if hasattr(transfer, 'status') and transfer.status in ('Finished', 'Paused', 'Filtered'):
+                        # RACE/CASCADE: Losing heads abort themselves once the winner cancels the race
+                        racing = self.racing_heads.get(virtual_path)
+                        if racing and racing[0]['cancel_event'].is_set():
+                            # pop, not del: _cleanup_old_data may drop the same entry concurrently
+                            racing = self.racing_heads.pop(virtual_path, None)
+                            if racing is None:
+                                continue
+                            racing_info, head, tag = racing
+                            if virtual_path != racing_info.get('cancel_winner_key'):
+                                with self._downloads_lock:
+                                    self.active_downloads.pop(virtual_path, None)
+                                self._cancelled_heads[virtual_path] = (tag, time.time())
+                                self.log(f"[{tag}] Aborting HEAD{head.index + 1} (score: {head.score})")
+                                self._queue_aborts([(head.virtual_path, head.username)])
                             continue
 
                         # Skip downloads that are no longer in our active tracking
                         if virtual_path not in self.active_downloads:
                             continue
 
-                        # Get progress data
-                        total_bytes = transfer.size
-                        bytes_downloaded = transfer.current_byte_offset or 0
+                        # Get progress data (skip transfers without the required attributes)
+                        try:
+                            total_bytes, bytes_downloaded, status = _get_progress_fields(transfer)
+                        except AttributeError:
+                            continue
+
+                        # Skip completed downloads (only monitor active downloads)
+                        if status in _INACTIVE_STATUSES:
+                            continue
+
+                        bytes_downloaded = bytes_downloaded or 0
 
                         # Skip if no valid size or progress
                         if total_bytes is None or total_bytes <= 0:
@@ -877,22 +1520,25 @@ class Plugin(BasePlugin):
 
                             cascade_heads = search_info.get('cascade_heads', [])
                             for cascade_head in cascade_heads:
-                                cascade_transfer_key = cascade_head['transfer_key']
-                                if cascade_transfer_key in transfers:
-                                    cascade_transfer = transfers[cascade_transfer_key]
-                                    if hasattr(cascade_transfer, 'size') and hasattr(cascade_transfer, 'current_byte_offset'):
-                                        cascade_total = cascade_transfer.size
-                                        cascade_downloaded = cascade_transfer.current_byte_offset or 0
-
-                                        if cascade_total and cascade_total > 0:
-                                            cascade_progress = min(100, (cascade_downloaded / cascade_total) * 100)
-
-                                            # Use highest progress
-                                            if cascade_progress > max_progress:
-                                                max_progress = cascade_progress
-                                                max_bytes_downloaded = cascade_downloaded
-                                                max_total_bytes = cascade_total
-                                                fastest_filename = os.path.basename(cascade_head['virtual_path'])
+                                cascade_transfer_key = cascade_head.transfer_key
+                                cascade_transfer = transfers.get(cascade_transfer_key)
+                                if cascade_transfer is None:
+                                    continue
+                                try:
+                                    cascade_total, cascade_downloaded, _ = _get_progress_fields(cascade_transfer)
+                                except AttributeError:
+                                    continue
+                                cascade_downloaded = cascade_downloaded or 0
+
+                                if cascade_total and cascade_total > 0:
+                                    cascade_progress = min(100, (cascade_downloaded / cascade_total) * 100)
+
+                                    # Use highest progress
+                                    if cascade_progress > max_progress:
+                                        max_progress = cascade_progress
+                                        max_bytes_downloaded = cascade_downloaded
+                                        max_total_bytes = cascade_total
+                                        fastest_filename = os.path.basename(cascade_head.virtual_path)
 
                             # Send only the maximum progress
                             self._send_progress_update(track_id, fastest_filename, max_progress, max_bytes_downloaded, max_total_bytes, artist, track_name, album_name, '', image_url)
@@ -900,7 +1546,7 @@ class Plugin(BasePlugin):
                             # Log cascade progress (show all heads for debugging)
                             if int(max_progress) % 10 == 0 or max_progress == 100:
                                 heads_count = len(cascade_heads)
-                                self.debug_log(f"[CASCADE] Max progress: {int(max_progress)}% ({heads_count} head(s) active)")
+                                self.debug_logf("[CASCADE] Max progress: %d%% (%d head(s) active)", max_progress, heads_count)
 
                         # RACE MODE: Calculate maximum progress among all racing heads
                         # Only send the highest progress to UI (fastest download wins display)
@@ -913,29 +1559,32 @@ class Plugin(BasePlugin):
 
                             race_heads = search_info.get('race_heads', [])
                             for race_head in race_heads:
-                                race_transfer_key = race_head['transfer_key']
-                                if race_transfer_key in transfers:
-                                    race_transfer = transfers[race_transfer_key]
-                                    if hasattr(race_transfer, 'size') and hasattr(race_transfer, 'current_byte_offset'):
-                                        race_total = race_transfer.size
-                                        race_downloaded = race_transfer.current_byte_offset or 0
-
-                                        if race_total and race_total > 0:
-                                            race_progress = min(100, (race_downloaded / race_total) * 100)
-
-                                            # Use highest progress
-                                            if race_progress > max_progress:
-                                                max_progress = race_progress
-                                                max_bytes_downloaded = race_downloaded
-                                                max_total_bytes = race_total
-                                                fastest_filename = os.path.basename(race_head['virtual_path'])
+                                race_transfer_key = race_head.transfer_key
+                                race_transfer = transfers.get(race_transfer_key)
+                                if race_transfer is None:
+                                    continue
+                                try:
+                                    race_total, race_downloaded, _ = _get_progress_fields(race_transfer)
+                                except AttributeError:
+                                    continue
+                                race_downloaded = race_downloaded or 0
+
+                                if race_total and race_total > 0:
+                                    race_progress = min(100, (race_downloaded / race_total) * 100)
+
+                                    # Use highest progress
+                                    if race_progress > max_progress:
+                                        max_progress = race_progress
+                                        max_bytes_downloaded = race_downloaded
+                                        max_total_bytes = race_total
+                                        fastest_filename = os.path.basename(race_head.virtual_path)
 
                             # Send only the maximum progress
                             self._send_progress_update(track_id, fastest_filename, max_progress, max_bytes_downloaded, max_total_bytes, artist, track_name, album_name, '', image_url)
 
                             # Log race progress (show all heads for debugging)
                             if int(max_progress) % 10 == 0 or max_progress == 100:
-                                self.debug_log(f"[RACE] Max progress: {int(max_progress)}% (showing fastest of {len(race_heads)} racing downloads)")
+                                self.debug_logf("[RACE] Max progress: %d%% (showing fastest of %d racing downloads)", max_progress, len(race_heads))
 
                         # For albums, send cumulative bytes instead of current track bytes
                         elif search_info and search_info.get('type') == 'album' and 'album_track_id' in search_info:
@@ -961,10 +1610,10 @@ class Plugin(BasePlugin):
                             if int(progress) % 10 == 0 or progress == 100:
                                 current_track = search_info.get('current_track_index', 0) + 1
                                 total_tracks = len(search_info.get('tracks_to_download', []))
-                                self.debug_log(f"[PROGRESS] {filename}: {int(progress)}% (Track {current_track}/{total_tracks})")
+                                self.debug_logf("[PROGRESS] %s: %d%% (Track %d/%d)", filename, progress, current_track, total_tracks)
                         else:
                             # Log all progress for single tracks
-                            self.debug_log(f"[PROGRESS] {filename[:40]}: {int(progress)}% (ID: {track_id})")
+                            self.debug_logf("[PROGRESS] %.40s: %d%% (ID: %s)", filename, progress, track_id)
 
                     except Exception as e:
                         # Skip this transfer if there's an error
@@ -987,7 +1636,6 @@ class Plugin(BasePlugin):
 
     def _extract_bitrate(self, filename):
         """Extract bitrate from filename (e.g., '320kbps', '256', 'V0')."""
-        import re
         filename_lower = filename.lower()
 
         # Look for explicit bitrate patterns
@@ -1135,7 +1783,6 @@ class Plugin(BasePlugin):
             # Additional penalty for parentheses/brackets with extra info (often remixes/features)
             # e.g., "Track Name (Another Artist Remix)" or "Track Name [feat. Someone]"
             if not file_has_variant:  # Don't double-penalize
-                import re
                 if re.search(r'\([^)]*(?:remix|feat|ft|featuring|edit|version|mix|live|acoustic|instrumental)[^)]*\)', filename_lower):
                     score -= 30
                 elif re.search(r'\[[^\]]*(?:remix|feat|ft|featuring|edit|version|mix|live|acoustic|instrumental)[^\]]*\]', filename_lower):
@@ -1188,8 +1835,7 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.debug_log(f"[DL] Error processing search response: {e}")
-            import traceback
-            self.debug_log(f"[DL] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[DL] Traceback:")
 
     def _process_track_search_results(self, token, search_info, username, file_list):
         """Process search results for a single track."""
@@ -1268,7 +1914,6 @@ class Plugin(BasePlugin):
 
     def _process_album_search_results(self, token, search_info, username, file_list, msg=None):
         """Process search results for an album - group by folder and score folders."""
-        import os
 
         # Log when we receive results (first time only)
         if search_info['result_count'] == 0:
@@ -1377,7 +2022,7 @@ class Plugin(BasePlugin):
 
         # Track count match (max 100 points)
         expected_count = len(search_info['tracks'])
-        mp3_count = sum(1 for f in files if f['path'].lower().endswith('.mp3'))
+        mp3_count = sum(1 for f in files if os.path.splitext(f['path'])[1].lower() == '.mp3')
 
         if mp3_count >= expected_count:
             score += 100
@@ -1500,7 +2145,8 @@ class Plugin(BasePlugin):
 
             # Update tracking
             search_info['current_attempt'] = attempt_index
-            search_info['download_started_at'] = time.time()
+            search_info['download_started_at'] = time.monotonic()
+            self._schedule_timer(60, token, 'track-check', search_info['download_started_at'])
             search_info['last_download_path'] = candidate['file']
             search_info['last_download_user'] = candidate['user']  # Store username for abort
             search_info['head_number'] = attempt_index + 1  # Store HEAD number (1-indexed)
@@ -1510,44 +2156,55 @@ class Plugin(BasePlugin):
             # CRITICAL: Use the same key format as Nicotine+ transfers dictionary: username + virtual_path
             transfer_key = candidate['user'] + candidate['file']
             self.active_downloads[transfer_key] = token
-            self.debug_log(f"[PROGRESS] Tracking download: {transfer_key[:80]} (token={token})")
+            self.debug_logf("[PROGRESS] Tracking download: %.80s (token=%s)", transfer_key, token)
 
             # CASCADE MODE: Track all cascade heads so we can abort losers when one wins
             if search_info.get('cascade_mode'):
                 if 'cascade_heads' not in search_info:
                     search_info['cascade_heads'] = []
-
-                search_info['cascade_heads'].append({
-                    'index': attempt_index,
-                    'transfer_key': transfer_key,
-                    'virtual_path': candidate['file'],
-                    'username': candidate['user'],
-                    'started_at': time.time(),
-                    'score': candidate['score']
-                })
-                self.debug_log(f"[CASCADE] Registered HEAD{attempt_index + 1} in cascade (score: {candidate['score']})")
+                    search_info['cascade_heads_by_key'] = {}
+
+                cascade_head = HeadRecord(
+                    index=attempt_index,
+                    transfer_key=transfer_key,
+                    virtual_path=candidate['file'],
+                    username=candidate['user'],
+                    started_at=time.time(),
+                    score=candidate['score']
+                )
+                search_info['cascade_heads'].append(cascade_head)
+                search_info.setdefault('cascade_heads_by_key', {})[transfer_key] = cascade_head
+                # Shared cancellation token - set by the winner, losers abort themselves
+                search_info.setdefault('cancel_event', Event())
+                self.racing_heads[transfer_key] = (search_info, cascade_head, 'CASCADE')
+                self.debug_logf("[CASCADE] Registered HEAD%d in cascade (score: %s)", attempt_index + 1, candidate['score'])
 
             # LEGACY RACE MODE: Track all racing heads (kept for backward compatibility)
             elif search_info.get('race_mode'):
                 if 'race_heads' not in search_info:
                     search_info['race_heads'] = []
-
-                search_info['race_heads'].append({
-                    'index': attempt_index,
-                    'transfer_key': transfer_key,
-                    'virtual_path': candidate['file'],
-                    'username': candidate['user'],
-                    'started_at': time.time(),
-                    'score': candidate['score']
-                })
-                self.debug_log(f"[RACE] Registered HEAD{attempt_index + 1} in race (score: {candidate['score']})")
+                    search_info['race_heads_by_key'] = {}
+
+                race_head = HeadRecord(
+                    index=attempt_index,
+                    transfer_key=transfer_key,
+                    virtual_path=candidate['file'],
+                    username=candidate['user'],
+                    started_at=time.time(),
+                    score=candidate['score']
+                )
+                search_info['race_heads'].append(race_head)
+                search_info.setdefault('race_heads_by_key', {})[transfer_key] = race_head
+                # Shared cancellation token - set by the winner, losers abort themselves
+                search_info.setdefault('cancel_event', Event())
+                self.racing_heads[transfer_key] = (search_info, race_head, 'RACE')
+                self.debug_logf("[RACE] Registered HEAD%d in race (score: %s)", attempt_index + 1, candidate['score'])
 
             # Don't log success - the download starting message is enough
 
         except Exception as e:
             self.debug_log(f"[DL] Error queuing download: {e}")
-            import traceback
-            self.debug_log(f"[DL] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[DL] Traceback:")
 
             # Try next candidate if available
             if attempt_index + 1 < len(search_info['download_candidates']):
@@ -1558,6 +2215,48 @@ class Plugin(BasePlugin):
                 if token in self.active_searches:
                     del self.active_searches[token]
 
+    def _bulk_abort(self, transfers, tag, downloads=None):
+        """
+        Remove transfers from Nicotine+ with as few calls as possible.
+        Tries clear_downloads (also removes them from the UI), then abort_downloads, and only
+        falls back to one abort_transfer call per transfer as a last resort.
+
+        Args:
+            transfers: Transfer objects to remove (duplicates are dropped)
+            tag: Log tag for failures, e.g. 'ALBUM'
+            downloads: Nicotine+ downloads object (defaults to self.core.downloads)
+
+        Returns:
+            Name of the method that succeeded, or None
+        """
+        if downloads is None:
+            downloads = self.core.downloads
+        transfers = list({id(transfer): transfer for transfer in transfers}.values())
+        if not transfers:
+            return None
+
+        for method in ('clear_downloads', 'abort_downloads'):
+            bulk = getattr(downloads, method, None)
+            if bulk is None:
+                continue
+            try:
+                bulk(transfers)
+                return method
+            except Exception as e:
+                self.debug_log(f"[{tag}] {method} failed: {e}")
+
+        abort_transfer = getattr(downloads, 'abort_transfer', None)
+        if abort_transfer is None:
+            return None
+        aborted = 0
+        for transfer in transfers:
+            try:
+                abort_transfer(transfer)
+                aborted += 1
+            except Exception as e:
+                self.debug_log(f"[{tag}] abort_transfer failed: {e}")
+        return 'abort_transfer' if aborted else None
+
     def _abort_transfer_by_path(self, virtual_path, username=None, remove_from_tracking=True):
         """
         Abort a download transfer by its virtual path.
@@ -1575,49 +2274,26 @@ class Plugin(BasePlugin):
             transfer_to_abort = None
             if hasattr(self.core, 'downloads') and hasattr(self.core.downloads, 'transfers'):
                 for transfer in self.core.downloads.transfers.values():
-                    if hasattr(transfer, 'virtual_path') and transfer.virtual_path == virtual_path:
-                        transfer_to_abort = transfer
-                        self.debug_log(f"[ABORT] Found transfer to abort: {virtual_path[:60]}")
-                        break
+                    try:
+                        if _get_virtual_path(transfer) != virtual_path:
+                            continue
+                    except AttributeError:
+                        continue
+                    transfer_to_abort = transfer
+                    self.debug_logf("[ABORT] Found transfer to abort: %.60s", virtual_path)
+                    break
 
                 if transfer_to_abort:
-                    # Try clear_downloads FIRST (cleanest removal)
-                    cleared = False
-                    if hasattr(self.core.downloads, 'clear_downloads'):
-                        try:
-                            self.core.downloads.clear_downloads([transfer_to_abort])
-                            self.debug_log(f"[ABORT] ✓ Cleared transfer via clear_downloads")
-                            cleared = True
-                        except Exception as e:
-                            self.debug_log(f"[ABORT] clear_downloads failed: {e}")
-
-                    # Try abort if clear failed
-                    if not cleared:
-                        if hasattr(self.core.downloads, 'abort_downloads'):
-                            try:
-                                self.core.downloads.abort_downloads([transfer_to_abort])
-                                self.debug_log(f"[ABORT] ✓ Aborted via abort_downloads")
-                            except Exception as e:
-                                self.debug_log(f"[ABORT] abort_downloads failed: {e}")
-                                # Try abort_transfer as last resort
-                                if hasattr(self.core.downloads, 'abort_transfer'):
-                                    try:
-                                        self.core.downloads.abort_transfer(transfer_to_abort)
-                                        self.debug_log(f"[ABORT] ✓ Aborted via abort_transfer")
-                                    except Exception as e2:
-                                        self.debug_log(f"[ABORT] abort_transfer also failed: {e2}")
-                        elif hasattr(self.core.downloads, 'abort_transfer'):
-                            try:
-                                self.core.downloads.abort_transfer(transfer_to_abort)
-                                self.debug_log(f"[ABORT] ✓ Aborted via abort_transfer")
-                            except Exception as e:
-                                self.debug_log(f"[ABORT] abort_transfer failed: {e}")
+                    method = self._bulk_abort([transfer_to_abort], 'ABORT')
+                    if method:
+                        self.debug_log(f"[ABORT] ✓ Aborted via {method}")
 
                     # Remove from tracking if requested
                     if remove_from_tracking:
                         transfer_key = (username + virtual_path) if username else virtual_path
-                        if transfer_key in self.active_downloads:
-                            del self.active_downloads[transfer_key]
+                        with self._downloads_lock:
+                            removed = self.active_downloads.pop(transfer_key, None) is not None
+                        if removed:
                             self.debug_log(f"[ABORT] Removed from tracking")
 
                     return True
@@ -1632,6 +2308,36 @@ class Plugin(BasePlugin):
             self.debug_log(f"[ABORT] Error aborting transfer: {e}")
             return False
 
+    def _abort_worker(self):
+        """Background thread that aborts queued losing transfers one at a time."""
+        while True:
+            item = self._abort_queue.get()
+            if item is None:
+                break
+
+            virtual_path, username = item
+            try:
+                # Callers already popped the transfer from active_downloads
+                if self._abort_transfer_by_path(virtual_path, username, remove_from_tracking=False):
+                    self.aborted_count += 1
+            except Exception as e:
+                self.debug_log(f"[ABORT] Worker error: {e}")
+
+    def _queue_aborts(self, targets):
+        """
+        Hand losing transfers to the abort worker and return immediately.
+        Callers remove the transfers from active_downloads before queueing.
+
+        Args:
+            targets: List of (virtual_path, username) tuples to abort
+
+        Returns:
+            Number of transfers queued for abort
+        """
+        for target in targets:
+            self._abort_queue.put(target)
+        return len(targets)
+
     def _try_next_download_candidate(self, token, search_info, reason):
         """
         Try the next download candidate after a failure.
@@ -1672,52 +2378,43 @@ class Plugin(BasePlugin):
         # Try next candidate (logging happens in _try_download_candidate)
         self._try_download_candidate(token, search_info, next_attempt, f"Trying next candidate")
 
-    def _check_cascade_launches(self):
-        """Check if we should launch additional cascade heads (HEAD2, HEAD3)."""
-        if not self.active_searches:
+    def _check_cascade_launch(self, token, search_info, current_time):
+        """Check if we should launch additional cascade heads (HEAD2, HEAD3) for a search."""
+        if not search_info.get('cascade_mode'):
             return
 
-        current_time = time.time()
-
-        for token, search_info in list(self.active_searches.items()):
-            if not search_info.get('cascade_mode'):
-                continue
-
-            try:
-                elapsed = current_time - search_info['cascade_start_time']
-                heads_launched = search_info.get('cascade_heads_launched', 1)
-                candidates = search_info.get('download_candidates', [])
-
-                # HEAD2 launch logic (10s delay if HEAD1 hasn't started, or 60s timeout)
-                if heads_launched == 1 and len(candidates) >= 2 and candidates[1]['score'] > 50:
-                    head1_started = search_info.get('cascade_head1_started', False)
-
-                    # Launch HEAD2 if HEAD1 hasn't started after 10s
-                    if not head1_started and elapsed >= 10:
-                        self.log(f"[CASCADE] HEAD1 no response after 10s → launching HEAD2 (score: {candidates[1]['score']})")
-                        self._try_download_candidate(token, search_info, 1, "CASCADE HEAD2 (HEAD1 stalled)")
-                        search_info['cascade_heads_launched'] = 2
-
-                    # Launch HEAD2 if HEAD1 taking too long (60s timeout)
-                    elif head1_started and elapsed >= 60:
-                        self.log(f"[CASCADE] HEAD1 taking too long (60s) → launching HEAD2 as backup (score: {candidates[1]['score']})")
-                        self._try_download_candidate(token, search_info, 1, "CASCADE HEAD2 (timeout)")
-                        search_info['cascade_heads_launched'] = 2
-
-                # HEAD3 launch logic (120s total timeout)
-                elif heads_launched == 2 and len(candidates) >= 3 and candidates[2]['score'] > 50:
-                    if elapsed >= 120:
-                        self.log(f"[CASCADE] HEAD1/HEAD2 taking too long (120s) → launching HEAD3 as final backup (score: {candidates[2]['score']})")
-                        self._try_download_candidate(token, search_info, 2, "CASCADE HEAD3 (final backup)")
-                        search_info['cascade_heads_launched'] = 3
-
-            except Exception as e:
-                self.debug_log(f"[CASCADE] Error checking cascade for {token}: {e}")
-                import traceback
-                self.debug_log(f"[CASCADE] Traceback: {traceback.format_exc()}")
-
-    def _check_and_download_ready_searches(self):
-        """Check active searches and download if enough time has passed to collect results."""
+        elapsed = current_time - search_info['cascade_start_time']
+        heads_launched = search_info.get('cascade_heads_launched', 1)
+        candidates = search_info.get('download_candidates', [])
+
+        # HEAD2 launch logic (10s delay if HEAD1 hasn't started, or 60s timeout)
+        if heads_launched == 1 and len(candidates) >= 2 and candidates[1]['score'] > 50:
+            head1_started = search_info.get('cascade_head1_started', False)
+
+            # Launch HEAD2 if HEAD1 hasn't started after 10s
+            if not head1_started and elapsed >= 10:
+                self.log(f"[CASCADE] HEAD1 no response after 10s → launching HEAD2 (score: {candidates[1]['score']})")
+                self._try_download_candidate(token, search_info, 1, "CASCADE HEAD2 (HEAD1 stalled)")
+                search_info['cascade_heads_launched'] = 2
+
+            # Launch HEAD2 if HEAD1 taking too long (60s timeout)
+            elif head1_started and elapsed >= 60:
+                self.log(f"[CASCADE] HEAD1 taking too long (60s) → launching HEAD2 as backup (score: {candidates[1]['score']})")
+                self._try_download_candidate(token, search_info, 1, "CASCADE HEAD2 (timeout)")
+                search_info['cascade_heads_launched'] = 2
+
+        # HEAD3 launch logic (120s total timeout)
+        elif heads_launched == 2 and len(candidates) >= 3 and candidates[2]['score'] > 50:
+            if elapsed >= 120:
+                self.log(f"[CASCADE] HEAD1/HEAD2 taking too long (120s) → launching HEAD3 as final backup (score: {candidates[2]['score']})")
+                self._try_download_candidate(token, search_info, 2, "CASCADE HEAD3 (final backup)")
+                search_info['cascade_heads_launched'] = 3
+
+    def _maintenance_pass(self):
+        """
+        One pass over active searches per poll: start downloads for searches that have collected
+        enough results, then launch cascade backups (HEAD2/HEAD3) where due.
+        """
         if not self.active_searches:
             return
 
@@ -1736,13 +2433,21 @@ class Plugin(BasePlugin):
 
             except Exception as e:
                 self.debug_log(f"[DL] Error checking search {token}: {e}")
-                import traceback
-                self.debug_log(f"[DL] Traceback: {traceback.format_exc()}")
+                self._debug_traceback("[DL] Traceback:")
 
                 # Remove problematic search after timeout
                 if current_time - search_info['timestamp'] > 60:
                     del self.active_searches[token]
 
+            if token not in self.active_searches:
+                continue
+
+            try:
+                self._check_cascade_launch(token, search_info, current_time)
+            except Exception as e:
+                self.debug_log(f"[CASCADE] Error checking cascade for {token}: {e}")
+                self._debug_traceback("[CASCADE] Traceback:")
+
     def _check_track_download_ready(self, token, search_info, current_time):
         """Check if a track search is ready to download."""
         elapsed = current_time - search_info['timestamp']
@@ -1777,6 +2482,7 @@ class Plugin(BasePlugin):
                 search_info['cascade_head1_started'] = False  # Will be set when progress > 0
                 search_info['cascade_heads_launched'] = 1
                 search_info['cascade_heads'] = []
+                search_info['cascade_heads_by_key'] = {}
 
                 # Start HEAD1 only (best quality candidate)
                 self._try_download_candidate(token, search_info, 0, "CASCADE HEAD1 (best quality)")
@@ -1799,6 +2505,7 @@ class Plugin(BasePlugin):
                     search_info['cascade_head1_started'] = False
                     search_info['cascade_heads_launched'] = 1
                     search_info['cascade_heads'] = []
+                    search_info['cascade_heads_by_key'] = {}
                     self._try_download_candidate(token, search_info, 0, "CASCADE HEAD1 (timeout)")
                 else:
                     # Only one viable candidate
@@ -1872,6 +2579,8 @@ class Plugin(BasePlugin):
             # This is shared across all tracks and should not be fetched per-track
             if len(tracks_to_download) > 0:
                 first_track_info = tracks_to_download[0]['track_info']
+                # Fields every track's metadata request repeats (prefetch adds year/cover)
+                self._album_static_payload[token] = {'album': first_track_info.get('album', '')}
                 self._prefetch_album_metadata(token, first_track_info)
 
             # Start downloading first track
@@ -1879,8 +2588,7 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.debug_log(f"[ALBUM] Error starting album download: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[ALBUM] Traceback:")
             del self.active_searches[token]
 
     def _get_download_directory(self, track_to_download):
@@ -1917,17 +2625,12 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.debug_log(f"[ALBUM] Error getting download directory: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[ALBUM] Traceback:")
             return None
 
     def _ensure_album_folder(self, search_info, download_dir):
         """Create album folder before downloads start (crash-resistant)."""
         try:
-            from urllib.request import urlopen, Request
-            from urllib.error import URLError
-            import json
-
             album_artist = search_info.get('album_artist', '')
             album_name = search_info.get('album_name', '')
             year = search_info.get('year', '')
@@ -1946,30 +2649,24 @@ class Plugin(BasePlugin):
                 'download_dir': download_dir
             }
 
-            url = f"{self.settings['metadata_url']}/ensure-album-folder"
-            req = Request(url,
-                         data=json.dumps(payload).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'})
+            _, body = self._meta_request('POST', '/ensure-album-folder', payload, timeout=10)
+            result = _jloads(body)
 
-            with urlopen(req, timeout=10) as response:
-                result = json.loads(response.read().decode('utf-8'))
-
-                if result.get('success'):
-                    folder_path = result.get('folder_path', '')
-                    self.log(f"[ALBUM] Folder created: {result.get('folder_name', '')}")
-                    return folder_path
-                else:
-                    error = result.get('error', 'Unknown error')
-                    self.log(f"[ALBUM] Failed to create folder: {error}")
-                    return None
+            if result.get('success'):
+                folder_path = result.get('folder_path', '')
+                self.log(f"[ALBUM] Folder created: {result.get('folder_name', '')}")
+                return folder_path
+            else:
+                error = result.get('error', 'Unknown error')
+                self.log(f"[ALBUM] Failed to create folder: {error}")
+                return None
 
-        except URLError as e:
+        except (URLError, OSError) as e:
             self.log(f"[ALBUM] Cannot reach bridge server: {e}")
             return None
         except Exception as e:
             self.debug_log(f"[ALBUM] Error creating album folder: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[ALBUM] Traceback:")
             return None
 
     def _match_album_tracks(self, search_info, best_folder):
@@ -1978,7 +2675,6 @@ class Plugin(BasePlugin):
 
         Returns list of {track_info, file_path, file_size, file_attrs, user}
         """
-        import os
 
         expected_tracks = search_info['tracks']
         folder_files = best_folder['tracks_found']
@@ -1989,7 +2685,6 @@ class Plugin(BasePlugin):
         # Helper function to normalize text for flexible matching
         def normalize_for_matching(text):
             """Normalize text for flexible matching - handles underscores, dots, remaster suffixes, etc."""
-            import re
 
             # Strip version suffixes (Remaster, Deluxe Edition, etc.) BEFORE other normalization
             # This matches patterns like "- 2015 Remaster", "(Deluxe Edition)", "[Live Version]", etc.
@@ -2056,7 +2751,6 @@ class Plugin(BasePlugin):
                 track_num = track_info.get('track_number', 0)
                 if track_num > 0:
                     # Look for track number patterns like "01", "1.", "01 -", etc.
-                    import re
                     track_patterns = [
                         rf'\b0?{track_num}\b',  # "01" or "1"
                         rf'\b0?{track_num}\.',  # "01." or "1."
@@ -2122,14 +2816,8 @@ class Plugin(BasePlugin):
             token: Search token
             first_track_info: Track metadata dict from first track (to get album info)
         """
-        from threading import Thread
-
         def prefetch_worker():
             try:
-                from urllib.request import urlopen, Request
-                from urllib.error import URLError
-                import re
-
                 track_id = first_track_info.get('track_id', '')
                 if not track_id:
                     self.debug_log(f"[PREFETCH] No track_id, skipping album metadata prefetch")
@@ -2163,11 +2851,12 @@ class Plugin(BasePlugin):
                             album_metadata['image_url'] = image_match.group(1)
 
                         # IMPROVED: Store in cache with TTL wrapper
-                        cache_key = (token, 'album')
-                        self.metadata_cache[cache_key] = {
-                            'data': album_metadata,
-                            'timestamp': time.time()
-                        }
+                        self._cache_metadata((token, 'album'), album_metadata)
+                        if album_metadata and token in self._album_static_payload:
+                            self._album_static_payload[token].update({
+                                'prefetchedYear': album_metadata.get('year', ''),
+                                'prefetchedImageUrl': album_metadata.get('image_url', '')
+                            })
 
                         self.debug_log(f"[PREFETCH] Album metadata cached (year={album_metadata.get('year', 'N/A')})")
 
@@ -2178,12 +2867,10 @@ class Plugin(BasePlugin):
 
             except Exception as e:
                 self.debug_log(f"[PREFETCH] Fatal error in prefetch worker: {e}")
-                import traceback
-                self.debug_log(f"[PREFETCH] {traceback.format_exc()}")
+                self._debug_traceback("[PREFETCH]")
 
-        # Start prefetch in background thread
-        thread = Thread(target=prefetch_worker, daemon=True)
-        thread.start()
+        # Run on the shared metadata pool - queued ahead of this album's track metadata jobs
+        self._metadata_pool.submit(prefetch_worker)
 
     def _download_next_album_track(self, token, search_info):
         """Download the next track in the album queue."""
@@ -2232,12 +2919,15 @@ class Plugin(BasePlugin):
             # CRITICAL: Use the same key format as Nicotine+ transfers dictionary: username + virtual_path
             transfer_key = track_to_download['user'] + track_to_download['file_path']
             self.active_downloads[transfer_key] = token
-            search_info['download_started_at'] = time.time()
+            search_info['download_started_at'] = time.monotonic()
+            stamp = search_info['download_started_at']
+            if search_info['current_track_index'] == 0:
+                self._schedule_timer(15, token, 'album-first-track', stamp)
+            self._schedule_timer(90, token, 'album-stuck', stamp)
 
         except Exception as e:
             self.debug_log(f"[ALBUM] Error downloading track: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[ALBUM] Traceback:")
 
             # Try next track or give up
             search_info['current_track_index'] += 1
@@ -2257,22 +2947,14 @@ class Plugin(BasePlugin):
             search_info: Dict with artist, track, album, track_id, etc.
         """
         try:
-            from urllib.request import urlopen, Request
-            from urllib.error import URLError
-            import json
-            import os
-
-            # Wait a moment for file to be fully written
-            time.sleep(1)
-
+            # No settle wait: Nicotine+ only reports a download finished once the file is fully written
             # Verify file exists and is MP3
             if not os.path.exists(file_path):
                 self.log(f"[META] File not found: {file_path}")
                 return
 
             # Check if file is MP3 or FLAC
-            file_lower = file_path.lower()
-            if not (file_lower.endswith('.mp3') or file_lower.endswith('.flac')):
+            if os.path.splitext(file_path)[1].lower() not in _SUPPORTED_EXTS:
                 self.log(f"[META] Unsupported format (only MP3/FLAC), skipping: {file_path}")
                 return
 
@@ -2293,62 +2975,56 @@ class Plugin(BasePlugin):
             }
 
             # Send to Metadata Worker
-            url = f"{self.settings['metadata_url']}/process-metadata"
-            req = Request(url,
-                         data=json.dumps(payload).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'})
+            status, body = self._meta_request('POST', '/process-metadata', payload, timeout=30)
+            result = _jloads(body)
 
-            with urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            if result.get('success'):
+                # Format FINISHED message
+                artist = search_info.get('artist', '')
+                track = search_info.get('track', '')
+                track_display = f"{artist} - {track}"
+                head_num = search_info.get('head_number', 1)
 
-                if result.get('success'):
-                    # Format FINISHED message
+                if result.get('renamed'):
+                    self.log(f"▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD{head_num} FINISHED  ____ {track_display}        ^~~~~~~<:===<")
+
+                if result.get('tags_updated'):
                     artist = search_info.get('artist', '')
                     track = search_info.get('track', '')
-                    track_display = f"{artist} - {track}"
-                    head_num = search_info.get('head_number', 1)
-
-                    if result.get('renamed'):
-                        self.log(f"▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD{head_num} FINISHED  ____ {track_display}        ^~~~~~~<:===<")
-
-                    if result.get('tags_updated'):
-                        artist = search_info.get('artist', '')
-                        track = search_info.get('track', '')
-                        album = search_info.get('album', '')
-                        if artist:
-                            self.log(f"[META]   Artist: {artist}")
-                        if track:
-                            self.log(f"[META]   Track: {track}")
-                        if album:
-                            self.log(f"[META]   Album: {album}")
-
-                        # Log additional metadata from server response
-                        if result.get('year'):
-                            self.log(f"[META]   Year: {result['year']}")
-                        if result.get('track_number'):
-                            self.log(f"[META]   Track: #{result['track_number']}")
-                        if result.get('genre'):
-                            self.log(f"[META]   Genre: {result['genre']}")
-                        if result.get('label'):
-                            self.log(f"[META]   Label: {result['label']}")
-
-                    if result.get('cover_embedded'):
-                        self.log(f"[META]   Cover: Embedded")
-                else:
-                    self.log(f"[META] Failed: {result.get('error', 'Unknown error')}")
+                    album = search_info.get('album', '')
+                    if artist:
+                        self.log(f"[META]   Artist: {artist}")
+                    if track:
+                        self.log(f"[META]   Track: {track}")
+                    if album:
+                        self.log(f"[META]   Album: {album}")
+
+                    # Log additional metadata from server response
+                    if result.get('year'):
+                        self.log(f"[META]   Year: {result['year']}")
+                    if result.get('track_number'):
+                        self.log(f"[META]   Track: #{result['track_number']}")
+                    if result.get('genre'):
+                        self.log(f"[META]   Genre: {result['genre']}")
+                    if result.get('label'):
+                        self.log(f"[META]   Label: {result['label']}")
+
+                if result.get('cover_embedded'):
+                    self.log(f"[META]   Cover: Embedded")
+            else:
+                self.log(f"[META] Failed: {result.get('error', 'Unknown error')}")
 
-        except URLError as e:
+        except (URLError, OSError) as e:
             self.log(f"[META] Cannot reach Node server: {e}")
             self.log(f"[META] Make sure bridge server is running")
         except Exception as e:
             self.log(f"[META] Error: {e}")
-            import traceback
             self.log(f"[META] {traceback.format_exc()}")
 
     def _finalize_album_download(self, token, search_info):
         """
         Finalize album download.
-        CRITICAL: No batch processing anymore - each track was processed immediately after download.
+        Tracks are processed in small batches as they download; the last partial batch is flushed here.
         """
         try:
             tracks_to_download = search_info.get('tracks_to_download', [])
@@ -2359,7 +3035,9 @@ class Plugin(BasePlugin):
 
             self.log(f"[ALBUM] Album download complete!")
             self.log(f"[ALBUM] Downloaded: {downloaded_count}/{len(tracks_to_download)} tracks")
-            self.log(f"[ALBUM] All tracks were processed immediately (no batch processing)")
+
+            # Send any tracks still waiting for a batched metadata request
+            self._flush_album_meta(token, force=True)
 
             # IMPROVED: Send final 100% progress update for album-level progress bar
             if 'album_track_id' in search_info:
@@ -2374,7 +3052,6 @@ class Plugin(BasePlugin):
             # Check if album folder was created
             album_folder = search_info.get('album_folder_path')
             if album_folder:
-                import os
                 self.log(f"[ALBUM] Location: {album_folder}")
                 self.log(f"[ALBUM] Folder: {os.path.basename(album_folder)}")
 
@@ -2383,88 +3060,35 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.debug_log(f"[ALBUM] Error finalizing album: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[ALBUM] Traceback:")
             if token in self.active_searches:
                 del self.active_searches[token]
 
-    def _organize_album_folder(self, downloaded_tracks, search_info):
-        """Organize downloaded files into album folder."""
+    def download_finished_notification(self, user, virtual_path, real_path):
+        """
+        Called when a download completes successfully.
+
+        Args:
+            user: Username who shared the file
+            virtual_path: Network path of file
+            real_path: Local filesystem path where file was saved
+        """
         try:
-            from urllib.request import urlopen, Request
-            from urllib.error import URLError
-            import json
-            import os
-
-            # Extract file paths (already renamed if metadata processing occurred)
-            track_file_paths = [track_data['file_path'] for track_data in downloaded_tracks]
-
-            self.log(f"[ALBUM] Creating album folder and organizing {len(track_file_paths)} files...")
-
-            # Send to bridge server to create album folder and move files
-            payload = {
-                'album_artist': search_info['album_artist'],
-                'album_name': search_info['album_name'],
-                'year': search_info.get('year', ''),
-                'track_files': track_file_paths
-            }
-
-            url = f"{self.settings['metadata_url']}/organize-album"
-            req = Request(url,
-                         data=json.dumps(payload).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'})
-
-            with urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-
-                if result.get('success'):
-                    folder_path = result.get('folder_path', '')
-                    self.log(f"[ALBUM] Album organized: {folder_path}")
-                else:
-                    error = result.get('error', 'Unknown error')
-                    self.log(f"[ALBUM] Failed to organize album: {error}")
-
-        except Exception as e:
-            self.debug_log(f"[ALBUM] Error organizing album folder: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
-
-    def _process_album_metadata_and_organize(self, downloaded_tracks, search_info):
-        """Process metadata for all tracks, then organize into album folder."""
-        try:
-            self.log(f"[ALBUM-META] Starting batch processing...")
-            self._process_album_metadata_batch(downloaded_tracks, search_info)
-            self.log(f"[ALBUM-META] Batch processing complete, organizing folder...")
-        except Exception as e:
-            self.log(f"[ALBUM-META] Error during metadata processing: {e}")
-            import traceback
-            self.log(f"[ALBUM-META] Traceback: {traceback.format_exc()}")
-            self.log(f"[ALBUM-META] Continuing to organize files despite errors...")
-
-        # CRITICAL: Always organize folder, even if metadata processing failed
-        # This ensures files are moved into album folder regardless of server crashes
-        try:
-            self._organize_album_folder(downloaded_tracks, search_info)
-        except Exception as e:
-            self.debug_log(f"[ALBUM] Error organizing album folder: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
-
-    def download_finished_notification(self, user, virtual_path, real_path):
-        """
-        Called when a download completes successfully.
-
-        Args:
-            user: Username who shared the file
-            virtual_path: Network path of file
-            real_path: Local filesystem path where file was saved
-        """
-        try:
-            # CRITICAL: Use the same key format as we stored: username + virtual_path
-            transfer_key = user + virtual_path
+            # CRITICAL: Use the same key format as we stored: username + virtual_path
+            transfer_key = user + virtual_path
 
             # Check if this download is tracked
             if transfer_key not in self.active_downloads:
+                # A cancelled race/cascade loser finished before its abort landed - discard it
+                cancelled = self._cancelled_heads.pop(transfer_key, None)
+                if cancelled is not None:
+                    tag = cancelled[0]
+                    try:
+                        if os.path.exists(real_path):
+                            os.remove(real_path)
+                            self.log(f"[{tag}] Deleted losing download: {os.path.basename(real_path)}")
+                    except Exception as e:
+                        self.debug_log(f"[{tag}] Failed to delete losing file: {e}")
                 return
 
             # Get search token and metadata
@@ -2489,12 +3113,11 @@ class Plugin(BasePlugin):
                     self.log(f"[RACE] HEAD{head_num} finished but race already won by HEAD{search_info.get('race_winner', '?')} - discarding this download")
 
                     # Remove from tracking
-                    if transfer_key in self.active_downloads:
-                        del self.active_downloads[transfer_key]
+                    with self._downloads_lock:
+                        self.active_downloads.pop(transfer_key, None)
 
                     # Delete the downloaded file (loser)
                     try:
-                        import os
                         if os.path.exists(real_path):
                             os.remove(real_path)
                             self.log(f"[RACE] Deleted losing download: {os.path.basename(real_path)}")
@@ -2512,21 +3135,17 @@ class Plugin(BasePlugin):
                 # If cascade_winner is set, another head already claimed victory
                 if search_info.get('cascade_winner'):
                     # Find which head number this is
-                    head_num = 0
-                    for cascade_head in search_info.get('cascade_heads', []):
-                        if cascade_head['transfer_key'] == transfer_key:
-                            head_num = cascade_head['index'] + 1
-                            break
+                    cascade_head = search_info.get('cascade_heads_by_key', {}).get(transfer_key)
+                    head_num = cascade_head.index + 1 if cascade_head else 0
 
                     self.log(f"[CASCADE] HEAD{head_num} finished but race already won by HEAD{search_info.get('cascade_winner', '?')} - discarding this download")
 
                     # Remove from tracking
-                    if transfer_key in self.active_downloads:
-                        del self.active_downloads[transfer_key]
+                    with self._downloads_lock:
+                        self.active_downloads.pop(transfer_key, None)
 
                     # Delete the downloaded file (loser)
                     try:
-                        import os
                         if os.path.exists(real_path):
                             os.remove(real_path)
                             self.log(f"[CASCADE] Deleted losing download: {os.path.basename(real_path)}")
@@ -2536,20 +3155,14 @@ class Plugin(BasePlugin):
                     return  # Don't process this download further
 
                 # Find which head won (determine index)
-                winning_head_index = -1
-                winning_score = 0
-                for cascade_head in search_info.get('cascade_heads', []):
-                    if cascade_head['transfer_key'] == transfer_key:
-                        winning_head_index = cascade_head['index']
-                        winning_score = cascade_head['score']
-                        break
+                winning_head = search_info.get('cascade_heads_by_key', {}).get(transfer_key)
+                winning_head_index = winning_head.index if winning_head else -1
 
                 # Mark this head as the winner immediately (claim victory)
                 search_info['cascade_winner'] = winning_head_index + 1
 
             # Send final 100% progress update before completion event
             track_id_safe = search_info.get('track_id', '') or f"{search_info.get('artist', '')}-{search_info.get('track', '')}".replace(' ', '')[:20]
-            import os
             filename = os.path.basename(real_path)
 
             # Format COMPLETE message
@@ -2565,118 +3178,28 @@ class Plugin(BasePlugin):
                 head_num = search_info.get('head_number', 1)
             elif search_info.get('cascade_mode'):
                 # Find which cascade head this is
-                for cascade_head in search_info.get('cascade_heads', []):
-                    if cascade_head['transfer_key'] == transfer_key:
-                        head_num = cascade_head['index'] + 1
-                        break
+                cascade_head = search_info.get('cascade_heads_by_key', {}).get(transfer_key)
+                if cascade_head:
+                    head_num = cascade_head.index + 1
 
             # Send 100% progress to show completion in progress bar
             self._send_progress_update(track_id_safe, filename, 100, 0, 0, artist, track, album, real_path, image_url)
             self.log(f"░░░░░▒▒▒▒▒▓▓▓▓▓ HEAD{head_num} COMPLETE ____ {track_display}")
 
             # Remove from active tracking NOW so monitoring thread stops tracking it
-            if transfer_key in self.active_downloads:
-                del self.active_downloads[transfer_key]
-                self.debug_log(f"[PROGRESS] Removed from tracking: {filename[:40]}")
+            with self._downloads_lock:
+                removed = self.active_downloads.pop(transfer_key, None) is not None
+            if removed:
+                self.debug_logf("[PROGRESS] Removed from tracking: %.40s", filename)
 
-            # RACE MODE CLEANUP: Abort all other racing downloads when one wins
+            # Abort/cancel the heads that lost (race, cascade or legacy fallback candidates)
             if search_info.get('race_mode'):
-                race_heads = search_info.get('race_heads', [])
-                winning_head = search_info.get('current_attempt', -1)
-
-                self.log(f"[RACE] HEAD{winning_head + 1} WON (score: {search_info.get('head_score', 0)}) - Aborting {len(race_heads) - 1} other racing downloads...")
-                aborted_count = 0
-
-                for race_head in race_heads:
-                    # Skip the winner
-                    if race_head['index'] == winning_head:
-                        continue
-
-                    # Abort this racing head immediately
-                    other_key = race_head['transfer_key']
-                    if other_key in self.active_downloads:
-                        self.log(f"[RACE] Aborting HEAD{race_head['index'] + 1} (score: {race_head['score']})")
-                        if self._abort_transfer_by_path(
-                            race_head['virtual_path'],
-                            race_head['username'],
-                            remove_from_tracking=True
-                        ):
-                            aborted_count += 1
-
-                if aborted_count > 0:
-                    self.log(f"[RACE] ✓ Aborted {aborted_count} losing download(s), winner proceeds to metadata processing")
-
-                # Clear race mode and winner flag
-                search_info['race_mode'] = False
-                search_info['race_heads'] = []
-                search_info['race_winner'] = None
-
-            # CASCADE MODE CLEANUP: Abort all other cascade downloads when one wins
+                mode = 'race'
             elif search_info.get('cascade_mode'):
-                cascade_heads = search_info.get('cascade_heads', [])
-                winning_head_index = -1
-                winning_score = 0
-
-                # Find the winning head
-                for cascade_head in cascade_heads:
-                    if cascade_head['transfer_key'] == transfer_key:
-                        winning_head_index = cascade_head['index']
-                        winning_score = cascade_head['score']
-                        break
-
-                self.log(f"[CASCADE] HEAD{winning_head_index + 1} WON (score: {winning_score}) - Aborting {len(cascade_heads) - 1} other cascade downloads...")
-                aborted_count = 0
-
-                for cascade_head in cascade_heads:
-                    # Skip the winner
-                    if cascade_head['index'] == winning_head_index:
-                        continue
-
-                    # Abort this cascade head immediately
-                    other_key = cascade_head['transfer_key']
-                    if other_key in self.active_downloads:
-                        self.log(f"[CASCADE] Aborting HEAD{cascade_head['index'] + 1} (score: {cascade_head['score']})")
-                        if self._abort_transfer_by_path(
-                            cascade_head['virtual_path'],
-                            cascade_head['username'],
-                            remove_from_tracking=True
-                        ):
-                            aborted_count += 1
-
-                if aborted_count > 0:
-                    self.log(f"[CASCADE] ✓ Aborted {aborted_count} losing download(s), winner proceeds to metadata processing")
-
-                # Clear cascade mode and winner flag
-                search_info['cascade_mode'] = False
-                search_info['cascade_heads'] = []
-                search_info['cascade_winner'] = None
-
-            # FALLBACK CLEANUP: For non-race/cascade mode, abort other candidates (legacy retry logic)
-            elif len(search_info.get('download_candidates', [])) > 1:
-                candidates = search_info.get('download_candidates', [])
-                current_attempt = search_info.get('current_attempt', 0)
-
-                self.debug_log(f"[CLEANUP] Download succeeded (HEAD{current_attempt + 1}), aborting other attempts...")
-                aborted_count = 0
-
-                for i, candidate in enumerate(candidates):
-                    # Skip the successful download
-                    if i == current_attempt:
-                        continue
-
-                    # Abort other attempts
-                    other_virtual_path = candidate['file']
-                    other_username = candidate['user']
-
-                    # Check if this download is still active
-                    other_transfer_key = other_username + other_virtual_path
-                    if other_transfer_key in self.active_downloads:
-                        self.debug_log(f"[CLEANUP] Aborting HEAD{i + 1}: {other_virtual_path[:60]}")
-                        if self._abort_transfer_by_path(other_virtual_path, other_username, remove_from_tracking=True):
-                            aborted_count += 1
-
-                if aborted_count > 0:
-                    self.log(f"[CLEANUP] ✓ Aborted {aborted_count} parallel download(s)")
+                mode = 'cascade'
+            else:
+                mode = 'fallback'
+            self._cleanup_losers(search_info, transfer_key, _MODE_CONFIG[mode])
 
             # Send event to bridge for popup console
             self._send_event_to_bridge('success', f"Downloaded: {filename}", track_id_safe)
@@ -2692,29 +3215,99 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.log(f" Error in download_finished_notification: {e}")
-            import traceback
             self.log(f" Traceback: {traceback.format_exc()}")
 
+    def _cleanup_losers(self, search_info, transfer_key, mode_cfg):
+        """
+        Stop every download that lost to the completed transfer.
+
+        Race/cascade heads are cancelled through the shared cancel_event (the
+        progress monitor aborts them); fallback candidates are aborted directly.
+
+        Args:
+            search_info: Search metadata dict
+            transfer_key: Transfer key (username + virtual_path) of the winner
+            mode_cfg: Entry from _MODE_CONFIG describing the download mode
+        """
+        tag = mode_cfg['tag']
+
+        if mode_cfg['mode_key']:
+            heads_by_key = search_info.get(mode_cfg['index_key'], {})
+            winning_head = heads_by_key.get(transfer_key)
+            winning_head_index = winning_head.index if winning_head else search_info.get('current_attempt', -1)
+            winning_score = winning_head.score if winning_head else search_info.get('head_score', 0)
+
+            self.log(f"[{tag}] HEAD{winning_head_index + 1} WON (score: {winning_score}) - Cancelling {len(heads_by_key) - 1} other {mode_cfg['label']} downloads...")
+
+            # Cancel the race: known losers are untracked and aborted now, the progress monitor
+            # aborts any head it still finds registered (backstop)
+            self.racing_heads.pop(transfer_key, None)
+            search_info['cancel_winner_key'] = transfer_key
+            if 'cancel_event' in search_info:
+                search_info['cancel_event'].set()
+
+            losers = []
+            now = time.time()
+            for key, head in heads_by_key.items():
+                if key == transfer_key:
+                    continue
+                self.racing_heads.pop(key, None)
+                with self._downloads_lock:
+                    tracked = self.active_downloads.pop(key, None) is not None
+                if tracked:
+                    # A loser that finishes before its abort lands is deleted by download_finished_notification
+                    self._cancelled_heads[key] = (tag, now)
+                    self.log(f"[{tag}] Aborting HEAD{head.index + 1} (score: {head.score})")
+                    losers.append((head.virtual_path, head.username))
+            self._queue_aborts(losers)
+
+            # Clear mode and winner flag
+            search_info[mode_cfg['mode_key']] = False
+            search_info[mode_cfg['list_key']] = []
+            search_info[mode_cfg['index_key']] = {}
+            search_info[mode_cfg['winner_key']] = None
+            return
+
+        # FALLBACK: abort other candidates (legacy retry logic)
+        candidates = search_info.get('download_candidates', [])
+        if len(candidates) <= 1:
+            return
+
+        current_attempt = search_info.get('current_attempt', 0)
+        self.debug_logf("[%s] Download succeeded (HEAD%d), aborting other attempts...", tag, current_attempt + 1)
+        losers = []
+
+        for i, candidate in enumerate(candidates):
+            # Skip the successful download
+            if i == current_attempt:
+                continue
+
+            # Only abort downloads that are still active
+            other_transfer_key = candidate['user'] + candidate['file']
+            with self._downloads_lock:
+                record = self.active_downloads.pop(other_transfer_key, None)
+            if record is not None:
+                self.debug_logf("[%s] Aborting HEAD%d: %.60s", tag, i + 1, candidate['file'])
+                losers.append((candidate['file'], candidate['user']))
+
+        queued_count = self._queue_aborts(losers)
+
+        if queued_count > 0:
+            self.log(f"[{tag}] ✓ Queued {queued_count} parallel download(s) for abort")
+
     def _handle_track_completion(self, token, search_info, virtual_path, real_path):
         """Handle completion of a single track download."""
         # Debug: Log the paths we received
-        self.debug_log(f"[META] Download complete - virtual_path: {virtual_path}")
-        self.debug_log(f"[META] Download complete - real_path: {real_path}")
+        self.debug_logf("[META] Download complete - virtual_path: %s", virtual_path)
+        self.debug_logf("[META] Download complete - real_path: %s", real_path)
 
         # Send event to bridge for popup console
-        import os
         filename = os.path.basename(real_path)
         track_id_safe = search_info.get('track_id', '') or f"{search_info.get('artist', '')}-{search_info.get('track', '')}".replace(' ', '')[:20]
         self._send_event_to_bridge('success', f"Download complete: {filename}", track_id_safe)
 
         # Process metadata in background thread to avoid blocking
-        from threading import Thread
-        thread = Thread(
-            target=self._process_downloaded_file,
-            args=(real_path, search_info),
-            daemon=True
-        )
-        thread.start()
+        self._metadata_pool.submit(self._process_downloaded_file, real_path, search_info)
 
         # IMPORTANT: Don't delete from active_downloads immediately!
         # Let the progress monitoring thread detect completion and clean up after showing 100%
@@ -2725,7 +3318,7 @@ class Plugin(BasePlugin):
     def _handle_album_track_completion(self, token, search_info, virtual_path, real_path):
         """
         Handle completion of an album track download.
-        CRITICAL: Process metadata and move to folder IMMEDIATELY (not batched)
+        Runs on the Nicotine+ event thread - folder creation and metadata are handed to the metadata pool.
         """
         current_index = search_info['current_track_index']
         tracks_to_download = search_info['tracks_to_download']
@@ -2739,32 +3332,27 @@ class Plugin(BasePlugin):
             # IMPROVED: Increment completed track count for cumulative progress calculation
             search_info['completed_track_count'] = search_info.get('completed_track_count', 0) + 1
 
+            # Record the local path (renamed in place once its metadata has been processed)
+            downloaded_tracks = search_info.setdefault('downloaded_tracks', [])
+            search_info.setdefault('downloaded_track_index', {})[real_path] = len(downloaded_tracks)
+            downloaded_tracks.append(real_path)
+
             # CRITICAL: Create album folder after first track downloads (not before)
             # This way we can extract the download directory from the actual download path
             if not search_info.get('album_folder_created', False):
-                import os
                 download_dir = os.path.dirname(real_path)
                 self.log(f"[ALBUM] Extracted download directory from first track: {download_dir}")
 
-                album_folder = self._ensure_album_folder(search_info, download_dir)
-                if album_folder:
-                    search_info['album_folder_path'] = album_folder
-                    search_info['album_folder_created'] = True
-                    self.log(f"[ALBUM] Album folder created: {os.path.basename(album_folder)}")
-                else:
-                    self.log(f"[ALBUM] Could not create album folder, continuing anyway...")
-                    search_info['album_folder_created'] = True  # Mark as attempted to avoid retries
-
-            # CRITICAL CHANGE: Process metadata and move to folder IMMEDIATELY
-            # Don't wait for all downloads to complete - process each track right away
-            # This prevents batch processing pile-up that causes server crashes
-            from threading import Thread
-            thread = Thread(
-                target=self._process_track_immediately,
-                args=(real_path, track_info, token, current_index, search_info),
-                daemon=True
-            )
-            thread.start()
+                # Created on the metadata pool so the event thread never waits on the metadata worker
+                # Batches resolve the folder through this future before sending their tracks
+                search_info['album_folder_created'] = True  # Mark as attempted to avoid retries
+                search_info['album_folder_future'] = self._metadata_pool.submit(
+                    self._create_album_folder, search_info, download_dir
+                )
+
+            # Queue metadata + move for a batched request (flushed every few tracks or after a short wait)
+            # The server tags batched tracks one at a time, so batches can't cause the old pile-up crashes
+            self._queue_album_track_metadata(token, search_info, real_path, track_info, current_index)
 
         # IMPORTANT: Don't delete from active_downloads immediately!
         # Let progress monitoring thread show 100% completion before cleanup
@@ -2774,133 +3362,287 @@ class Plugin(BasePlugin):
         search_info['current_track_index'] += 1
         self._download_next_album_track(token, search_info)
 
-    def _process_track_immediately(self, real_path, track_info, token, track_index, search_info):
+    def _rename_downloaded_track(self, search_info, old_path, new_path):
         """
-        Process a single track immediately after download (not batched).
-        CRITICAL: This is the new approach that prevents batch processing pile-up.
+        Replace a track's path in downloaded_tracks after the metadata worker renamed/moved it.
+
+        Args:
+            search_info: Album search metadata dict
+            old_path: Path the track was recorded under
+            new_path: Renamed/moved path
+
+        Returns:
+            True if the track was found and updated
         """
-        try:
-            import time
-            import os
+        track_index = search_info.get('downloaded_track_index', {})
+        i = track_index.pop(old_path, None)
+        if i is None:
+            return False
+        search_info['downloaded_tracks'][i] = new_path
+        track_index[new_path] = i
+        return True
 
-            # Wait a moment for file to be fully written
-            time.sleep(1)
+    def _create_album_folder(self, search_info, download_dir):
+        """
+        Create the album folder on the metadata pool and record its path in search_info.
 
-            # Verify file exists
-            if not os.path.exists(real_path):
-                self.log(f"[ALBUM] File not found: {real_path}")
-                return
+        Args:
+            search_info: Album search metadata dict
+            download_dir: Download directory extracted from the first track
+        """
+        album_folder = self._ensure_album_folder(search_info, download_dir)
+        if album_folder:
+            search_info['album_folder_path'] = album_folder
+            self.log(f"[ALBUM] Album folder created: {os.path.basename(album_folder)}")
+        else:
+            self.log(f"[ALBUM] Could not create album folder, continuing anyway...")
+        return album_folder
 
-            # Check if file is MP3 or FLAC
-            file_lower = real_path.lower()
-            if not (file_lower.endswith('.mp3') or file_lower.endswith('.flac')):
-                self.log(f"[ALBUM] Unsupported format, skipping metadata: {real_path}")
-                return
+    def _wait_album_folder(self, search_info, timeout=15):
+        """
+        Return the album folder path, waiting for a pending folder creation to finish.
 
-            # Get album folder path (created after first download)
-            album_folder_path = search_info.get('album_folder_path')
-            if not album_folder_path:
-                self.log(f"[ALBUM] No album folder path, processing without move")
-            else:
-                self.log(f"[ALBUM] Album folder: {os.path.basename(album_folder_path)}")
+        Args:
+            search_info: Album search metadata dict
+            timeout: Max seconds to wait for the folder request
+        """
+        future = search_info.get('album_folder_future')
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                self.debug_log(f"[ALBUM] Album folder not ready: {e}")
+        return search_info.get('album_folder_path')
 
-            self.log(f"[ALBUM] Processing track {track_index + 1} metadata...")
+    def _queue_album_track_metadata(self, token, search_info, real_path, track_info, track_index):
+        """
+        Queue a downloaded album track for the next /process-metadata-batch request.
 
-            # Process metadata with album folder as target (will rename AND move)
-            success, new_path = self._process_single_track_metadata(
-                real_path,
-                track_info,
-                token,
-                track_index,
-                target_folder=album_folder_path
-            )
+        Args:
+            token: Album search token
+            search_info: Album search metadata dict
+            real_path: Local path of the downloaded file
+            track_info: Track metadata dict
+            track_index: Track index in album
+        """
+        # Target folder is filled in by the batch once the album folder request has finished
+        payload = self._build_track_payload(real_path, track_info, token)
 
-            if success:
-                if album_folder_path:
-                    self.log(f"[ALBUM] Track {track_index + 1} moved to album: {os.path.basename(new_path)}")
-                else:
-                    self.log(f"[ALBUM] Track {track_index + 1} complete: {os.path.basename(new_path)}")
-            else:
-                self.log(f"[ALBUM] Track {track_index + 1} failed metadata processing")
+        with self._album_meta_lock:
+            pending = self._album_meta_queue.setdefault(token, [])
+            if not pending:
+                self._album_meta_queued_at[token] = time.monotonic()
+            pending.append((track_index, track_info, payload, search_info))
 
-        except Exception as e:
-            self.debug_log(f"[ALBUM] Error processing track {track_index + 1} immediately: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+        self._flush_album_meta(token)
 
-    def _process_album_metadata_batch_safe(self, downloaded_tracks, search_info):
+    def _flush_album_meta(self, token, force=False):
         """
-        Safe wrapper for batch metadata processing with comprehensive error handling.
+        Submit an album's queued tracks to the metadata pool as one batch.
+
+        Args:
+            token: Album search token
+            force: Flush regardless of batch size/age (album finished)
         """
-        try:
-            self._process_album_metadata_batch(downloaded_tracks, search_info)
-        except Exception as e:
-            self.log(f"[ALBUM-META] FATAL ERROR in batch processing: {e}")
-            import traceback
-            self.log(f"[ALBUM-META] Traceback: {traceback.format_exc()}")
+        with self._album_meta_lock:
+            items = self._album_meta_queue.get(token)
+            if not items:
+                return
+            age = time.monotonic() - self._album_meta_queued_at.get(token, 0)
+            if not force and len(items) < _ALBUM_META_BATCH_SIZE and age < _ALBUM_META_FLUSH_INTERVAL:
+                return
+            del self._album_meta_queue[token]
+            self._album_meta_queued_at.pop(token, None)
+
+        self._metadata_pool.submit(self._process_album_track_batch, token, items)
+
+    def _flush_due_album_meta(self):
+        """Flush every album whose queued tracks have waited long enough (called from the poll loop)."""
+        with self._album_meta_lock:
+            tokens = list(self._album_meta_queue)
+        for token in tokens:
+            self._flush_album_meta(token)
 
-    def _process_album_metadata_batch(self, downloaded_tracks, search_info):
+    def _process_album_track_batch(self, token, items):
         """
-        Process metadata for all album tracks in sequence.
-        IMPROVED: Uses prefetched metadata cache to eliminate wait time and reduce server load.
+        Process metadata for a batch of downloaded album tracks with one request.
+        Tracks the batch could not process are retried one by one (with crash recovery).
 
-        Updates the downloaded_tracks list with renamed file paths.
+        Args:
+            token: Album search token
+            items: List of (track_index, track_info, payload, search_info) tuples
         """
-        import time
+        try:
+            search_info = items[0][3]
+            target_folder = self._wait_album_folder(search_info)
+
+            ready = []
+            for track_index, track_info, payload, _ in items:
+                if target_folder:
+                    payload['targetFolder'] = target_folder  # camelCase for Node.js
+                # Queued from download_finished_notification, so the file is already complete
+                file_path = payload['filePath']
+
+                if not os.path.exists(file_path):
+                    self.log(f"[ALBUM] File not found: {file_path}")
+                    continue
 
-        total_tracks = len(downloaded_tracks)
-        successful = 0
-        failed = 0
-        token = search_info.get('token', '')
+                if os.path.splitext(file_path)[1].lower() not in _SUPPORTED_EXTS:
+                    self.log(f"[ALBUM] Unsupported format, skipping metadata: {file_path}")
+                    continue
 
-        self.log(f"[ALBUM-META] Starting batch of {total_tracks} tracks...")
+                ready.append((track_index, track_info, payload))
 
-        for i, track_data in enumerate(downloaded_tracks):
-            try:
-                file_path = track_data['file_path']
-                track_info = track_data['track_info']
-            except (KeyError, TypeError) as e:
-                self.log(f"[ALBUM-META] Invalid track data at index {i}: {e}")
-                failed += 1
-                continue
+            if not ready:
+                return
+
+            self.log(f"[ALBUM] Processing metadata for {len(ready)} track(s)...")
 
+            results = []
             try:
-                self.log(f"[ALBUM-META] Processing {i + 1}/{total_tracks}: {track_info.get('track', 'Unknown')}")
+                _, body = self._meta_request('POST', '/process-metadata-batch',
+                                             {'items': [payload for _, _, payload in ready]}, timeout=60)
+                response = _jloads(body)
+                self._meta_pending_jobs = response.get('pending_jobs', 0)
+                results = response.get('results') or []
+            except Exception as e:
+                self.log(f"[ALBUM] Batch request failed, falling back to per-track: {e}")
 
-                # Process this track's metadata with prefetched cache
-                success, new_path = self._process_single_track_metadata(file_path, track_info, token, i)
+            for n, (track_index, track_info, payload) in enumerate(ready):
+                result = results[n] if n < len(results) else {}
+
+                if result.get('success'):
+                    success, new_path = True, result.get('new_path', payload['filePath'])
+                else:
+                    success, new_path = self._process_single_track_metadata(
+                        payload['filePath'], track_info, token, track_index, target_folder=target_folder
+                    )
+                    # Back off before the next track only while the worker's background jobs pile up
+                    pending_jobs = self._meta_pending_jobs
+                    if n < len(ready) - 1 and pending_jobs > _META_BACKLOG_THRESHOLD:
+                        time.sleep(min(2, 0.2 * pending_jobs))
 
                 if success:
-                    successful += 1
-                    # Update the file path in downloaded_tracks with the renamed path
-                    track_data['file_path'] = new_path
-                    self.log(f"[ALBUM-META] Track {i + 1}/{total_tracks} complete")
+                    self._rename_downloaded_track(search_info, payload['filePath'], new_path)
+                    new_name = os.path.basename(new_path)
+                    if target_folder:
+                        self.log(f"[ALBUM] Track {track_index + 1} moved to album: {new_name}")
+                    else:
+                        self.log(f"[ALBUM] Track {track_index + 1} complete: {new_name}")
                 else:
-                    failed += 1
-                    self.log(f"[ALBUM-META] Track {i + 1}/{total_tracks} failed")
+                    self.log(f"[ALBUM] Track {track_index + 1} failed metadata processing")
 
-                # CRITICAL: Add delay between tracks to prevent server overload
-                # The server does background work (cover download, tag writing) that takes time
-                # Processing tracks too quickly causes concurrent background jobs to pile up
-                if i < total_tracks - 1:
-                    time.sleep(2)  # 2 second delay to let server finish background work
+        except Exception as e:
+            self.debug_log(f"[ALBUM] Error processing album track batch: {e}")
+            self._debug_traceback("[ALBUM] Traceback:")
 
-            except Exception as e:
-                self.log(f"[ALBUM-META] Exception processing track {i + 1}: {e}")
-                import traceback
-                self.log(f"[ALBUM-META] Traceback: {traceback.format_exc()}")
-                failed += 1
-                # Continue with next track even on error
-
-        self.log(f"[ALBUM-META] Batch complete: {successful} succeeded, {failed} failed")
-
-        # Cleanup: Remove cached metadata for this album
-        if token:
-            keys_to_remove = [k for k in self.metadata_cache.keys() if k[0] == token]
-            for key in keys_to_remove:
-                del self.metadata_cache[key]
-            if keys_to_remove:
-                self.log(f"[ALBUM-META] Cleaned up {len(keys_to_remove)} cached metadata entries")
+    def _get_cached_album_metadata(self, token):
+        """
+        Get prefetched album metadata from the cache (None if missing or expired).
+
+        Args:
+            token: Search token of the album
+        """
+        if token is None:
+            return None
+
+        cache_key = (token, 'album')
+        with self._metadata_cache_lock:
+            cached_entry = self.metadata_cache.get(cache_key)
+            if not cached_entry:
+                return None
+
+            # Check if cache entry is still valid
+            age = time.monotonic() - cached_entry.get('timestamp', 0)
+            if age < self.metadata_cache_max_age:
+                self.metadata_cache.move_to_end(cache_key)
+                album_metadata = cached_entry.get('data')
+            else:
+                # Expired, remove it
+                self._drop_cached_metadata(cache_key)
+                album_metadata = None
+
+        if album_metadata is None:
+            self.log(f"[ALBUM-META]   Cached metadata expired (age={int(age)}s)")
+            return None
+
+        self.log(f"[ALBUM-META]   Using cached album metadata (year={album_metadata.get('year', 'N/A')})")
+        return album_metadata
+
+    def _cache_metadata(self, cache_key, data):
+        """
+        Store metadata in the cache and index it by token.
+
+        Args:
+            cache_key: (token, kind) tuple
+            data: Metadata dict to cache
+        """
+        with self._metadata_cache_lock:
+            if cache_key in self.metadata_cache:
+                self.metadata_cache.move_to_end(cache_key)
+            else:
+                # LRU eviction: drop the least recently used entries to stay within the size limit
+                while len(self.metadata_cache) >= self.metadata_cache_max_size:
+                    self._drop_cached_metadata(next(iter(self.metadata_cache)))
+                self._cache_by_token.setdefault(cache_key[0], []).append(cache_key)
+            self.metadata_cache[cache_key] = {
+                'data': data,
+                'timestamp': time.monotonic()
+            }
+
+    def _drop_cached_metadata(self, cache_key):
+        """Remove a metadata cache entry and its token index reference."""
+        with self._metadata_cache_lock:
+            self.metadata_cache.pop(cache_key, None)
+            keys = self._cache_by_token.get(cache_key[0])
+            if keys and cache_key in keys:
+                keys.remove(cache_key)
+                if not keys:
+                    del self._cache_by_token[cache_key[0]]
+
+    def _build_track_payload(self, file_path, track_info, token=None, target_folder=None):
+        """
+        Build the /process-metadata payload for one track.
+
+        Args:
+            file_path: Path to the downloaded file
+            track_info: Track metadata dict
+            token: Search token (optional, for album fields and cache lookup)
+            target_folder: Target folder to move file to after processing (optional)
+
+        Returns:
+            Payload dict (camelCase keys for Node.js)
+        """
+        # Start from the album's shared fields (album, prefetched year/cover) when the album is active
+        payload = self._album_static_payload.get(token, {}).copy()
+
+        # Prepare request data with track number (using camelCase for Node.js)
+        payload.update({
+            'filePath': file_path,  # camelCase for Node.js
+            'artist': track_info.get('artist', ''),
+            'track': track_info.get('track', ''),
+            'trackId': track_info.get('track_id', ''),  # camelCase for Node.js
+            'trackNumber': track_info.get('track_number', 0),  # camelCase for Node.js
+            'headNumber': track_info.get('head_number', 1),  # camelCase for Node.js
+            'headScore': track_info.get('head_score', 0)  # camelCase for Node.js
+        })
+        if 'album' not in payload:
+            payload['album'] = track_info.get('album', '')
+
+        # IMPROVED: Fall back to prefetched ALBUM metadata in cache (with TTL check)
+        if 'prefetchedYear' not in payload:
+            album_metadata = self._get_cached_album_metadata(token)
+
+            # Add prefetched album metadata if available (server will skip Spotify page fetch)
+            if album_metadata:
+                payload['prefetchedYear'] = album_metadata.get('year', '')  # camelCase for Node.js
+                payload['prefetchedImageUrl'] = album_metadata.get('image_url', '')  # camelCase for Node.js
+
+        # Add target folder if specified (server will move file after processing)
+        if target_folder:
+            payload['targetFolder'] = target_folder  # camelCase for Node.js
+
+        return payload
 
     def _process_single_track_metadata(self, file_path, track_info, token=None, track_index=None, target_folder=None):
         """
@@ -2921,673 +3663,482 @@ class Plugin(BasePlugin):
             - new_path: The renamed/moved file path if successful, otherwise original path
         """
         try:
-            from urllib.request import urlopen, Request
-            from urllib.error import URLError
-            import json
-            import os
-            import time
-
             # Verify file exists and is MP3
             if not os.path.exists(file_path):
                 self.log(f"[ALBUM-META] File not found: {file_path}")
                 return (False, file_path)
 
             # Check if file is MP3 or FLAC
-            file_lower = file_path.lower()
-            if not (file_lower.endswith('.mp3') or file_lower.endswith('.flac')):
+            if os.path.splitext(file_path)[1].lower() not in _SUPPORTED_EXTS:
                 self.log(f"[ALBUM-META] Unsupported format (only MP3/FLAC), skipping: {file_path}")
                 return (False, file_path)
 
-            # IMPROVED: Check if we have prefetched ALBUM metadata in cache (with TTL check)
-            album_metadata = None
-            if token is not None:
-                cache_key = (token, 'album')
-                cached_entry = self.metadata_cache.get(cache_key)
-                if cached_entry:
-                    # Check if cache entry is still valid
-                    age = time.time() - cached_entry.get('timestamp', 0)
-                    if age < self.metadata_cache_max_age:
-                        album_metadata = cached_entry.get('data')
-                        self.log(f"[ALBUM-META]   Using cached album metadata (year={album_metadata.get('year', 'N/A')})")
-                    else:
-                        # Expired, remove it
-                        del self.metadata_cache[cache_key]
-                        self.log(f"[ALBUM-META]   Cached metadata expired (age={int(age)}s)")
-
-            # Prepare request data with track number and prefetched album metadata (using camelCase for Node.js)
-            payload = {
-                'filePath': file_path,  # camelCase for Node.js
-                'artist': track_info.get('artist', ''),
-                'track': track_info.get('track', ''),
-                'album': track_info.get('album', ''),
-                'trackId': track_info.get('track_id', ''),  # camelCase for Node.js
-                'trackNumber': track_info.get('track_number', 0),  # camelCase for Node.js
-                'headNumber': track_info.get('head_number', 1),  # camelCase for Node.js
-                'headScore': track_info.get('head_score', 0)  # camelCase for Node.js
-            }
-
-            # Add prefetched album metadata if available (server will skip Spotify page fetch)
-            if album_metadata:
-                payload['prefetchedYear'] = album_metadata.get('year', '')  # camelCase for Node.js
-                payload['prefetchedImageUrl'] = album_metadata.get('image_url', '')  # camelCase for Node.js
-
-            # Add target folder if specified (server will move file after processing)
-            if target_folder:
-                payload['targetFolder'] = target_folder  # camelCase for Node.js
+            payload = self._build_track_payload(file_path, track_info, token, target_folder)
 
             # Send to Metadata Worker with REDUCED timeout (server responds immediately now)
-            url = f"{self.settings['metadata_url']}/process-metadata"
-            req = Request(url,
-                         data=json.dumps(payload).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'})
-
             # CRITICAL FIX: Timeout reduced to 15s (server replies after rename, not after full processing)
-            with urlopen(req, timeout=15) as response:
-                result = json.loads(response.read().decode('utf-8'))
-
-                if result.get('success'):
-                    new_path = result.get('new_path', file_path)
-                    if result.get('renamed'):
-                        # Format FINISHED message for album tracks
-                        artist = track_info.get('artist', '')
-                        track_name = track_info.get('track', '')
-                        track_display = f"{artist} - {track_name}"
-                        head_num = track_info.get('head_number', 1)
-                        self.log(f"▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD{head_num} FINISHED  ____ {track_display}        ^~~~~~~<:===<")
-                    return (True, new_path)
-                else:
-                    self.log(f"[ALBUM-META]   Failed: {result.get('error', 'Unknown error')}")
-                    return (False, file_path)
-
-        except URLError as e:
-            error_msg = str(e).lower()
-            error_repr = repr(e).lower()
+            status, body = self._meta_request('POST', '/process-metadata', payload, timeout=15)
+            result = _jloads(body)
+            self._meta_pending_jobs = result.get('pending_jobs', 0)
+
+            if result.get('success'):
+                new_path = result.get('new_path', file_path)
+                if result.get('renamed'):
+                    # Format FINISHED message for album tracks
+                    artist = track_info.get('artist', '')
+                    track_name = track_info.get('track', '')
+                    track_display = f"{artist} - {track_name}"
+                    head_num = track_info.get('head_number', 1)
+                    self.log(f"▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD{head_num} FINISHED  ____ {track_display}        ^~~~~~~<:===<")
+                return (True, new_path)
+            else:
+                self.log(f"[ALBUM-META]   Failed: {result.get('error', 'Unknown error')}")
+                return (False, file_path)
 
+        except Exception as e:
             # Check if this is a server crash (connection refused/reset)
-            is_crash = any(x in error_msg or x in error_repr for x in [
-                'connection refused', 'connection reset', 'forcibly closed',
-                'cannot connect', 'connection aborted', 'winerror 10054', '10054'
-            ])
+            is_crash = self._is_server_crash(e)
 
-            # Check if this is a timeout (might mean server is stuck)
-            is_timeout = 'timed out' in error_msg
-
-            # If timeout, check if server is still alive
-            if is_timeout and not is_crash:
+            # If timeout, check if server is still alive (might mean server is stuck)
+            if not is_crash and 'timed out' in str(e).lower():
                 self.log(f"[ALBUM-META] Timeout, checking metadata worker health...")
                 try:
-                    ping_url = f"{self.settings['metadata_url']}/ping"
-                    ping_req = Request(ping_url)
-                    with urlopen(ping_req, timeout=2) as ping_response:
-                        if ping_response.getcode() == 200:
-                            # Server is alive but slow - just fail this track
-                            self.log(f"[ALBUM-META] Server alive but slow, skipping track")
-                            return (False, file_path)
+                    status, _ = self._meta_request('GET', '/ping', timeout=2)
+                    if status == 200:
+                        # Server is alive but slow - just fail this track
+                        self.log(f"[ALBUM-META] Server alive but slow, skipping track")
+                        return (False, file_path)
                 except:
                     # Server not responding - treat as crash
                     self.log(f"[ALBUM-META] Server not responding after timeout")
                     is_crash = True
 
-            # If not a crash or stuck server, just fail
-            if not is_crash:
-                self.log(f"[ALBUM-META] Error: {e}")
-                return (False, file_path)
-
-            # Server crashed or stuck - wait for restart and retry
-            self.log(f"[ALBUM-META] Server restarting, will retry...")
-            max_wait = 30
-            for attempt in range(max_wait):
-                time.sleep(1)
-                try:
-                    # Try to ping the metadata worker
-                    ping_url = f"{self.settings['metadata_url']}/ping"
-                    ping_req = Request(ping_url)
-                    with urlopen(ping_req, timeout=2) as ping_response:
-                        if ping_response.getcode() == 200:
-                            self.log(f"[ALBUM-META] Metadata worker back online after {attempt + 1}s")
-                            time.sleep(2)  # Give server time to stabilize
-
-                            # Check if file was already renamed before the crash
-                            actual_file_path = file_path
-                            if not os.path.exists(file_path):
-                                # Try to find the renamed file
-                                dir_path = os.path.dirname(file_path)
-                                track_name = track_info.get('track', '')
-                                artist_name = track_info.get('artist', '')
-                                track_num = track_info.get('track_number', 0)
-
-                                possible_names = [
-                                    f"{track_num:02d} {artist_name} - {track_name}.mp3",
-                                    f"{track_num:02d} - {track_name}.mp3",
-                                    f"{track_num:02d} {track_name}.mp3"
-                                ]
-
-                                for possible_name in possible_names:
-                                    possible_path = os.path.join(dir_path, possible_name)
-                                    if os.path.exists(possible_path):
-                                        self.log(f"[ALBUM-META] File was already renamed to: {possible_name}")
-                                        actual_file_path = possible_path
-                                        break
-
-                            # Check if rename was successful
-                            if os.path.exists(actual_file_path) and actual_file_path != file_path:
-                                if artist_name and artist_name in os.path.basename(actual_file_path):
-                                    self.log(f"[ALBUM-META] Track was already processed before crash")
-                                    return (True, actual_file_path)
-                                else:
-                                    self.log(f"[ALBUM-META] File renamed but missing artist name, needs retry")
-
-                            # Retry the track
-                            self.log(f"[ALBUM-META] Retrying failed track: {os.path.basename(file_path)}")
-                            return self._process_single_track_metadata(file_path, track_info, token, track_index, target_folder)
-                except:
-                    pass  # Server not ready yet, continue waiting
-
-            # Server didn't come back online
-            self.log(f"[ALBUM-META] Server did not restart within {max_wait}s")
-            return (False, file_path)
-        except Exception as e:
-            error_msg = str(e).lower()
-            error_repr = repr(e).lower()
-            # Check if this is a server crash (connection refused/reset)
-            is_server_crash = any(x in error_msg or x in error_repr for x in [
-                'connection refused', 'connection reset', 'forcibly closed',
-                'cannot connect', 'connection aborted', 'winerror 10054', '10054'
-            ])
-
-            if is_server_crash:
-                self.log(f"[ALBUM-META] Server restarting, will retry...")
-
-                # Wait for server to restart (up to 30 seconds)
-                max_wait = 30
-                for attempt in range(max_wait):
-                    time.sleep(1)
-                    try:
-                        # Try to ping the metadata worker
-                        ping_url = f"{self.settings['metadata_url']}/ping"
-                        ping_req = Request(ping_url)
-                        with urlopen(ping_req, timeout=2) as ping_response:
-                            if ping_response.getcode() == 200:
-                                self.log(f"[ALBUM-META] Metadata worker back online after {attempt + 1}s")
-                                time.sleep(2)  # Give server time to stabilize
-
-                                # Check if file was already renamed before the crash
-                                # The server might have renamed the file before crashing
-                                actual_file_path = file_path
-                                if not os.path.exists(file_path):
-                                    # Try to find the renamed file (format: "NN Artist - Track.mp3")
-                                    dir_path = os.path.dirname(file_path)
-                                    track_name = track_info.get('track', '')
-                                    artist_name = track_info.get('artist', '')
-                                    track_num = track_info.get('track_number', 0)
-
-                                    # Try various possible renamed formats
-                                    possible_names = [
-                                        f"{track_num:02d} {artist_name} - {track_name}.mp3",
-                                        f"{track_num:02d} - {track_name}.mp3",
-                                        f"{track_num:02d} {track_name}.mp3"
-                                    ]
-
-                                    for possible_name in possible_names:
-                                        possible_path = os.path.join(dir_path, possible_name)
-                                        if os.path.exists(possible_path):
-                                            self.log(f"[ALBUM-META] File was already renamed to: {possible_name}")
-                                            actual_file_path = possible_path
-                                            break
-
-                                # If file exists AND was properly renamed with artist name, consider it successful
-                                # Only the first format includes the artist name, others are incomplete
-                                if os.path.exists(actual_file_path) and actual_file_path != file_path:
-                                    # Verify it has the correct format with artist name
-                                    if artist_name and artist_name in os.path.basename(actual_file_path):
-                                        self.log(f"[ALBUM-META] Track was already processed before crash")
-                                        return (True, actual_file_path)
-                                    else:
-                                        self.log(f"[ALBUM-META] File renamed but missing artist name, needs retry")
-                                        # Fall through to retry
-
-                                # File doesn't exist in any form, try retry
-                                self.log(f"[ALBUM-META] Retrying failed track: {os.path.basename(file_path)}")
-                                return self._process_single_track_metadata(file_path, track_info, token, track_index, target_folder)
-                    except:
-                        pass  # Server not ready yet, continue waiting
-
-                # Server didn't come back online
-                self.log(f"[ALBUM-META] Server did not restart within {max_wait}s")
-                return (False, file_path)
+            if is_crash:
+                return self._recover_from_metadata_server_crash(file_path, track_info, token, track_index, target_folder)
 
             # Not a crash, just a regular error
             self.log(f"[ALBUM-META] Error: {e}")
             return (False, file_path)
 
-    def _process_album_track_metadata(self, file_path, track_info, search_info):
-        """Process metadata for an album track with track number."""
-        try:
-            from urllib.request import urlopen, Request
-            from urllib.error import URLError
-            import json
-            import os
-
-            # Wait for file to be fully written
-            time.sleep(2)
-
-            self.log(f"[ALBUM-META] Starting processing for: {os.path.basename(file_path)}")
-            self.log(f"[ALBUM-META] Track #{track_info.get('track_number', 0)}: {track_info.get('track', '')}")
+    def _is_server_crash(self, e):
+        """Check whether an exception from a metadata worker call means the server crashed."""
+        return _CRASH_RE.search(f"{e}|{e!r}".lower()) is not None
 
-            # Verify file exists and is MP3
-            if not os.path.exists(file_path):
-                self.log(f"[ALBUM-META] File not found: {file_path}")
-                return
+    def _recover_from_metadata_server_crash(self, file_path, track_info, token, track_index, target_folder):
+        """
+        Wait for the metadata worker to come back after a crash, then retry the track.
 
-            # Check if file is MP3 or FLAC
-            file_lower = file_path.lower()
-            if not (file_lower.endswith('.mp3') or file_lower.endswith('.flac')):
-                self.log(f"[ALBUM-META] Unsupported format (only MP3/FLAC), skipping: {file_path}")
-                return
+        Args:
+            file_path: Path to the downloaded file
+            track_info: Track metadata dict
+            token: Search token (for cache lookup on retry)
+            track_index: Track index in album
+            target_folder: Target folder to move file to after processing
 
-            # IMPROVED: Check if we have prefetched ALBUM metadata in cache (with TTL check)
-            album_metadata = None
-            token = search_info.get('token')
-            if token is not None:
-                cache_key = (token, 'album')
-                cached_entry = self.metadata_cache.get(cache_key)
-                if cached_entry:
-                    # Check if cache entry is still valid
-                    age = time.time() - cached_entry.get('timestamp', 0)
-                    if age < self.metadata_cache_max_age:
-                        album_metadata = cached_entry.get('data')
-                        self.log(f"[ALBUM-META]   Using cached album metadata (year={album_metadata.get('year', 'N/A')})")
-                    else:
-                        # Expired, remove it
-                        del self.metadata_cache[cache_key]
-                        self.log(f"[ALBUM-META]   Cached metadata expired (age={int(age)}s)")
+        Returns:
+            Tuple of (success: bool, new_path: str), same as _process_single_track_metadata
+        """
+        # Server crashed or stuck - wait for the health monitor to see it come back, then retry
+        self.log(f"[ALBUM-META] Server restarting, will retry...")
+        max_wait = 30
+        wait_start = time.time()
+        self._mark_metadata_server_down()
+        if not self._server_alive.wait(timeout=max_wait):
+            # Server didn't come back online
+            self.log(f"[ALBUM-META] Server did not restart within {max_wait}s")
+            return (False, file_path)
 
-            # Prepare request data with track number (using camelCase for Node.js)
-            payload = {
-                'filePath': file_path,  # camelCase for Node.js
-                'artist': track_info.get('artist', ''),
-                'track': track_info.get('track', ''),
-                'album': track_info.get('album', ''),
-                'trackId': track_info.get('track_id', ''),  # camelCase for Node.js
-                'trackNumber': track_info.get('track_number', 0),  # camelCase for Node.js
-                'headNumber': search_info.get('head_number', 1),  # camelCase for Node.js
-                'headScore': search_info.get('head_score', 0)  # camelCase for Node.js
-            }
+        self.log(f"[ALBUM-META] Metadata worker back online after {time.time() - wait_start:.1f}s")
+        time.sleep(2)  # Give server time to stabilize
+
+        # Check if file was already renamed before the crash
+        # The server might have renamed the file before crashing
+        artist_name = track_info.get('artist', '')
+        if not os.path.exists(file_path):
+            # Try to find the renamed file (format: "NN Artist - Track.mp3")
+            dir_prefix = os.path.dirname(file_path) + os.sep
+            track_name = track_info.get('track', '')
+            track_num = track_info.get('track_number', 0)
+
+            # Try various possible renamed formats
+            # Only the first format includes the artist name, others are incomplete
+            candidates = (
+                f"{track_num:02d} {artist_name} - {track_name}.mp3",
+                f"{track_num:02d} - {track_name}.mp3",
+                f"{track_num:02d} {track_name}.mp3"
+            )
 
-            # Add prefetched album metadata if available (server will skip Spotify page fetch)
-            if album_metadata:
-                payload['prefetchedYear'] = album_metadata.get('year', '')  # camelCase for Node.js
-                payload['prefetchedImageUrl'] = album_metadata.get('image_url', '')  # camelCase for Node.js
+            for name in candidates:
+                possible_path = dir_prefix + name
+                if os.path.exists(possible_path):
+                    self.log(f"[ALBUM-META] File was already renamed to: {name}")
+                    # If file was properly renamed with artist name, consider it successful
+                    if artist_name and artist_name in name:
+                        self.log(f"[ALBUM-META] Track was already processed before crash")
+                        return (True, possible_path)
+                    self.log(f"[ALBUM-META] File renamed but missing artist name, needs retry")
+                    break
 
-            # Add target folder if specified (server will move file after processing)
-            target_folder = search_info.get('album_folder_path')
-            if target_folder:
-                payload['targetFolder'] = target_folder  # camelCase for Node.js
+        # File doesn't exist in any form, try retry
+        self.log(f"[ALBUM-META] Retrying failed track: {os.path.basename(file_path)}")
+        return self._process_single_track_metadata(file_path, track_info, token, track_index, target_folder)
 
-            self.debug_log(f"[ALBUM-META] Sending request to metadata server...")
+    def _check_album_first_track(self, token, search_info, stamp, vp_index, downloads):
+        """
+        EARLY VALIDATION: 15s after the first track was queued, switch folders if it isn't transferring.
 
-            # Send to Metadata Worker with shorter timeout to avoid blocking
-            url = f"{self.settings['metadata_url']}/process-metadata"
-            req = Request(url,
-                         data=json.dumps(payload).encode('utf-8'),
-                         headers={'Content-Type': 'application/json'})
+        Args:
+            token: Album search token
+            search_info: Album search metadata dict
+            stamp: download_started_at of the track this timer was armed for
+            vp_index: _LazyTransferIndex for this monitor tick
+            downloads: Nicotine+ downloads object (resolved once per tick)
+        """
+        current_index = search_info.get('current_track_index', 0)
+        tracks_to_download = search_info.get('tracks_to_download', [])
+        if current_index != 0 or not tracks_to_download:
+            return
 
-            with urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
+        current_track = tracks_to_download[current_index]
+        virtual_path = current_track['file_path']
+
+        # Check if download started transferring
+        download_started_transferring = False
+
+        transfer = self._lookup_transfer(current_track['user'], virtual_path, vp_index)
+        if transfer is not None:
+            byte_offset = getattr(transfer, 'current_byte_offset', None)
+            if byte_offset is not None and byte_offset > 0:
+                download_started_transferring = True
+
+        # If first track isn't transferring after 15s, try next best folder
+        if not download_started_transferring:
+            self.log(f"[ALBUM] First track not transferring after 15s")
+
+            # Remove all queued tracks from the current folder attempt
+            # This prevents orphaned downloads in the queue when switching folders
+            # Find all tracks from this album in the download queue
+            track_paths = {track['file_path'] for track in tracks_to_download}
+            transfers_to_remove = [vp_index[path] for path in track_paths if path in vp_index]
+
+            # Remove all found transfers using the hierarchical abort approach
+            if transfers_to_remove:
+                self.log(f"[ALBUM] Removing {len(transfers_to_remove)} queued track(s) from previous folder")
+
+                method = self._bulk_abort(transfers_to_remove, 'ALBUM', downloads)
+                if method:
+                    self.log(f"[ALBUM] Removed {len(transfers_to_remove)} transfer(s) via {method}")
+
+            # Remove all tracks from tracking (keyed by user + virtual path, see _download_next_album_track)
+            with self._downloads_lock:
+                for track in tracks_to_download:
+                    self.active_downloads.pop(track['user'] + track['file_path'], None)
+
+            # Try next best folder
+            folder_candidates = search_info.get('folder_candidates', [])
+
+            # Find the next candidate (skip the one we just tried)
+            current_folder = search_info.get('best_folder')
+            tried_folders = search_info.setdefault('tried_folders', set())
+            if current_folder:
+                tried_folders.add(current_folder['folder_path'])
+
+            # Find next untried folder
+            next_folder = None
+            for candidate in folder_candidates:
+                if candidate['folder_path'] not in tried_folders:
+                    next_folder = candidate
+                    break
 
-                if result.get('success'):
-                    if result.get('renamed'):
-                        # Format FINISHED message for album tracks
-                        artist = track_info.get('artist', '')
-                        track_name = track_info.get('track', '')
-                        track_display = f"{artist} - {track_name}"
-                        head_num = search_info.get('head_number', 1)
-                        self.log(f"▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓  HEAD{head_num} FINISHED  ____ {track_display}        ^~~~~~~<:===<")
-
-                        # Update the file path in downloaded_tracks
-                        if 'downloaded_tracks' in search_info:
-                            for i, path in enumerate(search_info['downloaded_tracks']):
-                                if path == file_path:
-                                    search_info['downloaded_tracks'][i] = result['new_path']
-                                    self.debug_log(f"[ALBUM-META]   Updated tracking path")
-                                    break
+            if next_folder:
+                self.log(f"[ALBUM] 🔄 Trying next folder (score: {int(next_folder['score'])})")
+                self.log(f"[ALBUM] From user: {next_folder['user']}")
+
+                # Reset for new folder
+                search_info['best_folder'] = next_folder
+                search_info['current_track_index'] = 0
+                search_info['download_started_at'] = None
+                search_info['downloaded_tracks'] = []
+                search_info['downloaded_track_index'] = {}
+
+                # Re-match tracks for new folder
+                tracks_to_download = self._match_album_tracks(search_info, next_folder)
+                if tracks_to_download:
+                    search_info['tracks_to_download'] = tracks_to_download
+                    self.log(f"[ALBUM] Matched {len(tracks_to_download)}/{len(search_info['tracks'])} tracks in new folder")
+                    self._download_next_album_track(token, search_info)
                 else:
-                    self.log(f"[ALBUM-META] Failed: {result.get('error', 'Unknown error')}")
-
-        except URLError as e:
-            self.log(f"[ALBUM-META] Cannot reach Node server: {e}")
-            self.log(f"[ALBUM-META] Make sure bridge server is running")
-        except Exception as e:
-            self.log(f"[ALBUM-META] Error: {e}")
-            import traceback
-            self.log(f"[ALBUM-META] {traceback.format_exc()}")
-
-    def _monitor_album_download(self, token, search_info, current_time):
-        """Monitor an album download to detect stuck/failed track downloads."""
-        try:
-            # Check if download has started
-            if not search_info.get('download_started_at'):
-                return
-
-            # Check if we're currently downloading a track
-            current_index = search_info.get('current_track_index', 0)
-            tracks_to_download = search_info.get('tracks_to_download', [])
-
-            # If we've finished all tracks, skip monitoring
-            if current_index >= len(tracks_to_download):
-                return
-
-            # Check how long the current track download has been active
-            download_elapsed = current_time - search_info['download_started_at']
-
-            # EARLY VALIDATION: Check first track within 15 seconds
-            # If the first track doesn't start transferring within 15s, try a different folder
-            if current_index == 0 and download_elapsed > 15:
-                current_track = tracks_to_download[current_index]
-                virtual_path = current_track['file_path']
-
-                # Check if download started transferring
-                download_found = False
-                download_started_transferring = False
-
-                if hasattr(self.core, 'downloads') and hasattr(self.core.downloads, 'transfers'):
-                    for transfer in self.core.downloads.transfers.values():
-                        if hasattr(transfer, 'virtual_path') and transfer.virtual_path == virtual_path:
-                            download_found = True
-                            if hasattr(transfer, 'current_byte_offset') and transfer.current_byte_offset is not None and transfer.current_byte_offset > 0:
-                                download_started_transferring = True
-                            break
-
-                # If first track isn't transferring after 15s, try next best folder
-                if not download_started_transferring:
-                    self.log(f"[ALBUM] First track not transferring after 15s")
-
-                    # Remove all queued tracks from the current folder attempt
-                    # This prevents orphaned downloads in the queue when switching folders
-                    if hasattr(self.core, 'downloads') and hasattr(self.core.downloads, 'transfers'):
-                        transfers_to_remove = []
-
-                        # Find all tracks from this album in the download queue
-                        for track in tracks_to_download:
-                            track_path = track['file_path']
-
-                            # Find matching transfer
-                            for transfer in self.core.downloads.transfers.values():
-                                if hasattr(transfer, 'virtual_path') and transfer.virtual_path == track_path:
-                                    transfers_to_remove.append(transfer)
-                                    break
+                    self.log(f"[ALBUM] Could not match tracks in new folder, giving up")
+                    del self.active_searches[token]
+            else:
+                self.log(f"[ALBUM] No more folders to try, giving up")
+                del self.active_searches[token]
 
-                        # Remove all found transfers using the hierarchical abort approach
-                        if transfers_to_remove:
-                            self.log(f"[ALBUM] Removing {len(transfers_to_remove)} queued track(s) from previous folder")
+            return
 
-                            # Try clear_downloads FIRST (removes from UI)
-                            cleared = False
-                            if hasattr(self.core.downloads, 'clear_downloads'):
-                                try:
-                                    self.core.downloads.clear_downloads(transfers_to_remove)
-                                    self.log(f"[ALBUM] Cleared {len(transfers_to_remove)} transfer(s) from queue")
-                                    cleared = True
-                                except Exception as e:
-                                    self.log(f"[ALBUM] clear_downloads failed: {e}")
-
-                            # Fallback to abort_downloads if clear didn't work
-                            if not cleared:
-                                if hasattr(self.core.downloads, 'abort_downloads'):
-                                    try:
-                                        self.core.downloads.abort_downloads(transfers_to_remove)
-                                        self.log(f"[ALBUM] Aborted {len(transfers_to_remove)} transfer(s)")
-                                    except Exception as e:
-                                        self.log(f"[ALBUM] abort_downloads failed: {e}")
-                                        # Try abort_transfer individually as last resort
-                                        if hasattr(self.core.downloads, 'abort_transfer'):
-                                            for transfer in transfers_to_remove:
-                                                try:
-                                                    self.core.downloads.abort_transfer(transfer)
-                                                except:
-                                                    pass
-                                elif hasattr(self.core.downloads, 'abort_transfer'):
-                                    # Abort each transfer individually
-                                    for transfer in transfers_to_remove:
-                                        try:
-                                            self.core.downloads.abort_transfer(transfer)
-                                        except:
-                                            pass
-
-                        # Remove all tracks from tracking
-                        for track in tracks_to_download:
-                            track_path = track['file_path']
-                            if track_path in self.active_downloads:
-                                del self.active_downloads[track_path]
-
-                    # Try next best folder
-                    folder_candidates = search_info.get('folder_candidates', [])
-
-                    # Find the next candidate (skip the one we just tried)
-                    current_folder = search_info.get('best_folder')
-                    tried_folders = search_info.get('tried_folders', [])
-                    if current_folder:
-                        tried_folders.append(current_folder['folder_path'])
-                        search_info['tried_folders'] = tried_folders
-
-                    # Find next untried folder
-                    next_folder = None
-                    for candidate in folder_candidates:
-                        if candidate['folder_path'] not in tried_folders:
-                            next_folder = candidate
-                            break
+    def _check_album_track_stuck(self, token, search_info, stamp, vp_index, downloads):
+        """
+        90s after a track was queued, skip it if it vanished or never started transferring.
 
-                    if next_folder:
-                        self.log(f"[ALBUM] 🔄 Trying next folder (score: {int(next_folder['score'])})")
-                        self.log(f"[ALBUM] From user: {next_folder['user']}")
-
-                        # Reset for new folder
-                        search_info['best_folder'] = next_folder
-                        search_info['current_track_index'] = 0
-                        search_info['download_started_at'] = None
-                        search_info['downloaded_tracks'] = []
-
-                        # Re-match tracks for new folder
-                        tracks_to_download = self._match_album_tracks(search_info, next_folder)
-                        if tracks_to_download:
-                            search_info['tracks_to_download'] = tracks_to_download
-                            self.log(f"[ALBUM] Matched {len(tracks_to_download)}/{len(search_info['tracks'])} tracks in new folder")
-                            self._download_next_album_track(token, search_info)
-                        else:
-                            self.log(f"[ALBUM] Could not match tracks in new folder, giving up")
-                            del self.active_searches[token]
-                    else:
-                        self.log(f"[ALBUM] No more folders to try, giving up")
-                        del self.active_searches[token]
+        Args:
+            token: Album search token
+            search_info: Album search metadata dict
+            stamp: download_started_at of the track this timer was armed for
+            vp_index: _LazyTransferIndex for this monitor tick
+            downloads: Nicotine+ downloads object (resolved once per tick)
+        """
+        current_index = search_info.get('current_track_index', 0)
+        tracks_to_download = search_info.get('tracks_to_download', [])
+        if current_index >= len(tracks_to_download):
+            return
 
-                    return
+        current_track = tracks_to_download[current_index]
+        virtual_path = current_track['file_path']
 
-            # After 90 seconds, check if the download is stuck
-            if download_elapsed > 90:
-                current_track = tracks_to_download[current_index]
-                virtual_path = current_track['file_path']
+        # Check if download is still in the active_downloads tracking (keyed by user + virtual path)
+        transfer_key = current_track['user'] + virtual_path
+        if transfer_key not in self.active_downloads:
+            # Download isn't being tracked - might have failed silently
+            self.log(f"[ALBUM] Track {current_index + 1} not in tracking (after 90s)")
+            self.log(f"[ALBUM] Skipping to next track...")
 
-                # Check if download is still in the active_downloads tracking
-                if virtual_path not in self.active_downloads:
-                    # Download isn't being tracked - might have failed silently
-                    self.log(f"[ALBUM] Track {current_index + 1} not in tracking (after 90s)")
-                    self.log(f"[ALBUM] Skipping to next track...")
+            # Move to next track
+            search_info['current_track_index'] += 1
+            search_info['download_started_at'] = None
+            self._download_next_album_track(token, search_info)
+            return
 
-                    # Move to next track
-                    search_info['current_track_index'] += 1
-                    search_info['download_started_at'] = None
-                    self._download_next_album_track(token, search_info)
-                    return
+        # Check download status in core.downloads
+        download_found = False
+        download_started_transferring = False
+        transfer_obj = None
+
+        transfer = self._lookup_transfer(current_track['user'], virtual_path, vp_index)
+        if transfer is not None:
+            download_found = True
+            transfer_obj = transfer
+            byte_offset = getattr(transfer, 'current_byte_offset', None)
+            if byte_offset is not None and byte_offset > 0:
+                download_started_transferring = True
+
+        # If download is stuck or not found, skip to next track
+        should_skip = False
+        skip_reason = ""
+
+        if not download_found:
+            should_skip = True
+            skip_reason = "Download disappeared from queue"
+        elif not download_started_transferring:
+            should_skip = True
+            skip_reason = "Download stuck in queue (not transferring)"
+
+        if should_skip:
+            self.log(f"[ALBUM] Track {current_index + 1}: {skip_reason} (after 90s)")
+            self.log(f"[ALBUM] Skipping to next track...")
+
+            # Remove stuck download from queue using hierarchical abort approach
+            if transfer_obj:
+                method = self._bulk_abort([transfer_obj], 'ALBUM', downloads)
+                if method:
+                    self.log(f"[ALBUM] Removed stuck track via {method}")
+
+            # Remove from tracking
+            with self._downloads_lock:
+                self.active_downloads.pop(transfer_key, None)
+
+            # Move to next track
+            search_info['current_track_index'] += 1
+            search_info['download_started_at'] = None
+            self._download_next_album_track(token, search_info)
+        else:
+            # Still healthy - look again shortly (catches downloads that vanish later)
+            self._schedule_timer(_MONITOR_RECHECK_INTERVAL, token, 'album-stuck', stamp)
 
-                # Check download status in core.downloads
-                download_found = False
-                download_started_transferring = False
-                transfer_obj = None
-
-                if hasattr(self.core, 'downloads') and hasattr(self.core.downloads, 'transfers'):
-                    for transfer in self.core.downloads.transfers.values():
-                        if hasattr(transfer, 'virtual_path') and transfer.virtual_path == virtual_path:
-                            download_found = True
-                            transfer_obj = transfer
-                            if hasattr(transfer, 'current_byte_offset') and transfer.current_byte_offset is not None and transfer.current_byte_offset > 0:
-                                download_started_transferring = True
-                            break
+    def _check_album_timeout(self, token, search_info):
+        """Overall timeout - 30 minutes for entire album."""
+        self.log(f"[ALBUM] Album download timeout (30 minutes)")
 
-                # If download is stuck or not found, skip to next track
-                should_skip = False
-                skip_reason = ""
-
-                if not download_found:
-                    should_skip = True
-                    skip_reason = "Download disappeared from queue"
-                elif not download_started_transferring:
-                    should_skip = True
-                    skip_reason = "Download stuck in queue (not transferring)"
-
-                if should_skip:
-                    self.log(f"[ALBUM] Track {current_index + 1}: {skip_reason} (after 90s)")
-                    self.log(f"[ALBUM] Skipping to next track...")
-
-                    # Remove stuck download from queue using hierarchical abort approach
-                    if transfer_obj:
-                        # Try clear_downloads FIRST (removes from UI)
-                        cleared = False
-                        if hasattr(self.core.downloads, 'clear_downloads'):
-                            try:
-                                self.core.downloads.clear_downloads([transfer_obj])
-                                self.log(f"[ALBUM] Cleared stuck track from queue")
-                                cleared = True
-                            except Exception as e:
-                                self.log(f"[ALBUM] clear_downloads failed: {e}")
-
-                        # Fallback to abort_downloads if clear didn't work
-                        if not cleared:
-                            if hasattr(self.core.downloads, 'abort_downloads'):
-                                try:
-                                    self.core.downloads.abort_downloads([transfer_obj])
-                                    self.log(f"[ALBUM] Aborted stuck track")
-                                except Exception as e:
-                                    self.log(f"[ALBUM] abort_downloads failed: {e}")
-                                    # Try abort_transfer as last resort
-                                    if hasattr(self.core.downloads, 'abort_transfer'):
-                                        try:
-                                            self.core.downloads.abort_transfer(transfer_obj)
-                                        except:
-                                            pass
-                            elif hasattr(self.core.downloads, 'abort_transfer'):
-                                try:
-                                    self.core.downloads.abort_transfer(transfer_obj)
-                                except:
-                                    pass
+        # Finalize with whatever we have
+        if search_info.get('downloaded_tracks'):
+            self.log(f"[ALBUM] Finalizing with {len(search_info['downloaded_tracks'])} downloaded tracks...")
+            self._finalize_album_download(token, search_info)
+        else:
+            self.log(f"[ALBUM] No tracks downloaded, aborting")
+            del self.active_searches[token]
 
-                    # Remove from tracking
-                    if virtual_path in self.active_downloads:
-                        del self.active_downloads[virtual_path]
+    def _on_transfer_update(self, transfer, *args):
+        """
+        Nicotine+ "update-download" event: remember downloads that are currently receiving data.
+        Lets the download monitors confirm a healthy transfer without scanning the transfer list.
+        """
+        virtual_path = getattr(transfer, 'virtual_path', None)
+        if virtual_path is None:
+            return
+        state_key = (getattr(transfer, 'username', None), virtual_path)
+        if getattr(transfer, 'status', None) == _STATUS_TRANSFERRING:
+            self._transfer_state[state_key] = transfer
+        else:
+            self._transfer_state.pop(state_key, None)
 
-                    # Move to next track
-                    search_info['current_track_index'] += 1
-                    search_info['download_started_at'] = None
-                    self._download_next_album_track(token, search_info)
+    def _lookup_transfer(self, user, virtual_path, vp_index):
+        """
+        Find the Nicotine+ transfer for a user's virtual path.
 
-            # Overall timeout - 30 minutes for entire album
-            album_elapsed = current_time - search_info['timestamp']
-            if album_elapsed > 1800:
-                self.log(f"[ALBUM] Album download timeout (30 minutes)")
+        Args:
+            user: Soulseek username the file is downloaded from
+            virtual_path: Soulseek virtual path of the download
+            vp_index: _LazyTransferIndex for this monitor tick
 
-                # Finalize with whatever we have
-                if search_info.get('downloaded_tracks'):
-                    self.log(f"[ALBUM] Finalizing with {len(search_info['downloaded_tracks'])} downloaded tracks...")
-                    self._finalize_album_download(token, search_info)
-                else:
-                    self.log(f"[ALBUM] No tracks downloaded, aborting")
-                    del self.active_searches[token]
+        Returns:
+            Transfer object, or None if it's not in the download list
+        """
+        state_key = (user, virtual_path)
+        transfer = self._transfer_state.get(state_key)
+        if transfer is not None:
+            if (getattr(transfer, 'status', None) == _STATUS_TRANSFERRING
+                    and vp_index.holds(user, virtual_path, transfer)):
+                return transfer
+            # Removed, aborted or replaced since its last "update-download" event
+            self._transfer_state.pop(state_key, None)
+        return vp_index.find(user, virtual_path)
+
+    def _schedule_timer(self, delay, token, kind, stamp=None):
+        """
+        Arm a download monitor timer for a search (see _monitor_downloads).
 
-        except Exception as e:
-            self.debug_log(f"[ALBUM] Error monitoring album download: {e}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+        Args:
+            delay: Seconds from now
+            token: Search token
+            kind: 'track-check', 'search-timeout', 'album-first-track', 'album-stuck' or 'album-timeout'
+            stamp: download_started_at the timer belongs to (None = whole search)
+        """
+        with self._timers_lock:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), token, kind, stamp))
 
     def _monitor_downloads(self):
-        """Monitor active downloads and trigger fallback if stuck or failed."""
+        """
+        Monitor active downloads and trigger fallback if stuck or failed.
+        Only searches whose timers expired are looked at; timers armed for an earlier download
+        (download_started_at changed since) or a finished search are dropped.
+        """
+        # No searches left means every timer is stale - drop them without reading the clock
         if not self.active_searches:
+            if self._timers:
+                with self._timers_lock:
+                    self._timers.clear()
             return
 
-        current_time = time.time()
+        if not self._timers or self._timers[0][0] > time.monotonic():
+            return
 
-        for token, search_info in list(self.active_searches.items()):
-            try:
-                # Handle album download monitoring separately
-                if search_info.get('type') == 'album':
-                    self._monitor_album_download(token, search_info, current_time)
-                    continue
+        # Resolve Nicotine+'s transfer list once per tick (nothing to monitor until it exists)
+        downloads = getattr(self.core, 'downloads', None)
+        transfers_map = getattr(downloads, 'transfers', None)
+        if transfers_map is None:
+            return
 
-                # Skip if download not started yet
-                if search_info.get('current_attempt', -1) < 0:
-                    continue
+        now = time.monotonic()
+        due = []
+        with self._timers_lock:
+            while self._timers and self._timers[0][0] <= now:
+                due.append(heapq.heappop(self._timers))
 
-                # Check how long download has been active
-                download_elapsed = current_time - search_info['download_started_at']
-
-                # Check download status after 60 seconds
-                if download_elapsed > 60:
-                    last_path = search_info['last_download_path']
-
-                    # Check if download is still in downloads list and its status
-                    download_found = False
-                    download_started_transferring = False
-                    download_status = None
-                    transfer_obj = None
-
-                    # Look for this download in core.downloads
-                    if hasattr(self.core, 'downloads') and hasattr(self.core.downloads, 'transfers'):
-                        for transfer in self.core.downloads.transfers.values():
-                            if hasattr(transfer, 'virtual_path') and transfer.virtual_path == last_path:
-                                download_found = True
-                                transfer_obj = transfer
-                                if hasattr(transfer, 'status'):
-                                    download_status = transfer.status
-                                # Check if any bytes have been transferred
-                                if hasattr(transfer, 'current_byte_offset') and transfer.current_byte_offset is not None and transfer.current_byte_offset > 0:
-                                    download_started_transferring = True
-                                break
+        # Transfers confirmed by "update-download" events skip the index; it's only built when needed
+        vp_index = _LazyTransferIndex(transfers_map)
 
-                    # If download is stuck in queue (not started) or failed, try next candidate
-                    should_fallback = False
-                    fallback_reason = ""
-
-                    if not download_found:
-                        should_fallback = True
-                        fallback_reason = "Download disappeared from queue"
-                    elif not download_started_transferring:
-                        should_fallback = True
-                        fallback_reason = "Download stuck in queue (not transferring)"
-                        # Try to abort the stuck download
-                        if transfer_obj and hasattr(self.core.downloads, 'abort_transfer'):
-                            try:
-                                self.core.downloads.abort_transfer(transfer_obj)
-                            except:
-                                pass
-                    elif download_status and str(download_status) in ['USER_LOGGED_OFF', 'CONNECTION_CLOSED', 'CONNECTION_TIMEOUT', 'FILTERED', 'CANCELLED']:
-                        should_fallback = True
-                        fallback_reason = f"Download failed: {download_status}"
-
-                    if should_fallback:
-                        self.log(f"[DL] {fallback_reason} (after 60s)")
-                        self._try_next_download_candidate(token, search_info, fallback_reason)
-
-                # Cleanup if download has been active for too long (5 minutes total)
-                search_elapsed = current_time - search_info['timestamp']
-                if search_elapsed > 300:
-                    self.log(f"[DL] Timeout - removing search after 5 minutes")
-                    # Clean up tracking
-                    if search_info['last_download_path'] in self.active_downloads:
-                        del self.active_downloads[search_info['last_download_path']]
-                    del self.active_searches[token]
+        for _, _, token, kind, stamp in due:
+            search_info = self.active_searches.get(token)
+            if search_info is None:
+                continue
+            if stamp is not None and search_info.get('download_started_at') != stamp:
+                continue
+
+            try:
+                if kind == 'track-check':
+                    self._check_track_download(token, search_info, stamp, vp_index, downloads)
+                elif kind == 'search-timeout':
+                    self._check_search_timeout(token, search_info)
+                elif kind == 'album-first-track':
+                    self._check_album_first_track(token, search_info, stamp, vp_index, downloads)
+                elif kind == 'album-stuck':
+                    self._check_album_track_stuck(token, search_info, stamp, vp_index, downloads)
+                elif kind == 'album-timeout':
+                    self._check_album_timeout(token, search_info)
 
             except Exception as e:
                 self.debug_log(f"[DL] Error monitoring downloads for search {token}: {e}")
-                import traceback
-                self.debug_log(f"[DL] Traceback: {traceback.format_exc()}")
+                self._debug_traceback("[DL] Traceback:")
+
+    def _check_track_download(self, token, search_info, stamp, vp_index, downloads):
+        """
+        60s after a download was queued, fall back to the next candidate if it is stuck or failed.
+
+        Args:
+            token: Search token
+            search_info: Search metadata dict
+            stamp: download_started_at of the download this timer was armed for
+            vp_index: _LazyTransferIndex for this monitor tick
+            downloads: Nicotine+ downloads object (resolved once per tick)
+        """
+        last_path = search_info['last_download_path']
+
+        # Check if download is still in downloads list and its status
+        download_found = False
+        download_started_transferring = False
+        download_status = None
+        transfer_obj = None
+
+        # Look for this download in core.downloads
+        transfer = self._lookup_transfer(search_info.get('last_download_user'), last_path, vp_index)
+        if transfer is not None:
+            download_found = True
+            transfer_obj = transfer
+            download_status = getattr(transfer, 'status', None)
+            # Check if any bytes have been transferred
+            byte_offset = getattr(transfer, 'current_byte_offset', None)
+            if byte_offset is not None and byte_offset > 0:
+                download_started_transferring = True
+
+        # If download is stuck in queue (not started) or failed, try next candidate
+        should_fallback = False
+        fallback_reason = ""
+
+        if not download_found:
+            should_fallback = True
+            fallback_reason = "Download disappeared from queue"
+        elif not download_started_transferring:
+            should_fallback = True
+            fallback_reason = "Download stuck in queue (not transferring)"
+            # Try to abort the stuck download
+            if transfer_obj and hasattr(downloads, 'abort_transfer'):
+                try:
+                    downloads.abort_transfer(transfer_obj)
+                except:
+                    pass
+        elif download_status and str(download_status) in ['USER_LOGGED_OFF', 'CONNECTION_CLOSED', 'CONNECTION_TIMEOUT', 'FILTERED', 'CANCELLED']:
+            should_fallback = True
+            fallback_reason = f"Download failed: {download_status}"
+
+        if should_fallback:
+            self.log(f"[DL] {fallback_reason} (after 60s)")
+            self._try_next_download_candidate(token, search_info, fallback_reason)
+        else:
+            # Still healthy - look again shortly (catches failures later in the download)
+            self._schedule_timer(_MONITOR_RECHECK_INTERVAL, token, 'track-check', stamp)
+
+    def _check_search_timeout(self, token, search_info):
+        """Cleanup if download has been active for too long (5 minutes total)."""
+        if search_info.get('current_attempt', -1) < 0:
+            # No download started yet - only downloads time out
+            self._schedule_timer(_MONITOR_RECHECK_INTERVAL, token, 'search-timeout')
+            return
+
+        self.log(f"[DL] Timeout - removing search after 5 minutes")
+        # Clean up tracking
+        if search_info['last_download_path']:
+            with self._downloads_lock:
+                self.active_downloads.pop(search_info['last_download_user'] + search_info['last_download_path'], None)
+        del self.active_searches[token]
 
     def _trigger_album_search(self, search_data):
         """
@@ -3612,50 +4163,59 @@ class Plugin(BasePlugin):
             self.debug_log(f"[ALBUM] {len(tracks)} tracks, auto_download={auto_download}, format={format_preference.upper()}")
 
             # Trigger search for album folder
-            # Get tokens BEFORE the search to compare (do_search sometimes returns None)
-            tokens_before = set(self.core.search.searches.keys()) if hasattr(self.core.search, 'searches') else set()
-
-            search_token = self.core.search.do_search(query, "global")
-
-            # If do_search returns None, find the newly created token by comparing before/after
-            if not search_token and hasattr(self.core.search, 'searches'):
-                tokens_after = set(self.core.search.searches.keys())
-                new_tokens = tokens_after - tokens_before
-
-                if new_tokens:
-                    # Use the newly created token
-                    search_token = list(new_tokens)[0]
-                elif tokens_after:
-                    # Fallback: use most recent token
-                    search_token = max(tokens_after)
+            # (serialized with the registration below so concurrent searches can't pick up each
+            # other's token or interleave their active_searches/timer updates)
+            with self._search_lock:
+                # Get tokens BEFORE the search to compare (do_search sometimes returns None)
+                tokens_before = set(self.core.search.searches.keys()) if hasattr(self.core.search, 'searches') else set()
+
+                search_token = self.core.search.do_search(query, "global")
+
+                # If do_search returns None, find the newly created token by comparing before/after
+                if not search_token and hasattr(self.core.search, 'searches'):
+                    tokens_after = set(self.core.search.searches.keys())
+                    new_tokens = tokens_after - tokens_before
+
+                    if new_tokens:
+                        # Use the newly created token
+                        search_token = list(new_tokens)[0]
+                    elif tokens_after:
+                        # Fallback: use most recent token
+                        search_token = max(tokens_after)
+
+                # Track album search
+                if auto_download and search_token:
+                    self.active_searches[search_token] = {
+                        'type': 'album',
+                        'query': query,
+                        'album_id': album_id,
+                        'album_name': album_name,
+                        'album_artist': album_artist,
+                        'year': year,
+                        'image_url': image_url,
+                        'tracks': tracks,  # List of track dicts with track_number, artist, track, album, track_id, duration
+                        'auto_download': auto_download,
+                        'metadata_override': metadata_override,
+                        'format_preference': format_preference,
+                        'timestamp': time.time(),
+                        'folder_candidates': [],  # List of {user, folder_path, tracks_found, score}
+                        'best_folder': None,  # {user, folder_path, tracks}
+                        'tracks_to_download': [],  # List of {track_info, file_path, user}
+                        'downloaded_tracks': [],  # List of file paths after download
+                        'downloaded_track_index': {},  # {file path: index in downloaded_tracks}
+                        'tried_folders': set(),  # Folder paths already attempted (skipped when switching folders)
+                        'current_track_index': 0,
+                        'download_started_at': None,
+                        'result_count': 0
+                    }
+                    self._schedule_timer(1800, search_token, 'album-timeout')
 
             if not search_token:
                 self.log(f"[ALBUM] Failed to get search token")
                 return False
 
-            # Track album search
-            if auto_download and search_token:
-                self.active_searches[search_token] = {
-                    'type': 'album',
-                    'query': query,
-                    'album_id': album_id,
-                    'album_name': album_name,
-                    'album_artist': album_artist,
-                    'year': year,
-                    'image_url': image_url,
-                    'tracks': tracks,  # List of track dicts with track_number, artist, track, album, track_id, duration
-                    'auto_download': auto_download,
-                    'metadata_override': metadata_override,
-                    'format_preference': format_preference,
-                    'timestamp': time.time(),
-                    'folder_candidates': [],  # List of {user, folder_path, tracks_found, score}
-                    'best_folder': None,  # {user, folder_path, tracks}
-                    'tracks_to_download': [],  # List of {track_info, file_path, user}
-                    'downloaded_tracks': [],  # List of file paths after download
-                    'current_track_index': 0,
-                    'download_started_at': None,
-                    'result_count': 0
-                }
+            if auto_download:
+                self._work_event.set()
                 self.log(f"[ALBUM] Tracking album search (token={search_token})")
             else:
                 self.log(f"[ALBUM] Not tracking (auto_download disabled)")
@@ -3664,8 +4224,7 @@ class Plugin(BasePlugin):
 
         except Exception as e:
             self.log(f"[ALBUM] ERROR: {type(e).__name__}: {str(e)}")
-            import traceback
-            self.debug_log(f"[ALBUM] Traceback: {traceback.format_exc()}")
+            self._debug_traceback("[ALBUM] Traceback:")
             return False
 
     def _poll_queue(self):
@@ -3708,146 +4267,204 @@ class Plugin(BasePlugin):
                 self.waiting_for_connection = False
                 break
 
+        # Loop-invariant objects and bound methods as locals (the loop body runs every few seconds forever)
+        active_searches = self.active_searches
+        active_downloads = self.active_downloads
+        processed = self.processed_timestamps
+        recent_searches = self._recent_searches
+        timers = self._timers
+        timers_lock = self._timers_lock
+        work_event = self._work_event
+        wait_for_searches = self._wait_for_searches
+        get_pending_searches = self._get_pending_searches
+        is_duplicate_search = self._is_duplicate_search
+        remember_processed = self._remember_processed
+        acquire_search_slot = self._search_rate.acquire
+        submit_search = self._search_pool.submit
+        handle_one_search = self._handle_one_search
+        maintenance_pass = self._maintenance_pass
+        monitor_downloads = self._monitor_downloads
+        settle_search = self._settle_search_future
+        log = self.log
+        log_error = self._log_error
+        straggling = {}  # {future: (timestamp, dedupe_key)} still starting after _SEARCH_DISPATCH_TIMEOUT
+
+        def wake_poll(_future):
+            work_event.set()
+
         while self.running:
+            # Cleared before the work, so a set() that lands while it runs still cuts the next wait short
+            work_event.clear()
+            long_polled = False
+            searches = None
+            now = time.time()
             try:
-                # Check if server is running and auto-restart if it went offline
-                server_running = self._is_server_running()
-                if self.server_was_running and not server_running:
-                    # Server went offline - attempt auto-restart (normal during metadata processing)
-                    self.log("Bridge server restarting...")
-                    self.server_was_running = False
-
-                    # Attempt to restart the server
-                    if self.settings.get('auto_start_server', True):
-                        # First, clean up any zombie processes
-                        self._cleanup_server_process()
-
-                        # Wait a moment for port to be released
-                        time.sleep(1)
-
-                        # Now start fresh server
-                        if self._start_server():
-                            self.log("Bridge server restarted successfully")
-                        else:
-                            self.log("Failed to restart bridge server - please restart Nicotine+ manually")
-                    else:
-                        self.log("Auto-start disabled - please restart Nicotine+ manually")
-                elif server_running:
-                    self.server_was_running = True
-
                 # Periodically check connection status (but don't block)
                 # Only check every 30 seconds to avoid overhead
-                if hasattr(self, '_last_connection_check'):
-                    if time.time() - self._last_connection_check > 30:
-                        self.nicotine_online = self._is_nicotine_online()
-                        self._last_connection_check = time.time()
+                if now - self._last_connection_check > 30:
+                    self.nicotine_online = self._is_nicotine_online()
+                    self._last_connection_check = now
+
+                # Fetch pending searches from server - while idle the bridge holds the
+                # request until a search is queued, so the request itself is the wait
+                if self._long_poll_ok and self.poll_mode != 'active':
+                    searches = wait_for_searches(_LONG_POLL_TIMEOUT)
+                    if not self.running:
+                        break  # Unloaded while the bridge held the request
+                    long_polled = searches is not None
+                if searches is None:
+                    searches = get_pending_searches()
+
+                if searches is not None:
+                    # A successful fetch doubles as the server health check
+                    self.server_was_running = True
                 else:
-                    self._last_connection_check = time.time()
-                # Fetch pending searches from server
-                searches = self._get_pending_searches()
-
-                # IMPROVED: Update activity tracking if we have searches
-                if searches:
-                    self.last_activity_time = time.time()
-
-                # Process each search
-                for search in searches:
-                    timestamp = search.get('timestamp')
+                    # Fetch failed - probe the server and auto-restart if it went offline
+                    searches = []
+                    server_running = self._is_server_running()
+                    if self.server_was_running and not server_running:
+                        # Server went offline - attempt auto-restart (normal during metadata processing)
+                        self.server_was_running = False
+
+                        # Restart in the background so downloads keep being monitored meanwhile
+                        if self.settings.get('auto_start_server', True):
+                            with self._restart_lock:
+                                if not self._restart_in_progress:
+                                    self._restart_in_progress = True
+                                    log("Bridge server restarting...")
+                                    Thread(target=self._restart_server_async, daemon=True).start()
+                        else:
+                            log("Bridge server went offline")
+                            log("Auto-start disabled - please restart Nicotine+ manually")
+                    elif server_running:
+                        self.server_was_running = True
+                if long_polled:
+                    now = time.time()  # the long-poll may have held the request for a while
+
+                # Process each search - dispatched to the search pool, acknowledged to the bridge
+                # in one request afterwards
+                to_ack = []
+                dispatched = {}  # {future: (timestamp, dedupe_key)}
+                try:
+                    # Settle searches that were still starting when an earlier batch timed out
+                    in_flight = ()
+                    if straggling:
+                        for future in [future for future in straggling if future.done()]:
+                            settle_search(future, *straggling.pop(future), now, to_ack)
+                        in_flight = {timestamp for timestamp, _ in straggling.values()}
 
-                    if not timestamp:
-                        continue
+                    for search in searches:
+                        timestamp = search.get('timestamp')
 
-                    # Skip if we've already processed this timestamp
-                    if timestamp in self.processed_timestamps:
-                        continue
+                        if not timestamp:
+                            continue
 
-                    # Periodic cleanup of old data
-                    self._cleanup_old_data()
+                        # Re-delivered while its search is still starting - settled once that finishes
+                        if timestamp in in_flight:
+                            continue
 
-                    # Check if this is an album search or track search
-                    search_type = search.get('type', 'track')
+                        # Skip if we've already processed this timestamp
+                        if timestamp in processed:
+                            if timestamp > self._newest_search_ts:
+                                self._newest_search_ts = timestamp
+                            continue
 
-                    if search_type == 'album':
-                        # Handle album search
-                        success = self._trigger_album_search(search)
-                    else:
-                        # Handle regular track search
-                        query = search.get('query')
-                        artist = search.get('artist', '')
-                        track = search.get('track', '')
-                        album = search.get('album', '')
-                        track_id = search.get('track_id', '')
-                        duration = search.get('duration', 0)
-                        image_url = search.get('image_url', '')
-                        auto_download = search.get('auto_download', False)
-                        metadata_override = search.get('metadata_override', True)
-                        format_preference = search.get('format_preference', 'mp3')
-
-                        if not query:
+                        # Same search re-delivered under a new timestamp - acknowledge without searching again
+                        dedupe_key = _search_dedupe_key(search)
+                        if is_duplicate_search(dedupe_key, now):
+                            self.debug_log(f" Skipping duplicate search: {search.get('query')}")
+                            to_ack.append(timestamp)
+                            remember_processed(timestamp, now)
                             continue
 
-                        success = self._trigger_search(query, artist, track, album, track_id, duration, auto_download, metadata_override, 'track', format_preference, image_url)
+                        # Claim the key now so a copy later in this batch is caught too (released on failure)
+                        recent_searches[dedupe_key] = now
 
-                    if success:
-                        # Mark as processed on server
-                        self._mark_processed(timestamp)
+                        # Rate-limit network searches (only waits once a burst has used up the bucket)
+                        acquire_search_slot()
+                        dispatched[submit_search(handle_one_search, search)] = (timestamp, dedupe_key)
 
-                        # Track locally to prevent duplicates (with cleanup timestamp)
-                        self.processed_timestamps[timestamp] = time.time()
+                    try:
+                        for future in as_completed(dispatched, timeout=_SEARCH_DISPATCH_TIMEOUT):
+                            settle_search(future, *dispatched.pop(future), now, to_ack)
+                    except FuturesTimeoutError:
+                        # Stragglers stay unacknowledged with their dedupe keys claimed; later iterations
+                        # settle them once they finish (the callback only wakes this thread)
+                        for future, entry in dispatched.items():
+                            if future.done():
+                                settle_search(future, *entry, now, to_ack)
+                            else:
+                                straggling[future] = entry
+                                future.add_done_callback(wake_poll)
+                        log_error('trigger-timeout', " %d search(es) still starting after %ds",
+                                  len(straggling), _SEARCH_DISPATCH_TIMEOUT)
+                finally:
+                    if to_ack:
+                        self._mark_processed_batch(to_ack)
 
-                        # IMPROVED: Update activity time on successful search
-                        self.last_activity_time = time.time()
+            except Exception as e:
+                log_error('poll', " Error in poll loop: %s", e)
 
-                        # Add a small delay between searches
-                        time.sleep(0.5)
+            # Periodic cleanup of old data (rate-limited to once a minute inside) - runs even while
+            # quiescent, since processed timestamps and dedupe entries still need to age out
+            self._cleanup_old_data()
 
-            except Exception as e:
-                self.log(f" Error in poll loop: {e}")
+            # Sleep mode with nothing in flight: skip the maintenance passes (only due timers need a look)
+            quiescent = (self.poll_mode == 'sleep' and not active_searches
+                         and not active_downloads and not self._album_meta_queue)
+            if not quiescent:
+                # Start ready downloads and launch cascade backups (HEAD2/HEAD3) in one pass over active searches
+                try:
+                    maintenance_pass()
+                except Exception as e:
+                    log_error('maintenance', " Error in maintenance pass: %s", e)
 
-            # Check for auto-download opportunities (event-driven now, just check timeouts)
-            try:
-                self._check_and_download_ready_searches()
-                # IMPROVED: Update activity if we have active searches
-                if self.active_searches:
-                    self.last_activity_time = time.time()
-            except Exception as e:
-                self.log(f" Error in auto-download check: {e}")
+                # Expire stale metadata cache entries (once a minute, even while no new searches arrive)
+                now_mono = time.monotonic()
+                if now_mono - self._last_cache_sweep >= 60:
+                    try:
+                        self._sweep_metadata_cache(now_mono)
+                    except Exception as e:
+                        log_error('cache-sweep', " Error sweeping metadata cache: %s", e)
 
-            # Check if we should launch cascade backups (HEAD2/HEAD3)
-            try:
-                self._check_cascade_launches()
-            except Exception as e:
-                self.log(f" Error in cascade check: {e}")
+                # Send album tracks whose batched metadata request is due
+                try:
+                    self._flush_due_album_meta()
+                except Exception as e:
+                    log_error('album-meta', " Error flushing album metadata: %s", e)
 
-            # Monitor active downloads for failures/timeouts
+            # Monitor active downloads for failures/timeouts (returns at once unless a timer is due)
             try:
-                self._monitor_downloads()
-                # IMPROVED: Update activity if we have active downloads
-                if self.active_downloads:
-                    self.last_activity_time = time.time()
+                monitor_downloads()
             except Exception as e:
-                self.log(f" Error in download monitoring: {e}")
+                log_error('monitor', " Error in download monitoring: %s", e)
 
-            # IMPROVED: Adaptive polling - adjust interval based on activity
-            time_since_activity = time.time() - self.last_activity_time
+            # IMPROVED: Adaptive polling - snap back to the fastest interval on any activity,
+            # otherwise back off geometrically (2 → 4 → 8 → 16 → 30s)
             old_mode = self.poll_mode
 
-            if self.active_searches or self.active_downloads or time_since_activity < 30:
-                # Active mode: activity in last 30 seconds
+            # Activity = searches arrived this iteration, or searches/downloads still in flight
+            had_activity = bool(searches or active_searches or active_downloads or straggling)
+            if had_activity:
+                # Active mode: work in flight or searches arrived this iteration
+                self.last_activity_time = now
                 self.poll_mode = 'active'
-                self.current_poll_interval = 2
-            elif time_since_activity < 300:  # 5 minutes
-                # Idle mode: no activity for 30s-5min
-                self.poll_mode = 'idle'
-                self.current_poll_interval = 10
+                self.current_poll_interval = _POLL_INTERVAL_MIN
             else:
-                # Sleep mode: no activity for 5+ minutes
-                self.poll_mode = 'sleep'
-                self.current_poll_interval = 15  # Max 15 seconds (reduced from 30)
+                self.current_poll_interval = min(self.current_poll_interval * 2, _POLL_INTERVAL_MAX)
+                # Sleep mode once the backoff reaches its cap, idle while still backing off
+                self.poll_mode = 'sleep' if self.current_poll_interval >= _POLL_INTERVAL_MAX else 'idle'
 
             # Log mode changes
             if old_mode != self.poll_mode:
-                self.log(f" Poll mode: {old_mode} → {self.poll_mode} (interval: {self.current_poll_interval}s)")
-
-            # Wait before next poll
-            time.sleep(self.current_poll_interval)
+                log(f" Poll mode: {old_mode} → {self.poll_mode} (interval: {self.current_poll_interval}s)")
+
+            # Wait before next poll - a newly registered search or shutdown ends the wait early,
+            # and it never runs past the next download monitor deadline
+            # (skipped after a long-poll, which already waited for work)
+            if not long_polled:
+                wait = self.current_poll_interval
+                with timers_lock:
+                    if timers:
+                        wait = max(0, min(wait, timers[0][0] - time.monotonic()))
+                work_event.wait(timeout=wait)
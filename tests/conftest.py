@@ -0,0 +1,105 @@
+"""
+Shared fixtures for the Hydra+ plugin unit tests (no Nicotine+ core needed).
+
+The plugin is loaded straight from Hydra+_Plugin/__init__.py. When Nicotine+
+isn't installed, a minimal pynicotine stand-in is registered first.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+PLUGIN_INIT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Hydra+_Plugin', '__init__.py')
+
+
+def _install_pynicotine_stand_in():
+    """Minimal pynicotine.pluginsystem/events stand-in when Nicotine+ isn't installed."""
+    if importlib.util.find_spec('pynicotine') is not None:
+        return
+
+    class BasePlugin:
+        def __init__(self, *args, **kwargs):
+            self.core = None
+            self.logged = []
+
+        def log(self, message, *args):
+            self.logged.append(message)
+
+    pluginsystem = types.ModuleType('pynicotine.pluginsystem')
+    pluginsystem.BasePlugin = BasePlugin
+    events_module = types.ModuleType('pynicotine.events')
+    events_module.events = SimpleNamespace(connect=lambda *args: None, disconnect=lambda *args: None)
+    package = types.ModuleType('pynicotine')
+    package.pluginsystem = pluginsystem
+    package.events = events_module
+    sys.modules.update({
+        'pynicotine': package,
+        'pynicotine.pluginsystem': pluginsystem,
+        'pynicotine.events': events_module,
+    })
+
+
+def _load_plugin_module():
+    _install_pynicotine_stand_in()
+    spec = importlib.util.spec_from_file_location('hydra_plus_plugin', PLUGIN_INIT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_hydra = _load_plugin_module()
+
+
+class FakeClock:
+    """Replaces time.monotonic/time.sleep so timing is tested without waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def hydra():
+    """The loaded plugin module."""
+    return _hydra
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(_hydra.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(_hydra.time, 'sleep', fake.sleep)
+    return fake
+
+
+@pytest.fixture
+def make_plugin(tmp_path):
+    """Factory for plugin instances sharing one processed-searches.json under tmp_path."""
+    instances = []
+
+    def make():
+        instance = _hydra.Plugin()
+        instance.processed_state_path = str(tmp_path / 'processed-searches.json')
+        instances.append(instance)
+        return instance
+
+    yield make
+    for instance in instances:
+        instance._metadata_pool.shutdown(wait=False)
+        instance._search_pool.shutdown(wait=False)
+
+
+@pytest.fixture
+def plugin(make_plugin):
+    return make_plugin()
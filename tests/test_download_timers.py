@@ -0,0 +1,48 @@
+"""Download monitor timers (_schedule_timer/_monitor_downloads)."""
+
+from types import SimpleNamespace
+
+
+def _record_checks(plugin, calls):
+    def recorder(kind):
+        return lambda token, search_info, *args: calls.append((kind, token, args[0] if args else None))
+
+    plugin._check_track_download = recorder('track-check')
+    plugin._check_search_timeout = recorder('search-timeout')
+    plugin._check_album_first_track = recorder('album-first-track')
+    plugin._check_album_track_stuck = recorder('album-stuck')
+    plugin._check_album_timeout = recorder('album-timeout')
+
+
+def test_due_timers_fire_in_deadline_order_and_stale_stamps_are_dropped(plugin, clock):
+    plugin.core = SimpleNamespace(downloads=SimpleNamespace(transfers={}))
+    plugin.active_searches[1] = {'download_started_at': 50.0}
+    plugin.active_searches[2] = {'download_started_at': None}
+    calls = []
+    _record_checks(plugin, calls)
+
+    plugin._schedule_timer(30, 1, 'track-check', 40.0)  # Armed for an earlier download
+    plugin._schedule_timer(20, 1, 'track-check', 50.0)
+    plugin._schedule_timer(10, 2, 'search-timeout')
+    plugin._schedule_timer(5, 3, 'search-timeout')  # Search already finished
+    plugin._schedule_timer(300, 2, 'search-timeout')  # Not due yet
+
+    clock.now += 60
+    plugin._monitor_downloads()
+
+    assert calls == [('search-timeout', 2, None), ('track-check', 1, 50.0)]
+    assert len(plugin._timers) == 1
+
+    # Nothing else fires until the remaining deadline passes
+    plugin._monitor_downloads()
+    assert len(calls) == 2
+    clock.now += 300
+    plugin._monitor_downloads()
+    assert calls[-1] == ('search-timeout', 2, None)
+    assert not plugin._timers
+
+
+def test_timers_are_dropped_once_no_search_is_active(plugin, clock):
+    plugin._schedule_timer(5, 1, 'search-timeout')
+    plugin._monitor_downloads()
+    assert not plugin._timers
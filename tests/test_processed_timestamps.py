@@ -0,0 +1,44 @@
+"""Processed search timestamps persisted across plugin restarts."""
+
+import os
+import time
+
+OLDER = '2026-01-01T10:00:00.000Z'
+NEWER = '2026-01-01T10:05:00.000Z'
+
+
+def test_processed_timestamps_round_trip(plugin, make_plugin):
+    now = time.time()
+    plugin._remember_processed(OLDER, now - 10)
+    plugin._remember_processed(NEWER, now)
+    plugin._save_processed_timestamps()
+    assert not plugin._processed_dirty
+
+    restored = make_plugin()
+    restored._load_processed_timestamps()
+    assert restored.processed_timestamps == {OLDER, NEWER}
+    assert [ts for _, ts in restored._processed_order] == [OLDER, NEWER]
+    assert restored._newest_search_ts == NEWER
+
+
+def test_expired_processed_timestamps_are_not_restored(hydra, plugin, make_plugin):
+    now = time.time()
+    plugin._remember_processed(OLDER, now - hydra._PROCESSED_TTL - 5)
+    plugin._remember_processed(NEWER, now)
+    plugin._save_processed_timestamps()
+
+    restored = make_plugin()
+    restored._load_processed_timestamps()
+    assert restored.processed_timestamps == {NEWER}
+
+
+def test_save_is_skipped_when_nothing_changed(plugin):
+    plugin._save_processed_timestamps()
+    assert not os.path.exists(plugin.processed_state_path)
+
+
+def test_failed_save_is_retried(plugin, tmp_path):
+    plugin._remember_processed(NEWER, time.time())
+    plugin.processed_state_path = str(tmp_path / 'missing-dir' / 'processed-searches.json')
+    plugin._save_processed_timestamps()
+    assert plugin._processed_dirty
@@ -0,0 +1,42 @@
+"""Race/cascade cancellation: losers are aborted by the winner, late finishers are discarded."""
+
+from threading import Event
+
+
+def _cascade(hydra, plugin, users=('alice', 'bob', 'carol')):
+    search_info = {'cascade_mode': True, 'cascade_heads': [], 'cascade_heads_by_key': {},
+                   'cascade_winner': None, 'cancel_event': Event()}
+    for index, user in enumerate(users):
+        key = user + '/music/song.mp3'
+        head = hydra.HeadRecord(index, key, '/music/song.mp3', user, 0.0, 100 - index)
+        search_info['cascade_heads'].append(head)
+        search_info['cascade_heads_by_key'][key] = head
+        plugin.active_downloads[key] = 1
+        plugin.racing_heads[key] = (search_info, head, 'CASCADE')
+    return search_info
+
+
+def test_winner_aborts_losers_immediately(hydra, plugin):
+    search_info = _cascade(hydra, plugin)
+    plugin.active_downloads.pop('alice/music/song.mp3')  # Winner is untracked by its completion
+
+    plugin._cleanup_losers(search_info, 'alice/music/song.mp3', hydra._MODE_CONFIG['cascade'])
+
+    assert not plugin.active_downloads
+    assert not plugin.racing_heads
+    queued = [plugin._abort_queue.get_nowait() for _ in range(plugin._abort_queue.qsize())]
+    assert queued == [('/music/song.mp3', 'bob'), ('/music/song.mp3', 'carol')]
+    assert set(plugin._cancelled_heads) == {'bob/music/song.mp3', 'carol/music/song.mp3'}
+
+
+def test_loser_finishing_before_its_abort_is_deleted(hydra, plugin, tmp_path):
+    search_info = _cascade(hydra, plugin)
+    plugin.active_downloads.pop('alice/music/song.mp3')
+    plugin._cleanup_losers(search_info, 'alice/music/song.mp3', hydra._MODE_CONFIG['cascade'])
+
+    loser_file = tmp_path / 'song.mp3'
+    loser_file.write_bytes(b'audio')
+    plugin.download_finished_notification('bob', '/music/song.mp3', str(loser_file))
+
+    assert not loser_file.exists()
+    assert 'bob/music/song.mp3' not in plugin._cancelled_heads
@@ -0,0 +1,26 @@
+"""Duplicate-search detection: dedupe key and the dispatch window."""
+
+
+def test_dedupe_key_ignores_timestamp_and_case(hydra):
+    first = {'type': 'track', 'query': 'Artist Song', 'artist': 'Artist', 'track': 'Song', 'timestamp': 1}
+    again = {'query': 'artist song', 'artist': 'ARTIST', 'track': 'song', 'timestamp': 2}
+    album = {'type': 'album', 'query': 'Artist Song', 'artist': 'Artist', 'track': 'Song', 'timestamp': 3}
+
+    assert hydra._search_dedupe_key(first) == hydra._search_dedupe_key(again)
+    assert hydra._search_dedupe_key(first) != hydra._search_dedupe_key(album)
+    assert hydra._search_dedupe_key({'query': None}) == ('track', '', '', '')
+
+
+def test_dedupe_window_expires_old_entries(hydra, plugin):
+    window = hydra._SEARCH_DEDUPE_WINDOW
+    old_key = hydra._search_dedupe_key({'query': 'old'})
+    new_key = hydra._search_dedupe_key({'query': 'new'})
+    plugin._recent_searches[old_key] = 100.0
+    plugin._recent_searches[new_key] = 100.0 + window / 2
+
+    assert plugin._is_duplicate_search(old_key, 100.0 + window - 1)
+
+    # Past the window the old entry is evicted from the front, the newer one stays
+    assert not plugin._is_duplicate_search(old_key, 100.0 + window + 1)
+    assert old_key not in plugin._recent_searches
+    assert plugin._is_duplicate_search(new_key, 100.0 + window + 1)
@@ -0,0 +1,39 @@
+"""Settling dispatched searches (_settle_search_future), including late stragglers."""
+
+from concurrent.futures import Future
+
+TIMESTAMP = '2026-01-01T10:00:00.000Z'
+
+
+def _finished(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_started_search_is_acked_and_remembered(hydra, plugin):
+    key = hydra._search_dedupe_key({'query': 'song'})
+    plugin._recent_searches[key] = 100.0
+    to_ack = []
+
+    plugin._settle_search_future(_finished(True), TIMESTAMP, key, 100.0, to_ack)
+
+    assert to_ack == [TIMESTAMP]
+    assert TIMESTAMP in plugin.processed_timestamps
+    assert key in plugin._recent_searches
+
+
+def test_failed_search_releases_its_dedupe_key(hydra, plugin):
+    key = hydra._search_dedupe_key({'query': 'song'})
+    for outcome in (_finished(False), _finished(error=RuntimeError('boom'))):
+        plugin._recent_searches[key] = 100.0
+        to_ack = []
+
+        plugin._settle_search_future(outcome, TIMESTAMP, key, 100.0, to_ack)
+
+        assert to_ack == []
+        assert TIMESTAMP not in plugin.processed_timestamps
+        assert not plugin._is_duplicate_search(key, 101.0)
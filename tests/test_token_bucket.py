@@ -0,0 +1,34 @@
+"""Search rate limiter (_TokenBucket): burst capacity and refill."""
+
+import pytest
+
+
+def test_token_bucket_allows_burst_then_waits(hydra, clock):
+    bucket = hydra._TokenBucket(rate=2.0, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.slept == []
+
+    bucket.acquire()
+    assert clock.slept == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_up_to_capacity(hydra, clock):
+    bucket = hydra._TokenBucket(rate=2.0, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    # One second refills two tokens
+    clock.now += 1.0
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+
+    # A long idle period never banks more than the burst capacity
+    clock.now += 60.0
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.slept == []
+    bucket.acquire()
+    assert clock.slept == [pytest.approx(0.5)]